@@ -0,0 +1,64 @@
+import json
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
+
+
+async def asgi_request(
+    app: Callable[..., Any],
+    method: str,
+    path: str,
+    *,
+    query: Optional[dict[str, Any]] = None,
+    json_body: Any = None,
+    form: Optional[dict[str, str]] = None,
+) -> tuple[int, bytes]:
+    """Один запрос напрямую в ASGI-приложение, без сети и HTTP-клиента."""
+    headers = [(b"host", b"bench")]
+    body = b""
+    if json_body is not None:
+        body = json.dumps(json_body).encode()
+        headers.append((b"content-type", b"application/json"))
+    elif form is not None:
+        body = urlencode(form).encode()
+        headers.append((b"content-type", b"application/x-www-form-urlencoded"))
+    if body:
+        headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": urlencode(query or {}).encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = 0
+    response = bytearray()
+    request_sent = False
+
+    async def receive() -> dict[str, Any]:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            response.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, bytes(response)
+
+
+async def asgi_get(app: Callable[..., Any], path: str) -> tuple[int, bytes]:
+    return await asgi_request(app, "GET", path)
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from benchmarks._asgi import asgi_request
+from benchmarks._stats import percentiles
+
+PASSWORD = "S3cure!Pass"
+
+Call = Callable[[int], Awaitable[tuple[int, bytes]]]
+Scenario = tuple[str, Call, int]
+
+
+async def drive(
+    name: str, call: Call, expected: int, requests: int, concurrency: int
+) -> dict[str, Any]:
+    """Выполняет `requests` вызовов `call` в `concurrency` конкурентных воркерах."""
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index, errors
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            status, _ = await call(index)
+            latencies.append(time.perf_counter() - started)
+            if status != expected:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "endpoint": name,
+        "requests": len(latencies),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "latency": percentiles(latencies),
+        "unexpected_status": errors,
+    }
+
+
+async def build_app(use_cache: bool, database_url: str, redis: Any = None) -> Any:
+    """Приложение как в `src/main.py` (маршруты и middleware), без Jaeger.
+
+    При `use_cache` Redis — `redis`, а если он не передан — `fakeredis`.
+    """
+    from fastapi import APIRouter, FastAPI
+
+    from src.delivery.middleware import MetricsMiddleware
+    from src.delivery.route.user import UserRoute
+    from src.infra.repository.db.base import init_db, init_engine
+
+    init_engine(database_url)
+    await init_db()
+    app = FastAPI()
+    router = APIRouter(tags=["Users"])
+    UserRoute(router)
+    app.include_router(router)
+    app.add_middleware(MetricsMiddleware)
+    if use_cache:
+        if redis is None:
+            from fakeredis.aioredis import FakeRedis
+
+            redis = FakeRedis()
+        app.state.redis = redis
+    return app
+
+
+async def seed_users(
+    count: int, prefix: str, password_hash: str, batch_size: int = 10000
+) -> list[tuple[str, str]]:
+    """Пакетная вставка `count` пользователей с логинами `<prefix><номер>`.
+
+    Пароль уже захеширован: проверка правил пароля идет по `PASSWORD`, в базу
+    пишется `password_hash`. Возвращает пары (id, логин).
+    """
+    from datetime import datetime
+
+    from src.entities.user.entity import User
+    from src.infra.repository.db.base import session_scope
+    from src.infra.repository.user.user import UserRepository
+
+    template = User(
+        id=uuid.uuid4(),
+        login=f"{prefix}0",
+        name="Seeded",
+        email=f"{prefix}0@example.com",
+        password=PASSWORD,
+        created_at=datetime.now(),
+    )
+    seeded: list[tuple[str, str]] = []
+    for start in range(0, count, batch_size):
+        users = [
+            template.model_copy(
+                update={
+                    "id": uuid.uuid4(),
+                    "login": f"{prefix}{index:07d}",
+                    "email": f"{prefix}{index}@example.com",
+                    "password": password_hash,
+                }
+            )
+            for index in range(start, min(start + batch_size, count))
+        ]
+        async with session_scope() as session:
+            created = await UserRepository(session).bulk_create(users)
+        seeded.extend((str(user.id), user.login) for user in created)
+    return seeded
+
+
+class UserEndpoints:
+    """Запросы к эндпоинтам пользователей для нагрузочных прогонов.
+
+    Чтение, обновление и вход идут по засеянным пользователям, `create` добавляет
+    новых и запоминает их ID в `created_ids` — их удаляет `delete`.
+    """
+
+    def __init__(self, app: Any, seeded: list[tuple[str, str]], run_id: str) -> None:
+        self.app = app
+        self.seeded = seeded
+        self.run_id = run_id
+        self.created_ids: list[str] = []
+
+    def scenarios(self, names: Optional[Iterable[str]] = None) -> list[Scenario]:
+        """Сценарии (имя, вызов, ожидаемый статус) по порядку; `names` — отбор по имени."""
+        scenarios: list[Scenario] = [
+            ("create", self.create, 201),
+            ("get_by_id", self.get_by_id, 200),
+            ("get_by_login", self.get_by_login, 200),
+            ("update", self.update, 200),
+            ("log_in", self.log_in, 200),
+            ("get_all", self.get_all, 200),
+        ]
+        if names is None:
+            return scenarios
+        selected = set(names)
+        return [scenario for scenario in scenarios if scenario[0] in selected]
+
+    async def create(self, index: int) -> tuple[int, bytes]:
+        login = f"new{self.run_id}{index:07d}"
+        status, body = await asgi_request(
+            self.app,
+            "POST",
+            "/users/create",
+            json_body={
+                "login": login,
+                "name": "Created",
+                "email": f"{login}@example.com",
+                "password": PASSWORD,
+            },
+        )
+        if status == 201:
+            self.created_ids.append(json.loads(body)["id"])
+        return status, body
+
+    async def get_by_id(self, _: int) -> tuple[int, bytes]:
+        user_id, _login = random.choice(self.seeded)
+        return await asgi_request(self.app, "GET", f"/users/get/{user_id}")
+
+    async def get_by_login(self, _: int) -> tuple[int, bytes]:
+        _user_id, login = random.choice(self.seeded)
+        return await asgi_request(self.app, "GET", f"/users/login/{login}")
+
+    async def update(self, index: int) -> tuple[int, bytes]:
+        _user_id, login = self.seeded[index % len(self.seeded)]
+        return await asgi_request(
+            self.app,
+            "PUT",
+            "/users/update",
+            json_body={"login": login, "name": f"Upd{index % 1000}"},
+        )
+
+    async def log_in(self, _: int) -> tuple[int, bytes]:
+        _user_id, login = random.choice(self.seeded)
+        return await asgi_request(
+            self.app, "POST", "/users/log_in", form={"login": login, "password": PASSWORD}
+        )
+
+    async def get_all(self, _: int) -> tuple[int, bytes]:
+        return await asgi_request(self.app, "GET", "/users/get_all", query={"limit": 100})
+
+    async def delete(self, index: int) -> tuple[int, bytes]:
+        return await asgi_request(self.app, "DELETE", f"/users/delete/{self.created_ids[index]}")
@@ -0,0 +1,20 @@
+import statistics
+from typing import Sequence
+
+
+def percentiles(samples: Sequence[float]) -> dict[str, float]:
+    """p50/p95/p99 и максимум в миллисекундах."""
+    if not samples:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else []
+
+    def at(percent: int) -> float:
+        return (cuts[percent - 1] if cuts else ordered[0]) * 1000
+
+    return {
+        "p50_ms": round(at(50), 3),
+        "p95_ms": round(at(95), 3),
+        "p99_ms": round(at(99), 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
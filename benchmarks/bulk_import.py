@@ -0,0 +1,107 @@
+"""Пропускная способность импорта пользователей (`src.usecases.importer`).
+
+Запуск:
+    python -m benchmarks.bulk_import --rows 1000000 --workers 4
+
+Генерирует CSV на `--rows` строк (доля `--invalid` невалидных и `--duplicates` повторов
+логина), импортирует его в пустую БД (по умолчанию SQLite во временном файле, для
+COPY — `--database-url postgresql+asyncpg://...`) и печатает строк в секунду.
+Пароли в файле — готовый хеш scrypt: хеширование открытых паролей стоит десятки
+миллисекунд на строку и измерялось бы вместо импорта.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from typing import Optional
+
+
+def _write_file(path: str, rows: int, invalid: float, duplicates: float, seed: int) -> None:
+    from src.infra.security.password import hash_password
+
+    rng = random.Random(seed)
+    password_hash = hash_password("S3cure!Pass", 1024, 8, 1)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(("login", "name", "email", "password", "is_active"))
+        for index in range(rows):
+            roll = rng.random()
+            if roll < invalid:
+                writer.writerow((f"bad{index}!", "X", f"bad{index}", password_hash, "true"))
+            elif roll < invalid + duplicates and index:
+                other = rng.randrange(index)
+                login, email = f"import{other:08d}", f"dup{index}@example.com"
+                writer.writerow((login, "Duplicate", email, password_hash, ""))
+            else:
+                login, email = f"import{index:08d}", f"import{index}@example.com"
+                writer.writerow((login, "Imported", email, password_hash, ""))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--invalid", type=float, default=0.01)
+    parser.add_argument("--duplicates", type=float, default=0.01)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from src.infra.logs import HOT_PATH_LOGGERS
+
+    for name in HOT_PATH_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    tmp_dir: Optional[tempfile.TemporaryDirectory[str]] = tempfile.TemporaryDirectory()
+    assert tmp_dir is not None
+    database_url = args.database_url or (
+        f"sqlite+aiosqlite:///{os.path.join(tmp_dir.name, 'bench.db')}"
+    )
+    source = os.path.join(tmp_dir.name, "users.csv")
+
+    started = time.perf_counter()
+    _write_file(source, args.rows, args.invalid, args.duplicates, args.seed)
+    generated = time.perf_counter() - started
+
+    from src.infra.repository.db.base import dispose_engine, init_db, init_engine
+    from src.usecases.importer import import_users
+
+    init_engine(database_url)
+    await init_db()
+    report = await import_users(
+        source,
+        "csv",
+        os.path.join(tmp_dir.name, "rejects.csv"),
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    await dispose_engine()
+
+    print(
+        json.dumps(
+            {
+                "params": vars(args),
+                "file_mib": round(os.path.getsize(source) / 2**20, 1),
+                "generate_seconds": round(generated, 2),
+                "seconds": report.seconds,
+                "rows_per_s": round(report.processed / report.seconds),
+                "imported": report.imported,
+                "invalid": report.invalid,
+                "duplicates": report.duplicates,
+                "conflicts": report.conflicts,
+            },
+            indent=2,
+        )
+    )
+    tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Нагрузочный прогон всех эндпоинтов пользователей на локальном SQLite и fake Redis.
+
+Запуск:
+    python -m benchmarks.endpoints --users 2000 --requests 500 --concurrency 16
+
+Приложение собирается как в `src/main.py` (маршруты и middleware), но без Jaeger:
+БД — `sqlite+aiosqlite` во временном файле (или `--database-url`), Redis —
+`fakeredis` (без него и с `--no-cache` кэш выключен). Запросы идут напрямую в ASGI
+приложение. Сначала в базу одной пакетной вставкой добавляется `--users` пользователей,
+затем по очереди нагружаются `create`, `get_by_id`, `get_by_login`, `update`, `log_in`,
+`get_all` и `delete`. Для каждого эндпоинта печатаются запросы в секунду,
+p50/p95/p99 и число ответов с неожиданным статусом.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import uuid
+from typing import Optional
+
+from benchmarks._scenarios import PASSWORD, UserEndpoints, build_app, drive, seed_users
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    tmp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    if args.database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp_dir.name, 'bench.db')}"
+    use_cache = not args.no_cache
+    if use_cache:
+        try:
+            import fakeredis  # noqa: F401
+        except ImportError:
+            use_cache = False
+
+    from src.infra.logs import HOT_PATH_LOGGERS
+    from src.infra.repository.db.base import dispose_engine
+    from src.infra.security.password import password_hasher
+
+    for name in HOT_PATH_LOGGERS:
+        logging.getLogger(name).setLevel(args.log_level.upper())
+
+    try:
+        app = await build_app(use_cache, args.database_url)
+        run_id = uuid.uuid4().hex[:6]
+        password_hash = await password_hasher.hash(PASSWORD)
+        seeded = await seed_users(args.users, f"seed{run_id}", password_hash)
+        endpoints = UserEndpoints(app, seeded, run_id)
+        results = [
+            await drive(name, call, expected, args.requests, args.concurrency)
+            for name, call, expected in endpoints.scenarios()
+        ]
+        results.append(
+            await drive(
+                "delete", endpoints.delete, 200, len(endpoints.created_ids), args.concurrency
+            )
+        )
+
+        report = {
+            "params": {**vars(args), "cache": use_cache, "seeded": len(seeded)},
+            "results": results,
+        }
+        print(json.dumps(report, indent=2))
+    finally:
+        await dispose_engine()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
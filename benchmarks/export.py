@@ -0,0 +1,116 @@
+"""Выгрузка всей таблицы: поток ORM-объектов и DTO против `/users/export`.
+
+Запуск:
+    python -m benchmarks.export --users 200000 --batch-size 10000
+
+"orm_ndjson" — путь `GET /users/get_all?stream=true`: ORM-объект и `UserResponseDTO` на
+строку. "csv", "ndjson", "parquet" — `UserRepository.export_users` (на PostgreSQL CSV
+и NDJSON идут через COPY). Для каждого способа печатаются строк в секунду, объем
+выгрузки и пиковая память Python (`tracemalloc`, отдельным прогоном: он замедляет код).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, AsyncIterator, Callable, Optional
+
+from benchmarks._scenarios import seed_users
+
+PASSWORD_HASH = "scrypt$benchmark"
+
+Source = Callable[[], AsyncIterator[bytes]]
+
+
+async def _consume(source: Source) -> int:
+    size = 0
+    async for chunk in source():
+        size += len(chunk)
+    return size
+
+
+async def _measure(name: str, source: Source, rows: int) -> dict[str, Any]:
+    started = time.perf_counter()
+    size = await _consume(source)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    await _consume(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "method": name,
+        "seconds": round(elapsed, 3),
+        "rows_per_s": round(rows / elapsed),
+        "bytes": size,
+        "peak_python_mib": round(peak / 2**20, 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--formats", default="csv,ndjson,parquet")
+    args = parser.parse_args()
+
+    tmp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    if args.database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp_dir.name, 'bench.db')}"
+
+    import logging
+
+    from src.infra.logs import HOT_PATH_LOGGERS
+
+    for logger_name in HOT_PATH_LOGGERS:
+        logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+    from src.infra.repository.db.base import init_db, init_engine, session_scope
+    from src.infra.repository.user.user import UserRepository
+
+    init_engine(args.database_url)
+    await init_db()
+    await seed_users(args.users, "export", PASSWORD_HASH)
+
+    async def orm_ndjson() -> AsyncIterator[bytes]:
+        async with session_scope() as session:
+            users = UserRepository(session).stream_users(batch_size=args.batch_size)
+            chunk: list[bytes] = []
+            async for user in users:
+                chunk.append(user.model_dump_json().encode())
+                if len(chunk) >= args.batch_size:
+                    yield b"\n".join(chunk) + b"\n"
+                    chunk = []
+            if chunk:
+                yield b"\n".join(chunk) + b"\n"
+
+    def exporter(export_format: Any) -> Source:
+        async def source() -> AsyncIterator[bytes]:
+            async with session_scope() as session:
+                chunks = UserRepository(session).export_users(export_format, args.batch_size)
+                async for chunk in chunks:
+                    yield chunk
+
+        return source
+
+    results = [await _measure("orm_ndjson", orm_ndjson, args.users)]
+    for export_format in args.formats.split(","):
+        if export_format == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                continue
+        results.append(await _measure(export_format, exporter(export_format), args.users))
+
+    print(json.dumps({"params": vars(args), "results": results}, indent=2))
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+"""Пропускная способность при выключенном, синхронном и очередном логировании.
+
+Запуск:
+    python -m benchmarks.logging_overhead --requests 5000 --concurrency 32
+
+Маршрут повторяет записи логов запроса `GET /users/get/{user_id}` (route, service,
+repository) и отвечает готовым DTO. Режимы:
+"off" — логирование выключено;
+"sync" — обработчик пишет в файл в потоке запроса (как раньше);
+"queue" — `LogPipeline`: запись в очередь, форматирование и вывод в фоновом потоке,
+ограничение повторяющихся INFO-строк.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import Any
+
+from fastapi import FastAPI
+
+from benchmarks._asgi import asgi_get
+from benchmarks._stats import percentiles
+from src.delivery.response import DTOResponse
+from src.entities.user.dto import UserResponseDTO
+from src.infra.logs import LogPipeline
+
+LOGGERS = ("route", "service", "repository")
+
+
+def _build_app(user: UserResponseDTO) -> FastAPI:
+    route_logger = logging.getLogger("route")
+    service_logger = logging.getLogger("service")
+    repository_logger = logging.getLogger("repository")
+    app = FastAPI()
+
+    @app.get("/users/get/{user_id}")
+    async def get_user(user_id: str) -> DTOResponse:
+        route_logger.info("Received request to get user by ID: %s", user_id)
+        service_logger.info("Получение пользователя по ID: %s или логину: %s", user_id, None)
+        repository_logger.info("Поиск пользователя по ID %s или логину %s", user_id, None)
+        repository_logger.info("Пользователь найден: %s", user.login)
+        service_logger.info("Пользователь найден: %s", user.login)
+        route_logger.info("User found: %s", user.login)
+        return DTOResponse(user)
+
+    return app
+
+
+def _configure(mode: str, log_path: str) -> LogPipeline | None:
+    logging.disable(logging.NOTSET)
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        handler = logging.FileHandler(log_path)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+
+    if mode == "off":
+        logging.disable(logging.CRITICAL)
+        return None
+    if mode == "queue":
+        pipeline = LogPipeline()
+        pipeline.start(LOGGERS)
+        return pipeline
+    return None
+
+
+async def _run_mode(
+    mode: str, app: FastAPI, path: str, requests: int, concurrency: int, log_path: str
+) -> dict[str, Any]:
+    pipeline = _configure(mode, log_path)
+    latencies: list[float] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            status, _ = await asgi_get(app, path)
+            assert status == 200
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    result: dict[str, Any] = {
+        "mode": mode,
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "latency": percentiles(latencies),
+    }
+    if pipeline is not None:
+        pipeline.stop()
+        result.update(pipeline.stats())
+    for name in LOGGERS:
+        for handler in logging.getLogger(name).handlers:
+            handler.close()
+    logging.disable(logging.NOTSET)
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    now = datetime.now()
+    user = UserResponseDTO(
+        id=uuid.uuid4(),
+        login="benchmark_user",
+        name="Benchmark",
+        email="benchmark@example.com",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    app = _build_app(user)
+    path = f"/users/get/{user.id}"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, "bench.log")
+        results = [
+            await _run_mode(mode, app, path, args.requests, args.concurrency, log_path)
+            for mode in ("off", "sync", "queue")
+        ]
+    print(json.dumps({"params": vars(args), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""Задержка входа под конкурентной нагрузкой: scrypt в event loop против пула.
+
+Запуск:
+    python -m benchmarks.password_hashing --concurrency 64 --workers 4
+
+Одновременно с проверками паролей идет поток "легких" запросов (интервал
+`--probe-interval`), по их задержке видно, насколько KDF блокирует остальной трафик.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import Executor
+from typing import Optional
+
+from benchmarks._stats import percentiles
+from src.config import service_settings
+from src.infra.security.password import PasswordHasher, create_executor, hash_password
+
+PASSWORD = "S3cure!Pass"
+
+
+async def _run_mode(
+    executor: Optional[Executor],
+    encoded: str,
+    concurrency: int,
+    rounds: int,
+    probe_interval: float,
+) -> dict[str, object]:
+    hasher = PasswordHasher(executor=executor)
+    login_latencies: list[float] = []
+    probe_latencies: list[float] = []
+    done = asyncio.Event()
+
+    async def login(arrived: float) -> None:
+        assert await hasher.verify(PASSWORD, encoded)
+        login_latencies.append(time.perf_counter() - arrived)
+
+    async def probe() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(probe_interval)
+            probe_latencies.append(time.perf_counter() - started - probe_interval)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    for _ in range(rounds):
+        arrived = time.perf_counter()
+        await asyncio.gather(*(login(arrived) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+    hasher.shutdown()
+
+    return {
+        "logins": len(login_latencies),
+        "logins_per_s": round(len(login_latencies) / elapsed, 1),
+        "login": percentiles(login_latencies),
+        "other_requests_delay": percentiles(probe_latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=service_settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--probe-interval", type=float, default=0.005)
+    args = parser.parse_args()
+
+    encoded = hash_password(
+        PASSWORD,
+        service_settings.PASSWORD_SCRYPT_N,
+        service_settings.PASSWORD_SCRYPT_R,
+        service_settings.PASSWORD_SCRYPT_P,
+    )
+    report = {
+        "params": vars(args),
+        "inline": await _run_mode(
+            None, encoded, args.concurrency, args.rounds, args.probe_interval
+        ),
+        "pool": await _run_mode(
+            create_executor(args.executor, args.workers),
+            encoded,
+            args.concurrency,
+            args.rounds,
+            args.probe_interval,
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
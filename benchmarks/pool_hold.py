@@ -0,0 +1,141 @@
+"""Удержание соединений пула и пропускная способность при фиксированном размере пула.
+
+Запуск:
+    python -m benchmarks.pool_hold --pool-size 2 --requests 400 --concurrency 32
+
+Приложение и данные — как в `benchmarks.endpoints`, но движок создается с
+`pool_size=--pool-size` и `max_overflow=0`: запросы конкурируют за несколько
+соединений. Для каждого эндпоинта печатаются запросы в секунду, задержка, а также
+число выдач соединения из пула на запрос и время удержания соединения
+(от checkout до checkin, p50/p95/p99). События пула слушает сам бенчмарк, без
+метрик приложения, поэтому его можно запускать и на предыдущих ревизиях.
+
+`fakeredis` отвечает без сетевой задержки; `--cache-latency-ms` добавляет ее к каждой
+команде Redis, как у Redis на другом хосте. Эта задержка и хеширование паролей — то
+время запроса, на которое соединение не должно оставаться занятым.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional, cast
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from benchmarks._scenarios import PASSWORD, UserEndpoints, build_app, drive, seed_users
+from benchmarks._stats import percentiles
+
+DEFAULT_ENDPOINTS = ("create", "get_by_id", "update", "log_in", "get_all")
+
+
+def _slow_redis(latency: float) -> Any:
+    from fakeredis.aioredis import FakeRedis
+
+    class SlowRedis(FakeRedis):
+        async def execute_command(self, *args: Any, **options: Any) -> Any:
+            await asyncio.sleep(latency)
+            # execute_command у redis-py без аннотаций
+            execute = cast(Callable[..., Awaitable[Any]], super().execute_command)
+            return await execute(*args, **options)
+
+    return SlowRedis()
+
+
+def _track_holds(engine: AsyncEngine, holds: list[float]) -> None:
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(_: Any, record: Any, *__: Any) -> None:
+        record.info["bench_checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(_: Any, record: Any) -> None:
+        checked_out_at = record.info.pop("bench_checked_out_at", None)
+        if checked_out_at is not None:
+            holds.append(time.perf_counter() - checked_out_at)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--cache-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--endpoints", default=None, help="через запятую, по умолчанию все")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    tmp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+    if args.database_url is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        args.database_url = f"sqlite+aiosqlite:///{os.path.join(tmp_dir.name, 'bench.db')}"
+    use_cache = not args.no_cache
+    if use_cache:
+        try:
+            import fakeredis  # noqa: F401
+        except ImportError:
+            use_cache = False
+
+    from src.infra.logs import HOT_PATH_LOGGERS
+    from src.infra.repository.db import base
+    from src.infra.repository.db.base import dispose_engine
+    from src.infra.security.password import password_hasher
+
+    for name in HOT_PATH_LOGGERS:
+        logging.getLogger(name).setLevel(args.log_level.upper())
+
+    # Движок с фиксированным пулом подставляется до `init_engine` в `build_app`
+    engine = create_async_engine(
+        args.database_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=args.pool_size,
+        max_overflow=0,
+        pool_timeout=300,
+    )
+    base.engine = engine
+    base.SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+    holds: list[float] = []
+    _track_holds(engine, holds)
+
+    try:
+        redis = None
+        if use_cache and args.cache_latency_ms > 0:
+            redis = _slow_redis(args.cache_latency_ms / 1000)
+        app = await build_app(use_cache, args.database_url, redis)
+        run_id = uuid.uuid4().hex[:6]
+        password_hash = await password_hasher.hash(PASSWORD)
+        seeded = await seed_users(args.users, f"seed{run_id}", password_hash)
+        endpoints = UserEndpoints(app, seeded, run_id)
+        names = args.endpoints.split(",") if args.endpoints else DEFAULT_ENDPOINTS
+        results: list[dict[str, Any]] = []
+        for name, call, expected in endpoints.scenarios(names):
+            holds.clear()
+            result = await drive(name, call, expected, args.requests, args.concurrency)
+            result["checkouts_per_request"] = round(len(holds) / max(result["requests"], 1), 2)
+            result["pool_hold"] = percentiles(holds)
+            results.append(result)
+
+        report = {
+            "params": {**vars(args), "cache": use_cache, "seeded": len(seeded)},
+            "results": results,
+        }
+        print(json.dumps(report, indent=2))
+    finally:
+        await dispose_engine()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Стоимость сериализации одного пользователя: путь FastAPI по умолчанию против DTOResponse.
+
+Запуск:
+    python -m benchmarks.serialization --users 1000 --repeat 20
+
+Оба пути получают уже построенные сервисом DTO:
+"default" — то же, что FastAPI делает для `response_model`: повторная валидация, dump в dict,
+`jsonable_encoder` и `json.dumps` (публичные API pydantic и FastAPI, без внутренних функций);
+"dto_response" — `DTOResponse`, сериализация сразу в байты ядром pydantic.
+Отдельно показана стоимость построения DTO из ORM-объекта (`build_dto`) и из кортежа
+строки Core-запроса (`build_dto_from_row`), как читает репозиторий.
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from src.delivery.response import DTOResponse
+from src.entities.user.dto import (
+    USER_RESPONSE_FIELDS,
+    UserResponseDTO,
+    to_user_response_dto,
+    to_user_response_dto_from_row,
+)
+
+
+def _orm_rows(count: int) -> list[Any]:
+    now = datetime.now()
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            login=f"user_{index:08d}",
+            name="Benchmark",
+            email=f"user_{index}@example.com",
+            password="scrypt$...",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def _measure(label: str, func: Callable[[], object], users: int, repeat: int) -> dict[str, Any]:
+    result = func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - started
+    return {
+        "path": label,
+        "per_user_us": round(elapsed / (users * repeat) * 1_000_000, 3),
+        "bytes": len(result) if isinstance(result, bytes) else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = _orm_rows(args.users)
+    dtos = [to_user_response_dto(row) for row in rows]
+    row_tuples = [tuple(getattr(row, field) for field in USER_RESPONSE_FIELDS) for row in rows]
+    response_adapter = TypeAdapter(list[UserResponseDTO])
+
+    def build_dto() -> list[UserResponseDTO]:
+        return [to_user_response_dto(row) for row in rows]
+
+    def build_dto_from_row() -> list[UserResponseDTO]:
+        return [to_user_response_dto_from_row(row) for row in row_tuples]
+
+    def default_path() -> bytes:
+        validated = response_adapter.validate_python(dtos)
+        content = jsonable_encoder(response_adapter.dump_python(validated, mode="json"))
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def dto_response_path() -> bytes:
+        return bytes(DTOResponse(dtos).body)
+
+    report = {
+        "params": vars(args),
+        "results": [
+            _measure("build_dto", build_dto, args.users, args.repeat),
+            _measure("build_dto_from_row", build_dto_from_row, args.users, args.repeat),
+            _measure("default", default_path, args.users, args.repeat),
+            _measure("dto_response", dto_response_path, args.users, args.repeat),
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
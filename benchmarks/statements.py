@@ -0,0 +1,190 @@
+"""Накладные расходы Python на горячие запросы репозитория: сборка select на каждом
+вызове, заранее собранные statement'ы, `lambda_stmt` и чтение колонками через Core.
+
+Запуск:
+    python -m benchmarks.statements --users 1000 --queries 5000
+
+Для поиска по ID, по логину и версии (id, updated_at) выполняются одни и те же
+запросы, каждый вариант возвращает то же, что и репозиторий (DTO ответа или версию):
+`built` — `select(UserDBModel).where(...)` собирается на каждом вызове, `prebuilt` —
+такой же ORM-запрос, собранный один раз, с bind-параметрами, `lambda` — `lambda_stmt`
+с замыканием, `core` — statement'ы репозитория: только колонки ответа, DTO из кортежа
+строки без ORM-объекта. По умолчанию SQLite в памяти: сам запрос занимает единицы
+микросекунд, и разница между вариантами — это сборка конструкции, ключ кэша
+компиляции, гидратация ORM и построение DTO. Печатаются микросекунды на запрос и
+доля попаданий в кэш компиляции SQLAlchemy.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, cast
+
+from sqlalchemy import Table, bindparam, event, lambda_stmt, select
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+Query = Callable[[AsyncSession, int], Awaitable[Any]]
+
+
+async def _measure(
+    factory: async_sessionmaker[AsyncSession], query: Query, queries: int
+) -> float:
+    async with factory() as session:
+        for index in range(min(queries, 200)):
+            await query(session, index)
+        started = time.perf_counter()
+        for index in range(queries):
+            await query(session, index)
+            session.expunge_all()
+        return (time.perf_counter() - started) / queries * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://")
+    args = parser.parse_args()
+
+    from src.entities.user.dto import to_user_response_dto, to_user_response_dto_from_row
+    from src.infra.repository.db.models.user import UserDBModel
+    from src.infra.repository.user import user as repository
+
+    orm_by_id = select(UserDBModel).where(UserDBModel.id == bindparam("user_id"))
+    orm_by_login = select(UserDBModel).where(UserDBModel.login == bindparam("user_login"))
+
+    engine = create_async_engine(args.database_url)
+    cache_hits = {"hit": 0, "miss": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _on_execute(_: Any, __: Any, ___: Any, ____: Any, context: Any, *_____: Any) -> None:
+        cache_hits["hit" if context.cache_hit is CacheStats.CACHE_HIT else "miss"] += 1
+
+    async with engine.begin() as connection:
+        await connection.run_sync(cast(Table, UserDBModel.__table__).create, checkfirst=True)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    now = datetime.now()
+    run_id = uuid.uuid4().hex[:6]
+    users = [(uuid.uuid4(), f"bench{run_id}{index:06d}") for index in range(args.users)]
+    async with factory() as session:
+        session.add_all(
+            UserDBModel(
+                id=user_id,
+                login=login,
+                name="Bench",
+                email=f"{login}@example.com",
+                password="-",
+                is_active=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for user_id, login in users
+        )
+        await session.commit()
+
+    def user_id(index: int) -> uuid.UUID:
+        return users[index % len(users)][0]
+
+    def login(index: int) -> str:
+        return users[index % len(users)][1]
+
+    def to_dto(db_user: Any) -> Any:
+        return to_user_response_dto(db_user) if db_user is not None else None
+
+    def row_to_dto(row: Any) -> Any:
+        return to_user_response_dto_from_row(row) if row is not None else None
+
+    async def by_id_built(session: AsyncSession, index: int) -> Any:
+        stmt = select(UserDBModel).where(UserDBModel.id == user_id(index))
+        return to_dto((await session.execute(stmt)).scalar_one_or_none())
+
+    async def by_id_prebuilt(session: AsyncSession, index: int) -> Any:
+        result = await session.execute(orm_by_id, {"user_id": user_id(index)})
+        return to_dto(result.scalar_one_or_none())
+
+    async def by_id_lambda(session: AsyncSession, index: int) -> Any:
+        value = user_id(index)
+        stmt = lambda_stmt(lambda: select(UserDBModel).where(UserDBModel.id == value))
+        return to_dto((await session.execute(stmt)).scalar_one_or_none())
+
+    async def by_id_core(session: AsyncSession, index: int) -> Any:
+        result = await session.execute(repository._USER_BY_ID, {"user_id": user_id(index)})
+        return row_to_dto(result.one_or_none())
+
+    async def by_login_built(session: AsyncSession, index: int) -> Any:
+        stmt = select(UserDBModel).where(UserDBModel.login == login(index))
+        return to_dto((await session.execute(stmt)).scalar_one_or_none())
+
+    async def by_login_prebuilt(session: AsyncSession, index: int) -> Any:
+        result = await session.execute(orm_by_login, {"user_login": login(index)})
+        return to_dto(result.scalar_one_or_none())
+
+    async def by_login_lambda(session: AsyncSession, index: int) -> Any:
+        value = login(index)
+        stmt = lambda_stmt(lambda: select(UserDBModel).where(UserDBModel.login == value))
+        return to_dto((await session.execute(stmt)).scalar_one_or_none())
+
+    async def by_login_core(session: AsyncSession, index: int) -> Any:
+        result = await session.execute(repository._USER_BY_LOGIN, {"user_login": login(index)})
+        return row_to_dto(result.one_or_none())
+
+    async def version_built(session: AsyncSession, index: int) -> Any:
+        stmt = select(UserDBModel.id, UserDBModel.updated_at).where(
+            UserDBModel.id == user_id(index)
+        )
+        return (await session.execute(stmt)).one_or_none()
+
+    async def version_prebuilt(session: AsyncSession, index: int) -> Any:
+        result = await session.execute(repository._VERSION_BY_ID, {"user_id": user_id(index)})
+        return result.one_or_none()
+
+    async def version_lambda(session: AsyncSession, index: int) -> Any:
+        value = user_id(index)
+        stmt = lambda_stmt(
+            lambda: select(UserDBModel.id, UserDBModel.updated_at).where(UserDBModel.id == value)
+        )
+        return (await session.execute(stmt)).one_or_none()
+
+    scenarios: dict[str, dict[str, Query]] = {
+        "by_id": {
+            "built": by_id_built,
+            "prebuilt": by_id_prebuilt,
+            "lambda": by_id_lambda,
+            "core": by_id_core,
+        },
+        "by_login": {
+            "built": by_login_built,
+            "prebuilt": by_login_prebuilt,
+            "lambda": by_login_lambda,
+            "core": by_login_core,
+        },
+        "version": {
+            "built": version_built,
+            "prebuilt": version_prebuilt,
+            "lambda": version_lambda,
+        },
+    }
+    results = []
+    for lookup, variants in scenarios.items():
+        row: dict[str, Any] = {"lookup": lookup}
+        for variant, query in variants.items():
+            cache_hits.update(hit=0, miss=0)
+            row[f"{variant}_us"] = round(await _measure(factory, query, args.queries), 1)
+            row[f"{variant}_cache_hit"] = round(
+                cache_hits["hit"] / max(cache_hits["hit"] + cache_hits["miss"], 1), 3
+            )
+        fastest = "core" if "core" in variants else "prebuilt"
+        row["speedup"] = round(row["built_us"] / row[f"{fastest}_us"], 2)
+        results.append(row)
+
+    print(json.dumps({"params": vars(args), "results": results}, indent=2))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
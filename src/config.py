@@ -0,0 +1,73 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class UserServiceSettings(BaseSettings):
+    """Настройки производительности сервиса пользователей.
+
+    Общие настройки (БД, Redis, порты) читаются через `tools_openverse.common.config.settings`,
+    здесь только параметры, специфичные для этого сервиса.
+    """
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL: int = 300
+    USER_CACHE_PREFIX: str = "users"
+    USER_LOOKUP_COALESCING: bool = True
+
+    USER_STATS_ENABLED: bool = True
+    USER_STATS_RECONCILE_INTERVAL: int = 300
+
+    USER_OUTBOX_RELAY_ENABLED: bool = True
+    USER_OUTBOX_RELAY_INTERVAL: float = 1.0
+    USER_OUTBOX_BATCH_SIZE: int = 500
+    USER_OUTBOX_STREAM: str = "users:changes"
+    USER_OUTBOX_STREAM_MAXLEN: int = 100000
+    USER_OUTBOX_RETENTION_DAYS: int = 7
+    USER_CHANGES_PAGE_SIZE: int = 100
+    USER_CHANGES_PAGE_SIZE_MAX: int = 1000
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_QUERY_CACHE_SIZE: int = 500
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    USERS_PAGE_SIZE: int = 100
+    USERS_PAGE_SIZE_MAX: int = 1000
+    USERS_STREAM_BATCH_SIZE: int = 1000
+    USERS_EXPORT_BATCH_SIZE: int = 10000
+
+    USERS_SEARCH_MIN_LENGTH: int = 3
+    USERS_SEARCH_LIMIT: int = 20
+    USERS_SEARCH_LIMIT_MAX: int = 100
+    USERS_SEARCH_OFFSET_MAX: int = 1000
+
+    USERS_BULK_CREATE_MAX: int = 5000
+    USERS_BATCH_GET_MAX: int = 500
+    USERS_BULK_STATUS_CHUNK: int = 1000
+    USERS_IMPORT_BATCH_SIZE: int = 5000
+    USERS_IMPORT_WORKERS: int = 4
+
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process", "inline"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_SCRYPT_N: int = 2**14
+    PASSWORD_SCRYPT_R: int = 8
+    PASSWORD_SCRYPT_P: int = 1
+
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_LEVELS: dict[str, str] = {}
+    LOG_INFO_RATE_LIMIT: int = 50
+    LOG_INFO_SAMPLE_RATE: float = 1.0
+    LOG_PER_ROW: bool = False
+
+    TRACING_ENABLED: bool = True
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_SECRET: str = ""
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_DIR: str = "profiles"
+
+
+service_settings = UserServiceSettings()
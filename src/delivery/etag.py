@@ -0,0 +1,74 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+from uuid import UUID
+
+from fastapi import Request, Response
+
+Version = tuple[UUID | str, datetime]
+
+
+def _microseconds(value: datetime) -> int:
+    # Наивные даты (SQLite) считаются локальным временем — как и при записи
+    return round(value.timestamp() * 1_000_000)
+
+
+def user_etag(user_id: UUID | str, updated_at: datetime) -> str:
+    """Слабый ETag пользователя: меняется вместе с `updated_at`."""
+    return f'W/"{UUID(str(user_id)).hex}-{_microseconds(updated_at):x}"'
+
+
+def page_etag(versions: Iterable[Version], has_more: bool) -> str:
+    """ETag страницы: состав страницы, `updated_at` каждого пользователя и наличие следующей."""
+    digest = hashlib.blake2b(digest_size=12)
+    for user_id, updated_at in versions:
+        digest.update(UUID(str(user_id)).bytes)
+        digest.update(_microseconds(updated_at).to_bytes(8, "big", signed=True))
+    digest.update(b"+" if has_more else b".")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def last_modified(versions: Iterable[Version]) -> Optional[datetime]:
+    return max((updated_at for _, updated_at in versions), default=None)
+
+
+def _http_date(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, modified: Optional[datetime]) -> bool:
+    """Проверка `If-None-Match` (слабое сравнение), без него — `If-Modified-Since`."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+
+def has_validators(request: Request) -> bool:
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def set_validators(response: Response, etag: str, modified: Optional[datetime]) -> Response:
+    response.headers["ETag"] = etag
+    if modified is not None:
+        response.headers["Last-Modified"] = _http_date(modified)
+    return response
+
+
+def not_modified(etag: str, modified: Optional[datetime]) -> Response:
+    return set_validators(Response(status_code=304), etag, modified)
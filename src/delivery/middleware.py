@@ -0,0 +1,131 @@
+import asyncio
+import cProfile
+import random
+import time
+from typing import Any, Awaitable, Callable, MutableMapping, Optional
+
+from tools_openverse.common.logger_ import setup_logger
+
+from src.infra.metrics import http_request_duration, http_requests_total
+from src.infra.profiling import start_query_count, verify_signature, write_profile
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+logger = setup_logger("profiling")
+
+
+class MetricsMiddleware:
+    """Счетчик и гистограмма задержки HTTP-запросов по шаблону маршрута.
+
+    Чистый ASGI без `BaseHTTPMiddleware`: тело ответа не буферизуется и не создаются
+    лишние задачи. Метка `route` — шаблон пути (`/users/get/{user_id}`), а не сам путь,
+    чтобы число рядов не росло с числом пользователей.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "<unmatched>"
+            method = scope["method"]
+            http_request_duration.observe(time.perf_counter() - started, method, route_path)
+            http_requests_total.inc(method, route_path, str(status))
+
+
+class ProfilingMiddleware:
+    """Профилирование отдельных запросов через cProfile по запросу или по сэмплированию.
+
+    Запрос профилируется, если у него есть заголовок `X-Profile` с подписью
+    `src.infra.profiling.sign(secret, timestamp, path)` или он попал в долю
+    `sample_rate`. Профиль (pstats) и JSON с маршрутом, временем и числом SQL-запросов
+    пишутся в `directory`. Одновременно профилируется не больше одного запроса:
+    cProfile видит весь поток, включая чужие корутины, выполнявшиеся в это время.
+    Для остальных запросов — одна проверка флага и заголовков.
+    """
+
+    header = b"x-profile"
+
+    def __init__(self, app: ASGIApp, secret: str, sample_rate: float, directory: str) -> None:
+        self.app = app
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self._busy = False
+
+    def _trigger(self, scope: Scope) -> Optional[str]:
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        if not self.secret:
+            return None
+        for name, value in scope["headers"]:
+            if name == self.header:
+                if verify_signature(self.secret, value.decode("latin-1"), scope["path"]):
+                    return "header"
+                logger.warning("Invalid profiling signature for %s", scope["path"])
+                return None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        queries = start_query_count()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+            duration_ms = (time.perf_counter() - started) * 1000
+            self._busy = False
+            route = getattr(scope.get("route"), "path", None) or scope["path"]
+            meta = {
+                "method": scope["method"],
+                "route": route,
+                "path": scope["path"],
+                "status": status,
+                "duration_ms": round(duration_ms, 3),
+                "db_queries": queries[0],
+                "trigger": trigger,
+            }
+            try:
+                path = await asyncio.to_thread(write_profile, self.directory, profiler, meta)
+                logger.info("Profile for %s %s written to %s", scope["method"], route, path)
+            except OSError as exc:
+                logger.error("Failed to write profile for %s: %s", route, exc)
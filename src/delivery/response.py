@@ -0,0 +1,27 @@
+from typing import Sequence
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from src.entities.user.dto import UserResponseDTO
+
+user_list_adapter = TypeAdapter(list[UserResponseDTO])
+
+
+class DTOResponse(Response):
+    """JSON-ответ из уже готовых DTO.
+
+    FastAPI для `response_model` повторно валидирует возвращенный объект, переводит его
+    в dict через `jsonable_encoder` и только потом вызывает `json.dumps`. DTO сервиса уже
+    валидны, поэтому здесь они сразу сериализуются в байты ядром pydantic.
+    `response_model` в маршрутах остается только для схемы OpenAPI.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | Sequence[UserResponseDTO] | None) -> bytes:
+        if content is None:
+            return b"null"
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return user_list_adapter.dump_json(list(content))
@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.infra.metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsRoute:
+    def __init__(self, router: APIRouter):
+        self.router = router
+        self.setup_routes()
+
+    def setup_routes(self) -> None:
+        self.router.add_api_route(
+            "/metrics",
+            self.metrics,
+            methods=["GET"],
+            response_class=PlainTextResponse,
+            summary="Prometheus metrics",
+            include_in_schema=False,
+        )
+
+    async def metrics(self) -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,12 +1,40 @@
-from typing import Annotated, Optional
+from typing import Annotated, AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from tools_openverse.common.logger_ import setup_logger
 from tools_openverse.common.models import LoginOAuth2PasswordRequestForm
 
-from src.entities.user.dto import UserCreateDTO, UserResponseDTO, UserUpdateDTO
+from src.config import service_settings
+from src.delivery.etag import (
+    Version,
+    has_validators,
+    is_not_modified,
+    last_modified,
+    not_modified,
+    page_etag,
+    set_validators,
+    user_etag,
+)
+from src.delivery.response import DTOResponse
+from src.entities.user.dto import (
+    UserBatchGetDTO,
+    UserBatchResultDTO,
+    UserBulkCreateResultDTO,
+    UserBulkStatusDTO,
+    UserBulkStatusResultDTO,
+    UserChangesDTO,
+    UserCreateDTO,
+    UserExportFormat,
+    UserPageDTO,
+    UserResponseDTO,
+    UserSearchResultDTO,
+    UserStatsDTO,
+    UserUpdateDTO,
+)
 from src.infra.repository.user.exc import UserNotFoundHTTPException
+from src.infra.repository.user.export import MEDIA_TYPES
 from src.usecases.user import UserService, get_user_service
 
 get_user_service_dep = Annotated[UserService, Depends(get_user_service)]
@@ -33,6 +61,13 @@ class UserRoute:
             summary="Create new user",
             status_code=201,
         )
+        self.router.add_api_route(
+            "/users/bulk_create",
+            self.bulk_create_users,
+            methods=["POST"],
+            response_model=UserBulkCreateResultDTO,
+            summary="Create many users with a single multi-row insert",
+        )
         self.router.add_api_route(
             "/users/get/{user_id}",
             self.get_user_by_id,
@@ -47,6 +82,13 @@ class UserRoute:
             response_model=UserResponseDTO,
             summary="Get user by login",
         )
+        self.router.add_api_route(
+            "/users/batch_get",
+            self.get_users_batch,
+            methods=["POST"],
+            response_model=UserBatchResultDTO,
+            summary="Get many users by IDs and/or logins in one query",
+        )
         self.router.add_api_route(
             "/users/update",
             self.update_user,
@@ -54,11 +96,67 @@ class UserRoute:
             response_model=UserResponseDTO,
             summary="Update user data",
         )
+        self.router.add_api_route(
+            "/users/{user_id}",
+            self.patch_user,
+            methods=["PATCH"],
+            response_model=UserResponseDTO,
+            summary="Partially update user data (only the fields sent)",
+        )
+        self.router.add_api_route(
+            "/users/activate/{user_id}",
+            self.activate_user,
+            methods=["POST"],
+            response_model=UserResponseDTO,
+            summary="Activate user by ID",
+        )
+        self.router.add_api_route(
+            "/users/deactivate/{user_id}",
+            self.deactivate_user,
+            methods=["POST"],
+            response_model=UserResponseDTO,
+            summary="Deactivate user by ID",
+        )
+        self.router.add_api_route(
+            "/users/bulk_status",
+            self.set_users_status,
+            methods=["POST"],
+            response_model=UserBulkStatusResultDTO,
+            summary="Activate or deactivate users by IDs or filter in chunked batches",
+        )
         self.router.add_api_route(
             "/users/get_all",
             self.get_all_users,
             methods=["GET"],
-            summary="Get all users",
+            response_model=UserPageDTO,
+            summary="Get users page (keyset pagination) or stream all users as NDJSON",
+        )
+        self.router.add_api_route(
+            "/users/export",
+            self.export_users,
+            methods=["GET"],
+            summary="Stream the whole users table as CSV, NDJSON or Parquet",
+        )
+        self.router.add_api_route(
+            "/users/stats",
+            self.get_stats,
+            methods=["GET"],
+            response_model=UserStatsDTO,
+            summary="Total, active and today's signups counters",
+        )
+        self.router.add_api_route(
+            "/users/search",
+            self.search_users,
+            methods=["GET"],
+            response_model=UserSearchResultDTO,
+            summary="Search users by login, name or email (prefix, substring, fuzzy)",
+        )
+        self.router.add_api_route(
+            "/users/changes",
+            self.get_changes,
+            methods=["GET"],
+            response_model=UserChangesDTO,
+            summary="Incremental feed of user changes after the given event ID",
         )
 
         self.router.add_api_route(
@@ -92,7 +190,7 @@ class UserRoute:
         self,
         user_dto: UserCreateDTO,
         user_service: get_user_service_dep,
-    ) -> Optional[UserResponseDTO]:
+    ) -> Optional[Response]:
         logger.info("Request to create user with login: %s", user_dto.login)
         try:
             result_user = await user_service.create_user(user_dto)
@@ -102,14 +200,41 @@ class UserRoute:
 
         if result_user:
             logger.info("User successfully created: %s", result_user)
-            return result_user
+            return DTOResponse(result_user, status_code=201)
         return None
 
+    async def bulk_create_users(
+        self,
+        user_dtos: Annotated[
+            list[UserCreateDTO],
+            Body(min_length=1, max_length=service_settings.USERS_BULK_CREATE_MAX),
+        ],
+        user_service: get_user_service_dep,
+    ) -> Response:
+        logger.info("Request to bulk create %s users", len(user_dtos))
+        try:
+            result = await user_service.bulk_create_users(user_dtos)
+        except Exception as exc:
+            logger.error("Error bulk creating users: %s", str(exc))
+            raise
+        logger.info(
+            "Bulk create finished: %s created, %s duplicates, %s invalid",
+            result.created,
+            result.duplicates,
+            result.invalid,
+        )
+        return DTOResponse(result)
+
     async def get_user_by_id(
-        self, user_id: UUID | str, user_service: get_user_service_dep
-    ) -> UserResponseDTO:
+        self, user_id: UUID | str, request: Request, user_service: get_user_service_dep
+    ) -> Response:
         logger.info("Request to get user by ID: %s", user_id)
         try:
+            if has_validators(request):
+                version = await user_service.get_user_version(user_id=user_id)
+                if response := _not_modified_user(request, version):
+                    logger.info("User %s not modified", user_id)
+                    return response
             result_user = await user_service.get_user_by_id_or_login(user_id=user_id)
         except Exception as exc:
             logger.error("Error getting user: %s", str(exc))
@@ -117,34 +242,105 @@ class UserRoute:
         if not result_user:
             raise UserNotFoundHTTPException(message=f"User with ID {user_id} not found")
         logger.info("User found: %s", result_user.login)
-        return result_user
+        return _user_response(result_user)
 
     async def get_user_by_login(
-        self, user_login: str, user_service: get_user_service_dep
-    ) -> Optional[UserResponseDTO]:
+        self, user_login: str, request: Request, user_service: get_user_service_dep
+    ) -> Optional[Response]:
         logger.info("Request to get user by login: %s", user_login)
         try:
+            if has_validators(request):
+                version = await user_service.get_user_version(user_login=user_login)
+                if response := _not_modified_user(request, version):
+                    logger.info("User %s not modified", user_login)
+                    return response
             result_user = await user_service.get_user_by_id_or_login(user_login=user_login)
             if result_user:
                 logger.info("User found: %s", result_user.login)
-                return result_user
+                return _user_response(result_user)
             return None
         except UserNotFoundHTTPException as exc:
             logger.error("User with login %s not found: %s", user_login, exc)
             raise
 
+    async def get_users_batch(
+        self, batch_dto: UserBatchGetDTO, user_service: get_user_service_dep
+    ) -> Response:
+        logger.info(
+            "Request to get users batch: %s IDs, %s logins",
+            len(batch_dto.ids),
+            len(batch_dto.logins),
+        )
+        try:
+            result = await user_service.get_users_batch(batch_dto.ids, batch_dto.logins)
+        except Exception as exc:
+            logger.error("Error getting users batch: %s", str(exc))
+            raise
+        logger.info(
+            "Users batch retrieved: %s found, %s missing", len(result.users), len(result.missing)
+        )
+        return DTOResponse(result)
+
     async def update_user(
         self, user_dto: UserUpdateDTO, user_service: get_user_service_dep
-    ) -> UserResponseDTO:
+    ) -> Response:
         logger.info("Request to update user data: %s", user_dto.login)
         try:
             result_user = await user_service.update_user(user_dto)
             logger.info("User data for %s successfully updated", user_dto.login)
-            return result_user
+            return DTOResponse(result_user)
         except UserNotFoundHTTPException as exc:
             logger.error("Error updating user data %s: %s", user_dto.login, exc)
             raise
 
+    async def patch_user(
+        self, user_id: UUID, user_dto: UserUpdateDTO, user_service: get_user_service_dep
+    ) -> Response:
+        logger.info("Request to patch user with ID: %s", user_id)
+        try:
+            result = await user_service.patch_user(user_id, user_dto)
+            logger.info("User with ID %s successfully patched", user_id)
+            return DTOResponse(result)
+        except UserNotFoundHTTPException as exc:
+            logger.error("Error patching user with ID %s: %s", user_id, exc)
+            raise
+
+    async def activate_user(
+        self, user_id: UUID, user_service: get_user_service_dep
+    ) -> Response:
+        logger.info("Request to activate user with ID: %s", user_id)
+        try:
+            result = await user_service.activate_user(user_id)
+            logger.info("User with ID %s successfully activated", user_id)
+            return DTOResponse(result)
+        except UserNotFoundHTTPException as exc:
+            logger.error("Error activating user with ID %s: %s", user_id, exc)
+            raise
+
+    async def deactivate_user(
+        self, user_id: UUID, user_service: get_user_service_dep
+    ) -> Response:
+        logger.info("Request to deactivate user with ID: %s", user_id)
+        try:
+            result = await user_service.deactivate_user(user_id)
+            logger.info("User with ID %s successfully deactivated", user_id)
+            return DTOResponse(result)
+        except UserNotFoundHTTPException as exc:
+            logger.error("Error deactivating user with ID %s: %s", user_id, exc)
+            raise
+
+    async def set_users_status(
+        self, status_dto: UserBulkStatusDTO, user_service: get_user_service_dep
+    ) -> Response:
+        logger.info("Request to set is_active=%s for users in bulk", status_dto.is_active)
+        try:
+            result = await user_service.set_users_status(status_dto)
+        except Exception as exc:
+            logger.error("Error setting users status: %s", str(exc))
+            raise
+        logger.info("Users status changed for %s users", result.updated)
+        return DTOResponse(result)
+
     async def delete_user_by_id(self, user_id: UUID, user_service: get_user_service_dep) -> None:
         logger.info("Request to delete user with ID: %s", user_id)
         try:
@@ -169,13 +365,13 @@ class UserRoute:
         self,
         user_service: get_user_service_dep,
         form_data: form_data_depends,
-    ) -> UserResponseDTO | None:
+    ) -> Optional[Response]:
         logger.info("Request to log in user with login: %s", form_data.login)
         try:
             result_log_in = await user_service.log_in(form_data)
             if result_log_in:
                 logger.info("User logged in: %s", result_log_in.login)
-                return result_log_in
+                return DTOResponse(result_log_in)
 
             return None
         except Exception as exc:
@@ -185,12 +381,132 @@ class UserRoute:
     async def health_check(self) -> dict[str, str]:
         return {"status": "OK"}
 
-    async def get_all_users(self, user_service: get_user_service_dep) -> list[UserResponseDTO]:
-        logger.info("Request to get all users")
+    async def get_all_users(
+        self,
+        request: Request,
+        user_service: get_user_service_dep,
+        limit: Annotated[
+            int, Query(ge=1, le=service_settings.USERS_PAGE_SIZE_MAX)
+        ] = service_settings.USERS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        stream: bool = False,
+    ) -> Response:
+        if stream:
+            logger.info("Request to stream all users")
+            return StreamingResponse(
+                _ndjson_chunks(user_service.stream_all_users()),
+                media_type="application/x-ndjson",
+            )
+
+        logger.info("Request to get users page, limit: %s", limit)
         try:
-            result = await user_service.get_all_users()
-            logger.info("All users retrieved: %s", [user.login for user in result])
-            return result
+            if "if-none-match" in request.headers:
+                versions, has_more = await user_service.get_page_versions(limit, cursor)
+                etag = page_etag(versions, has_more)
+                # If-Modified-Since для страниц не учитывается: удаление пользователя
+                # меняет страницу, но не ее максимальный updated_at
+                if is_not_modified(request, etag, None):
+                    logger.info("Users page not modified")
+                    return not_modified(etag, last_modified(versions))
+            result = await user_service.get_all_users(limit=limit, cursor=cursor)
+            logger.info("Users page retrieved: %s users", len(result.items))
+            # id у DTO ответа — UUID | str, у версий из репозитория — UUID
+            page_versions = [(user.id, user.updated_at) for user in result.items]
+            return set_validators(
+                DTOResponse(result),
+                page_etag(page_versions, result.next_cursor is not None),
+                last_modified(page_versions),
+            )
         except Exception as e:
             logger.error("Error getting all users: %s", str(e))
             raise
+
+    async def export_users(
+        self,
+        user_service: get_user_service_dep,
+        export_format: Annotated[UserExportFormat, Query(alias="format")] = "csv",
+    ) -> Response:
+        logger.info("Request to export users as %s", export_format)
+        try:
+            chunks = user_service.export_users(export_format)
+        except Exception as e:
+            logger.error("Error exporting users: %s", str(e))
+            raise
+        return StreamingResponse(
+            chunks,
+            media_type=MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="users.{export_format}"'},
+        )
+
+    async def get_stats(self, user_service: get_user_service_dep) -> Response:
+        logger.info("Request to get users stats")
+        try:
+            result = await user_service.get_stats()
+            logger.info("Users stats: total %s, active %s", result.total, result.active)
+            return DTOResponse(result)
+        except Exception as e:
+            logger.error("Error getting users stats: %s", str(e))
+            raise
+
+    async def search_users(
+        self,
+        user_service: get_user_service_dep,
+        q: Annotated[
+            str, Query(min_length=service_settings.USERS_SEARCH_MIN_LENGTH, max_length=100)
+        ],
+        limit: Annotated[
+            int, Query(ge=1, le=service_settings.USERS_SEARCH_LIMIT_MAX)
+        ] = service_settings.USERS_SEARCH_LIMIT,
+        offset: Annotated[int, Query(ge=0, le=service_settings.USERS_SEARCH_OFFSET_MAX)] = 0,
+    ) -> Response:
+        logger.info("Request to search users, limit: %s, offset: %s", limit, offset)
+        try:
+            result = await user_service.search_users(q, limit=limit, offset=offset)
+            logger.info("Users found: %s", len(result.items))
+            return DTOResponse(result)
+        except Exception as e:
+            logger.error("Error searching users: %s", str(e))
+            raise
+
+    async def get_changes(
+        self,
+        user_service: get_user_service_dep,
+        since: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[
+            int, Query(ge=1, le=service_settings.USER_CHANGES_PAGE_SIZE_MAX)
+        ] = service_settings.USER_CHANGES_PAGE_SIZE,
+    ) -> Response:
+        logger.info("Request to get user changes since %s, limit: %s", since, limit)
+        try:
+            result = await user_service.get_changes(since, limit=limit)
+            logger.info("User changes retrieved: %s", len(result.items))
+            return DTOResponse(result)
+        except Exception as e:
+            logger.error("Error getting user changes: %s", str(e))
+            raise
+
+
+def _user_response(user: UserResponseDTO) -> Response:
+    return set_validators(
+        DTOResponse(user), user_etag(user.id, user.updated_at), user.updated_at
+    )
+
+
+def _not_modified_user(request: Request, version: Optional[Version]) -> Optional[Response]:
+    if version is None:
+        return None
+    etag = user_etag(*version)
+    if is_not_modified(request, etag, version[1]):
+        return not_modified(etag, version[1])
+    return None
+
+
+async def _ndjson_chunks(users: AsyncIterator[UserResponseDTO]) -> AsyncIterator[bytes]:
+    chunk: list[bytes] = []
+    async for user in users:
+        chunk.append(user.model_dump_json().encode())
+        if len(chunk) >= service_settings.USERS_STREAM_BATCH_SIZE:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
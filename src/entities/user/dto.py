@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Self
+from typing import Any, Literal, Optional, Self, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr
@@ -48,6 +48,114 @@ class UserResponseDTO(UserBaseDTO):
         exclude = {"password"}
 
 
+# Порядок колонок в строках Core-запросов на чтение (см. `to_user_response_dto_from_row`)
+USER_RESPONSE_FIELDS = tuple(UserResponseDTO.model_fields)
+
+
+class UserPageDTO(UserBaseDTO):
+    """DTO страницы пользователей (keyset-пагинация по created_at, id)"""
+
+    items: list[UserResponseDTO]
+    next_cursor: Optional[str] = None
+
+
+class UserSearchResultDTO(UserBaseDTO):
+    """DTO страницы результатов поиска пользователей (по релевантности)"""
+
+    items: list[UserResponseDTO]
+    next_offset: Optional[int] = None
+
+
+class UserStatsDTO(UserBaseDTO):
+    """DTO счетчиков пользователей"""
+
+    total: int
+    active: int
+    signups_today: int
+    reconciled_at: Optional[datetime] = None
+
+
+UserChangeEvent = Literal["created", "updated", "deleted"]
+UserExportFormat = Literal["csv", "ndjson", "parquet"]
+
+
+class UserChangeDTO(UserBaseDTO):
+    """DTO события изменения пользователя из outbox"""
+
+    id: int
+    seq: Optional[int] = None
+    event: UserChangeEvent
+    user_id: UUID
+    user: UserResponseDTO
+    occurred_at: datetime
+
+
+class UserChangesDTO(UserBaseDTO):
+    """DTO страницы ленты изменений (курсор — `seq` последнего события)"""
+
+    items: list[UserChangeDTO]
+    next_since: int
+
+
+class UserBulkCreateItemDTO(UserBaseDTO):
+    """DTO результата создания одного пользователя в пакете"""
+
+    index: int
+    login: str
+    status: Literal["created", "duplicate", "invalid"]
+    user: Optional[UserResponseDTO] = None
+    detail: Optional[str] = None
+
+
+class UserBulkCreateResultDTO(UserBaseDTO):
+    """DTO результата пакетного создания пользователей"""
+
+    created: int
+    duplicates: int
+    invalid: int
+    items: list[UserBulkCreateItemDTO]
+
+
+class UserBatchGetDTO(UserBaseDTO):
+    """DTO пакетного получения пользователей по ID и/или логинам"""
+
+    ids: list[UUID] = []
+    logins: list[str] = []
+
+
+class UserBatchResultDTO(UserBaseDTO):
+    """DTO результата пакетного получения пользователей"""
+
+    users: list[UserResponseDTO]
+    missing: list[str]
+
+
+class UserFilterDTO(UserBaseDTO):
+    """DTO фильтра пользователей для массовых операций"""
+
+    login_prefix: Optional[str] = None
+    email_domain: Optional[str] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+    def is_empty(self) -> bool:
+        return not any(self.model_dump().values())
+
+
+class UserBulkStatusDTO(UserBaseDTO):
+    """DTO массовой активации/деактивации по списку ID или фильтру"""
+
+    is_active: bool
+    ids: list[UUID] = []
+    filter: Optional[UserFilterDTO] = None
+
+
+class UserBulkStatusResultDTO(UserBaseDTO):
+    """DTO результата массовой смены статуса"""
+
+    updated: int
+
+
 class UserLoginDTO(UserBaseDTO):
     """DTO для входа пользователя"""
 
@@ -90,3 +198,14 @@ def to_user_response_dto(user_db: User | UserDBModel) -> UserResponseDTO:
         )
 
     return UserResponseDTO.model_validate(user_db)
+
+
+def to_user_response_dto_from_row(row: Sequence[Any]) -> UserResponseDTO:
+    """
+    DTO ответа из строки Core-запроса с колонками в порядке `USER_RESPONSE_FIELDS`
+
+    Без ORM-объекта и без валидации: значения прочитаны из БД и прошли
+    валидацию при записи.
+    """
+
+    return UserResponseDTO.model_construct(**dict(zip(USER_RESPONSE_FIELDS, row)))
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional, Sequence
 
 from fastapi import HTTPException, status
 
@@ -67,6 +67,24 @@ class HTTPNumberException(BaseHTTPValidationError):
         self.number = number
 
 
+class HTTPValidationErrors(BaseHTTPValidationError):
+    """Все нарушения правил валидации записи сразу, а не только первое."""
+
+    # Список нарушений `{"field", "message"}`, а не строка, как у HTTPException
+    detail: Any
+
+    def __init__(self, errors: Sequence[BaseHTTPValidationError]):
+        fields = dict.fromkeys(error.validation_field for error in errors)
+        super().__init__(", ".join(fields))
+        self.errors = list(errors)
+        self.detail = [
+            {"field": error.validation_field, "message": error.detail} for error in self.errors
+        ]
+
+    def __str__(self) -> str:
+        return "; ".join(str(error.detail) for error in self.errors)
+
+
 class HTTPSamePassword(HTTPException):
     def __init__(
         self,
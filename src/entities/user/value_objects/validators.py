@@ -1,16 +1,197 @@
-# import traceback
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional, Sequence
 
-# from pydantic import field_validator
-# from tools_openverse.common.abc.validation import AbstractValidation
-# from tools_openverse.common.logger_ import setup_logger
+from tools_openverse.common.logger_ import setup_logger
 
-# from src.entities.user.exc import (
-#     BaseHTTPValidationError,
-#     HTTPLengthException,
-#     HTTPNumberException,
-#     HTTPSymbolException,
-# )
+from src.entities.user.exc import (
+    BaseHTTPValidationError,
+    HTTPLengthException,
+    HTTPNumberException,
+    HTTPSymbolException,
+    HTTPValidationErrors,
+)
 
-# from .rules import ValidationRules
+from .rules import ValidationRules
 
-# logger = setup_logger(__name__)
+logger = setup_logger("user_entity")
+
+# Классы символов: одна битовая маска на символ
+DIGIT = 1
+SPECIAL = 2
+UPPER = 4
+LOWER = 8
+
+_CHAR_CACHE_LIMIT = 4096
+
+
+@dataclass(frozen=True)
+class FieldRules:
+    """Декларативные правила одного поля."""
+
+    field: str
+    label: str
+    min_length: int = 0
+    max_length: Optional[int] = None
+    forbidden: int = 0
+    required: int = 0
+
+
+USER_FIELD_RULES = (
+    FieldRules(
+        field="login",
+        label="Логин",
+        min_length=ValidationRules.MIN_LOGIN_LENGTH,
+        forbidden=SPECIAL,
+    ),
+    FieldRules(
+        field="name",
+        label="Имя",
+        min_length=ValidationRules.MIN_NAME_LENGTH,
+        max_length=ValidationRules.MAX_NAME_LENGTH,
+        forbidden=SPECIAL,
+    ),
+    FieldRules(
+        field="password",
+        label="Password",
+        min_length=ValidationRules.MIN_PASSWORD_LENGTH,
+        required=SPECIAL | DIGIT | UPPER | LOWER,
+    ),
+)
+
+
+class CompiledValidator:
+    """Набор правил, скомпилированный в проверку классов символов за один проход.
+
+    Для значения один раз собираются уникальные символы, каждому по таблице
+    соответствует битовая маска классов (цифра, спецсимвол, заглавная, строчная);
+    OR масок сразу дает ответ на все правила поля. Возвращаются все нарушения,
+    а не только первое.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[FieldRules] = USER_FIELD_RULES,
+        special: Iterable[str] = ValidationRules.BANNED_SYMBOLS,
+        digits: Iterable[str] = ValidationRules.NUMBERS,
+    ) -> None:
+        self._rules = {rule.field: rule for rule in rules}
+        self._special = frozenset(special)
+        self._digits = frozenset(digits)
+        self._table: dict[str, int] = {}
+        for char in self._special:
+            self._table[char] = self._classify(char)
+        for char in self._digits:
+            self._table[char] = self._classify(char)
+
+    def _classify(self, char: str) -> int:
+        bits = 0
+        if char in self._digits:
+            bits |= DIGIT
+        if char in self._special:
+            bits |= SPECIAL
+        if char.isupper():
+            bits |= UPPER
+        if char.islower():
+            bits |= LOWER
+        return bits
+
+    def _char_classes(self, value: str) -> int:
+        table = self._table
+        mask = 0
+        for char in set(value):
+            bits = table.get(char)
+            if bits is None:
+                bits = self._classify(char)
+                if len(table) < _CHAR_CACHE_LIMIT:
+                    table[char] = bits
+            mask |= bits
+        return mask
+
+    def check_field(self, field: str, value: str) -> list[BaseHTTPValidationError]:
+        rule = self._rules.get(field)
+        if rule is None:
+            return []
+
+        errors: list[BaseHTTPValidationError] = []
+        length = len(value)
+        if length < rule.min_length or (rule.max_length is not None and length > rule.max_length):
+            errors.append(
+                HTTPLengthException(rule.label, length=rule.min_length, max_length=rule.max_length)
+            )
+
+        mask = self._char_classes(value)
+        if rule.forbidden & SPECIAL and mask & SPECIAL:
+            errors.append(HTTPSymbolException(rule.label, set(self._special), must_have=False))
+
+        missing = rule.required & ~mask
+        if missing & SPECIAL:
+            errors.append(HTTPSymbolException(rule.label, set(self._special), must_have=True))
+        if missing & DIGIT:
+            errors.append(HTTPNumberException(rule.label, number=set(self._digits)))
+        if missing & UPPER:
+            errors.append(
+                BaseHTTPValidationError(
+                    validation_field=rule.label,
+                    message="Пароль должен содержать хотя бы один заглавный символ",
+                )
+            )
+        if missing & LOWER:
+            errors.append(
+                BaseHTTPValidationError(
+                    validation_field=rule.label,
+                    message="В пароле должен быть хотябы один строчный символ",
+                )
+            )
+        return errors
+
+    def check(self, record: Mapping[str, Any]) -> list[BaseHTTPValidationError]:
+        """Все нарушения для полей записи, к которым есть правила.
+
+        Значения не-строки пропускаются: их тип проверит pydantic.
+        """
+        errors: list[BaseHTTPValidationError] = []
+        for field in self._rules:
+            value = record.get(field)
+            if isinstance(value, str):
+                errors.extend(self.check_field(field, value))
+        return errors
+
+    def check_many(
+        self, records: Iterable[Mapping[str, Any]]
+    ) -> list[list[BaseHTTPValidationError]]:
+        """Пакетная проверка: список нарушений для каждой записи, в том же порядке.
+
+        Предупреждения о записях с нарушениями — построчные (`extra={"per_row": True}`).
+        """
+        results: list[list[BaseHTTPValidationError]] = []
+        for index, record in enumerate(records):
+            errors = self.check(record)
+            if errors:
+                logger.warning(
+                    "Ошибки валидации полей записи %s: %s",
+                    index,
+                    _error_fields(errors),
+                    extra={"per_row": True},
+                )
+            results.append(errors)
+        return results
+
+    def validate(self, record: Mapping[str, Any]) -> None:
+        errors = self.check(record)
+        if errors:
+            logger.warning("Ошибки валидации полей: %s", _error_fields(errors))
+            raise_validation_errors(errors)
+
+
+def _error_fields(errors: Sequence[BaseHTTPValidationError]) -> str:
+    return ", ".join(dict.fromkeys(error.validation_field for error in errors))
+
+
+def raise_validation_errors(errors: Sequence[BaseHTTPValidationError]) -> None:
+    """Одно нарушение — исходное исключение, несколько — `HTTPValidationErrors`."""
+    if len(errors) == 1:
+        raise errors[0]
+    raise HTTPValidationErrors(errors)
+
+
+user_validator = CompiledValidator()
@@ -0,0 +1,53 @@
+"""Импорт пользователей из CSV или NDJSON.
+
+Запуск:
+    python -m src.import_users users.csv --rejects users.rejects.csv
+
+Колонки (поля): `login`, `name`, `email`, `password`, необязательно `is_active`.
+Пароль — в открытом виде (будет захеширован) или готовый хеш `scrypt$...`.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from dataclasses import asdict
+from typing import Optional, cast
+
+from src.config import service_settings
+from src.infra.repository.db.base import dispose_engine, init_db, init_engine
+from src.usecases.importer import ImportFormat, import_users
+
+
+async def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=("csv", "ndjson"), default=None)
+    parser.add_argument("--rejects", default=None)
+    parser.add_argument("--batch-size", type=int, default=service_settings.USERS_IMPORT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=service_settings.USERS_IMPORT_WORKERS)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args(argv)
+
+    import_format = args.format
+    if import_format is None:
+        import_format = "ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv"
+    rejects_path = args.rejects or f"{os.path.splitext(args.path)[0]}.rejects.csv"
+
+    init_engine(args.database_url)
+    try:
+        await init_db()
+        report = await import_users(
+            args.path,
+            cast(ImportFormat, import_format),
+            rejects_path,
+            batch_size=args.batch_size,
+            workers=args.workers,
+        )
+    finally:
+        await dispose_engine()
+    print(json.dumps({**asdict(report), "rejected": report.rejected}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
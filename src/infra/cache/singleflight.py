@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Склеивание одновременных одинаковых запросов внутри процесса.
+
+    Пока выполняется вызов по ключу, остальные вызовы с тем же ключом не запускают
+    свой, а ждут результат (или исключение) уже начатого. Результат не кэшируется:
+    после завершения вызова следующий запрос снова идет в источник.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.requests += 1
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # shield: отмена одного ожидающего (разрыв соединения клиентом)
+        # не должна отменять вызов для остальных
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Помечаем исключение полученным, даже если все ожидающие были отменены
+            task.exception()
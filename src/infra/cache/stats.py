@@ -0,0 +1,110 @@
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from tools_openverse.common.logger_ import setup_logger
+
+from src.config import service_settings
+from src.entities.user.dto import UserStatsDTO
+
+logger = setup_logger("cache")
+
+# Счетчики регистраций по дням хранятся недолго: читается только сегодняшний
+SIGNUPS_TTL = 3 * 24 * 3600
+
+
+def _to_str(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class UserStats:
+    """Счетчики пользователей в Redis, обновляемые инкрементально.
+
+    `total` и `active` лежат в хэше `<prefix>:stats`, регистрации за день — в
+    `<prefix>:stats:signups:<YYYY-MM-DD>`. Чтение — один round-trip независимо от
+    размера таблицы. Возможный дрейф (ошибки Redis, гонки) исправляет периодическая
+    сверка с `COUNT(*)` через `reset`.
+    """
+
+    def __init__(self, redis: Redis, prefix: str = service_settings.USER_CACHE_PREFIX) -> None:
+        self._redis = redis
+        self._key = f"{prefix}:stats"
+        self._lock_key = f"{prefix}:stats:reconcile_lock"
+
+    def _signups_key(self, day: date) -> str:
+        return f"{self._key}:signups:{day.isoformat()}"
+
+    async def add(
+        self, total: int = 0, active: int = 0, signups: int = 0, day: Optional[date] = None
+    ) -> None:
+        if not (total or active or signups):
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                if total:
+                    pipe.hincrby(self._key, "total", total)
+                if active:
+                    pipe.hincrby(self._key, "active", active)
+                if signups:
+                    signups_key = self._signups_key(day or date.today())
+                    pipe.incrby(signups_key, signups)
+                    pipe.expire(signups_key, SIGNUPS_TTL)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Ошибка обновления счетчиков пользователей: %s", exc)
+
+    async def read(self, today: Optional[date] = None) -> Optional[UserStatsDTO]:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hgetall(self._key)
+                pipe.get(self._signups_key(today or date.today()))
+                counters, signups = await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Ошибка чтения счетчиков пользователей: %s", exc)
+            return None
+
+        counters = {_to_str(key): _to_str(value) for key, value in counters.items()}
+        if "total" not in counters:
+            return None
+        reconciled_at = counters.get("reconciled_at")
+        return UserStatsDTO(
+            total=int(counters["total"]),
+            active=int(counters.get("active", 0)),
+            signups_today=int(signups or 0),
+            reconciled_at=datetime.fromisoformat(reconciled_at) if reconciled_at else None,
+        )
+
+    async def reset(
+        self, total: int, active: int, signups_today: int, today: Optional[date] = None
+    ) -> None:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(
+                    self._key,
+                    mapping={
+                        "total": total,
+                        "active": active,
+                        "reconciled_at": datetime.now().isoformat(),
+                    },
+                )
+                pipe.set(self._signups_key(today or date.today()), signups_today, ex=SIGNUPS_TTL)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Ошибка сверки счетчиков пользователей: %s", exc)
+
+    async def acquire_reconcile_lock(self, ttl: int) -> bool:
+        """Сверку за интервал выполняет один экземпляр сервиса."""
+        try:
+            return bool(await self._redis.set(self._lock_key, "1", nx=True, ex=ttl))
+        except RedisError as exc:
+            logger.warning("Ошибка получения блокировки сверки счетчиков: %s", exc)
+            return False
+
+
+async def get_user_stats(request: Request) -> Optional[UserStats]:
+    redis: Optional[Redis] = getattr(request.app.state, "redis", None)
+    if redis is None or not service_settings.USER_STATS_ENABLED:
+        return None
+    return UserStats(redis)
@@ -0,0 +1,150 @@
+from typing import Optional, Sequence
+from uuid import UUID
+
+from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from tools_openverse.common.logger_ import setup_logger
+
+from src.config import service_settings
+from src.entities.user.dto import UserResponseDTO
+from src.infra.metrics import cache_requests_total
+
+logger = setup_logger("cache")
+
+
+class UserCache:
+    """Read-through кэш `UserResponseDTO` поверх Redis.
+
+    Пользователь хранится под двумя ключами: по ID и по логину. Ошибки Redis не
+    прерывают запрос — кэш просто считается промахнувшимся.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl: int = service_settings.USER_CACHE_TTL,
+        prefix: str = service_settings.USER_CACHE_PREFIX,
+    ) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._prefix = prefix
+
+    def id_key(self, user_id: UUID | str) -> str:
+        try:
+            user_id = UUID(str(user_id))
+        except ValueError:
+            pass
+        return f"{self._prefix}:id:{user_id}"
+
+    def login_key(self, user_login: str) -> str:
+        return f"{self._prefix}:login:{user_login}"
+
+    async def get(
+        self, user_id: Optional[UUID | str] = None, user_login: Optional[str] = None
+    ) -> Optional[UserResponseDTO]:
+        if user_id:
+            key = self.id_key(user_id)
+        elif user_login:
+            key = self.login_key(user_login)
+        else:
+            return None
+
+        try:
+            raw = await self._redis.get(key)
+        except RedisError as exc:
+            logger.warning("Ошибка чтения из кэша %s: %s", key, exc)
+            cache_requests_total.inc("error")
+            return None
+
+        if raw is None:
+            cache_requests_total.inc("miss")
+            return None
+        cache_requests_total.inc("hit")
+        return UserResponseDTO.model_validate_json(raw)
+
+    async def set(self, user: UserResponseDTO) -> None:
+        payload = user.model_dump_json()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.set(self.id_key(user.id), payload, ex=self._ttl)
+                pipe.set(self.login_key(user.login), payload, ex=self._ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Ошибка записи пользователя %s в кэш: %s", user.login, exc)
+
+    async def get_many(
+        self, user_ids: Sequence[UUID], user_logins: Sequence[str]
+    ) -> tuple[dict[UUID, UserResponseDTO], dict[str, UserResponseDTO]]:
+        keys = [self.id_key(user_id) for user_id in user_ids]
+        keys += [self.login_key(user_login) for user_login in user_logins]
+        if not keys:
+            return {}, {}
+
+        try:
+            values = await self._redis.mget(keys)
+        except RedisError as exc:
+            logger.warning("Ошибка пакетного чтения из кэша: %s", exc)
+            cache_requests_total.inc("error", amount=len(keys))
+            return {}, {}
+
+        by_id: dict[UUID, UserResponseDTO] = {}
+        by_login: dict[str, UserResponseDTO] = {}
+        for user_id, raw in zip(user_ids, values[: len(user_ids)]):
+            if raw is not None:
+                by_id[user_id] = UserResponseDTO.model_validate_json(raw)
+        for user_login, raw in zip(user_logins, values[len(user_ids) :]):
+            if raw is not None:
+                by_login[user_login] = UserResponseDTO.model_validate_json(raw)
+        hits = len(by_id) + len(by_login)
+        cache_requests_total.inc("hit", amount=hits)
+        cache_requests_total.inc("miss", amount=len(keys) - hits)
+        return by_id, by_login
+
+    async def set_many(self, users: Sequence[UserResponseDTO]) -> None:
+        if not users:
+            return
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user in users:
+                    payload = user.model_dump_json()
+                    pipe.set(self.id_key(user.id), payload, ex=self._ttl)
+                    pipe.set(self.login_key(user.login), payload, ex=self._ttl)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("Ошибка пакетной записи в кэш: %s", exc)
+
+    async def invalidate_many(self, users: Sequence[tuple[UUID | str, str]]) -> None:
+        keys = [self.id_key(user_id) for user_id, _ in users]
+        keys += [self.login_key(user_login) for _, user_login in users]
+        if not keys:
+            return
+
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as exc:
+            logger.warning("Ошибка пакетной инвалидации кэша: %s", exc)
+
+    async def invalidate(
+        self, user_id: Optional[UUID | str] = None, user_login: Optional[str] = None
+    ) -> None:
+        keys = []
+        if user_id:
+            keys.append(self.id_key(user_id))
+        if user_login:
+            keys.append(self.login_key(user_login))
+        if not keys:
+            return
+
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as exc:
+            logger.warning("Ошибка инвалидации кэша %s: %s", keys, exc)
+
+
+async def get_user_cache(request: Request) -> Optional[UserCache]:
+    redis: Optional[Redis] = getattr(request.app.state, "redis", None)
+    if redis is None or not service_settings.USER_CACHE_ENABLED:
+        return None
+    return UserCache(redis)
@@ -0,0 +1,56 @@
+from typing import Optional, Protocol, Sequence
+
+from redis.asyncio import Redis
+
+from src.config import service_settings
+from src.entities.user.dto import UserChangeDTO
+
+
+class ChangePublisher(Protocol):
+    async def publish(self, events: Sequence[UserChangeDTO]) -> None:
+        ...
+
+
+class RedisStreamPublisher:
+    """Публикация пачки событий в Redis Stream одним pipeline (XADD на событие).
+
+    Доставка «хотя бы один раз»: если релей упадет между XADD и отметкой в outbox,
+    пачка будет отправлена повторно. Потребители дедуплицируют по полю `id`.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        stream: str = service_settings.USER_OUTBOX_STREAM,
+        maxlen: Optional[int] = service_settings.USER_OUTBOX_STREAM_MAXLEN,
+    ) -> None:
+        self._redis = redis
+        self._stream = stream
+        self._maxlen = maxlen
+
+    async def publish(self, events: Sequence[UserChangeDTO]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(
+                    self._stream,
+                    {
+                        "id": event.id,
+                        "seq": str(event.seq),
+                        "event": event.event,
+                        "user_id": str(event.user_id),
+                        "payload": event.user.model_dump_json(),
+                    },
+                    maxlen=self._maxlen,
+                    approximate=True,
+                )
+            await pipe.execute()
+
+
+class InMemoryPublisher:
+    """Публикатор для тестов и локального запуска без Redis."""
+
+    def __init__(self) -> None:
+        self.events: list[UserChangeDTO] = []
+
+    async def publish(self, events: Sequence[UserChangeDTO]) -> None:
+        self.events.extend(events)
@@ -0,0 +1,139 @@
+import logging
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, Optional
+
+from src.config import service_settings
+from src.infra.metrics import registry
+
+HOT_PATH_LOGGERS = ("route", "service", "repository", "cache", "user_entity")
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler, который никогда не блокирует поток запроса.
+
+    Форматирование переносится в поток QueueListener, а при переполнении очереди
+    запись отбрасывается вместо ожидания.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class InfoRateLimitFilter(logging.Filter):
+    """Ограничение повторяющихся INFO-записей и фильтр построчных логов.
+
+    Построчные записи (`extra={"per_row": True}` — на каждую строку/элемент пакета)
+    отбрасываются, если `LOG_PER_ROW` выключен. Записи уровня INFO и ниже с одним
+    и тем же шаблоном сообщения пропускаются не чаще
+    `rate_per_second` в секунду и дополнительно сэмплируются с вероятностью
+    `sample_rate`. Остальные WARNING и выше проходят всегда.
+    """
+
+    def __init__(self, rate_per_second: int, sample_rate: float, per_row: bool) -> None:
+        super().__init__()
+        self._rate = rate_per_second
+        self._sample_rate = sample_rate
+        self._per_row = per_row
+        self._window = 0
+        self._counts: dict[tuple[str, object], int] = {}
+        self.dropped = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not self._per_row and getattr(record, "per_row", False):
+            self.dropped += 1
+            return False
+        if record.levelno > logging.INFO:
+            return True
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            self.dropped += 1
+            return False
+        if self._rate <= 0:
+            return True
+
+        window = int(time.monotonic())
+        if window != self._window:
+            self._window = window
+            self._counts.clear()
+        key = (record.name, record.msg)
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        if count > self._rate:
+            self.dropped += 1
+            return False
+        return True
+
+
+class LogPipeline:
+    """Перевод логгеров горячего пути на асинхронную запись через очередь."""
+
+    def __init__(self) -> None:
+        self._listener: Optional[QueueListener] = None
+        self.queue_handler: Optional[NonBlockingQueueHandler] = None
+        self.rate_filter: Optional[InfoRateLimitFilter] = None
+
+    def start(self, logger_names: Iterable[str] = HOT_PATH_LOGGERS) -> None:
+        if self._listener is not None:
+            return
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(
+            maxsize=service_settings.LOG_QUEUE_SIZE
+        )
+        self.queue_handler = NonBlockingQueueHandler(log_queue)
+        self.rate_filter = InfoRateLimitFilter(
+            rate_per_second=service_settings.LOG_INFO_RATE_LIMIT,
+            sample_rate=service_settings.LOG_INFO_SAMPLE_RATE,
+            per_row=service_settings.LOG_PER_ROW,
+        )
+        self.queue_handler.addFilter(self.rate_filter)
+
+        handlers: list[logging.Handler] = []
+        for name in logger_names:
+            logger = logging.getLogger(name)
+            level = service_settings.LOG_LEVELS.get(name)
+            if level:
+                logger.setLevel(level.upper())
+            for handler in logger.handlers[:]:
+                if handler not in handlers:
+                    handlers.append(handler)
+                logger.removeHandler(handler)
+            logger.addHandler(self.queue_handler)
+
+        if not handlers:
+            handlers.append(logging.StreamHandler())
+        self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "dropped_queue_full": self.queue_handler.dropped if self.queue_handler else 0,
+            "dropped_rate_limited": self.rate_filter.dropped if self.rate_filter else 0,
+        }
+
+
+log_pipeline = LogPipeline()
+registry.gauge(
+    "users_log_records_dropped",
+    "Log records dropped by the logging pipeline: queue_full, rate_limited",
+    ("reason",),
+    collect=lambda: {
+        (reason.removeprefix("dropped_"),): value for reason, value in log_pipeline.stats().items()
+    },
+)
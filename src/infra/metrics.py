@@ -0,0 +1,268 @@
+import functools
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Awaitable, Callable, Iterable, Optional, ParamSpec, Sequence, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        ...
+
+
+class Counter(Metric):
+    """Счетчик без блокировок.
+
+    Все записи идут из потока event loop, поэтому достаточно обычного словаря:
+    новая комбинация меток добавляется один раз, дальше только `+=`.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, value in list(self._values.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Gauge(Metric):
+    """Текущее значение; либо выставляется через `inc`/`dec`, либо читается из функции."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        values = self._collect() if self._collect is not None else self._values
+        lines = self.header()
+        for labels, value in list(values.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class _HistogramChild:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        # Корзины выделяются один раз на комбинацию меток
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Гистограмма с заранее выделенными корзинами.
+
+    `observe` — бинарный поиск корзины и три инкремента, без аллокаций и блокировок.
+    Накопительные значения `le` считаются только при отдаче `/metrics`.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[LabelValues, _HistogramChild] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        child = self._children.get(labels)
+        if child is None:
+            child = self._children.setdefault(labels, _HistogramChild(len(self.buckets) + 1))
+        child.counts[bisect_left(self.buckets, value)] += 1
+        child.sum += value
+        child.count += 1
+
+    def count(self, *labels: str) -> int:
+        child = self._children.get(labels)
+        return child.count if child is not None else 0
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        bounds = [*self.buckets, float("inf")]
+        for labels, child in list(self._children.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, child.counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{label_str} {child.count}")
+        return lines
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "users_http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "users_http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+)
+db_query_duration = registry.histogram(
+    "users_db_query_duration_seconds", "Repository query latency by method", ("method",)
+)
+db_query_errors_total = registry.counter(
+    "users_db_query_errors_total", "Repository calls that raised by method", ("method",)
+)
+db_pool_checkout_wait = registry.histogram(
+    "users_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection"
+)
+db_pool_hold = registry.histogram(
+    "users_db_pool_hold_seconds", "Time a connection stays checked out of the pool"
+)
+db_pool_in_use = registry.gauge("users_db_pool_connections_in_use", "Checked out connections")
+cache_requests_total = registry.counter(
+    "users_cache_requests_total", "User cache lookups by result", ("result",)
+)
+
+
+def timed_query(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Замер времени асинхронного метода репозитория в `users_db_query_duration_seconds`."""
+    method = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            db_query_errors_total.inc(method)
+            raise
+        finally:
+            db_query_duration.observe(time.perf_counter() - started, method)
+
+    return wrapper
+
+
+def _cache_hit_ratio() -> dict[LabelValues, float]:
+    hits = cache_requests_total.value("hit")
+    total = hits + cache_requests_total.value("miss")
+    return {(): hits / total} if total else {}
+
+
+registry.gauge("users_cache_hit_ratio", "User cache hits / lookups", collect=_cache_hit_ratio)
@@ -0,0 +1,60 @@
+import cProfile
+import hashlib
+import hmac
+import json
+import os
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Счетчик SQL-запросов профилируемого запроса; вне профилирования — None
+_query_counter: ContextVar[Optional[list[int]]] = ContextVar("query_counter", default=None)
+
+SIGNATURE_MAX_AGE = 300
+
+
+def count_queries(engine: AsyncEngine) -> None:
+    """Подсчет SQL-запросов для текущего профилируемого запроса."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _on_execute(*_: Any) -> None:
+        counter = _query_counter.get()
+        if counter is not None:
+            counter[0] += 1
+
+
+def start_query_count() -> list[int]:
+    counter = [0]
+    _query_counter.set(counter)
+    return counter
+
+
+def sign(secret: str, timestamp: int, path: str) -> str:
+    """Значение заголовка профилирования: `<timestamp>:<hmac_sha256(timestamp:path)>`."""
+    digest = hmac.new(secret.encode(), f"{timestamp}:{path}".encode(), hashlib.sha256)
+    return f"{timestamp}:{digest.hexdigest()}"
+
+
+def verify_signature(secret: str, header: str, path: str) -> bool:
+    timestamp, _, _ = header.partition(":")
+    if not secret or not timestamp.isdigit():
+        return False
+    if abs(time.time() - int(timestamp)) > SIGNATURE_MAX_AGE:
+        return False
+    return hmac.compare_digest(sign(secret, int(timestamp), path), header)
+
+
+def write_profile(directory: str, profiler: cProfile.Profile, meta: dict[str, Any]) -> str:
+    """Сохраняет pstats-профиль и JSON с метаданными рядом, возвращает путь к профилю."""
+    os.makedirs(directory, exist_ok=True)
+    route = re.sub(r"[^A-Za-z0-9]+", "_", meta["route"]).strip("_") or "root"
+    name = f"{int(time.time() * 1000)}_{meta['method']}_{route}_{meta['duration_ms']:.0f}ms"
+    path = os.path.join(directory, f"{name}.prof")
+    profiler.dump_stats(path)
+    with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as file:
+        json.dump(meta, file, ensure_ascii=False, indent=2)
+    return path
@@ -1,39 +1,110 @@
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 from tools_openverse.common.config import settings
+from tools_openverse.common.logger_ import setup_logger
 
-engine = None
-SessionLocal = None
+from src.config import service_settings
+from src.infra.profiling import count_queries
+from src.infra.repository.db.pool import engine_pool_options, instrument_pool
+from src.infra.repository.db.uow import UnitOfWork
 
-if settings.database_url:
-    print("-" * 100)
-    print(f"Initializing database engine with URL: {settings.database_url}")
-    print("-" * 100)
-    engine = create_async_engine(settings.database_url)
-    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
-else:
-    raise ValueError(f"Database URL not specified {settings.database_url}")
+logger = setup_logger("repository")
+
+engine: Optional[AsyncEngine] = None
+SessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
 
 
 class Base(DeclarativeBase):
     __abstract__ = True
 
 
-async def init_db() -> None:
-    if engine is None:
-        raise ValueError("Engine is not initialized.")
-    async with engine.begin() as conn:
-        # Атрибут для чистки базы данных
-        await conn.run_sync(Base.metadata.create_all)
+def engine_statement_options(database_url: str) -> dict[str, Any]:
+    """Кэши statement'ов: скомпилированный SQL в SQLAlchemy (`query_cache_size`) и
+    подготовленные запросы на соединение asyncpg (`prepared_statement_cache_size`).
+
+    За pgbouncer в режиме transaction подготовленные запросы не переживают смену
+    соединения: там `DB_PREPARED_STATEMENT_CACHE_SIZE=0`.
+    """
+    options: dict[str, Any] = {"query_cache_size": service_settings.DB_QUERY_CACHE_SIZE}
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": service_settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+def init_engine(database_url: Optional[str] = None) -> AsyncEngine:
+    """Создает движок и фабрику сессий при первом вызове (в lifespan), а не при импорте.
 
+    Повторные вызовы возвращают уже созданный движок.
+    """
+    global engine, SessionLocal
+    if engine is not None:
+        return engine
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    database_url = database_url or settings.database_url
+    if not database_url:
+        raise ValueError(f"Database URL not specified {database_url}")
+
+    logger.info(
+        "Initializing database engine with URL: %s",
+        make_url(database_url).render_as_string(hide_password=True),
+    )
+    engine = create_async_engine(
+        database_url,
+        **engine_pool_options(database_url),
+        **engine_statement_options(database_url),
+    )
+    instrument_pool(engine)
+    if service_settings.PROFILING_ENABLED:
+        count_queries(engine)
+    SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+    return engine
+
+
+def _session_factory() -> async_sessionmaker[AsyncSession]:
     if SessionLocal is None:
-        raise ValueError("SessionLocal is not initialized.")
-    db = SessionLocal()
-    try:
+        init_engine()
+    assert SessionLocal is not None
+    return SessionLocal
+
+
+async def init_db() -> None:
+    # Импорт здесь: схема тянет модели, а модели импортируют Base из этого модуля
+    from src.infra.repository.db.schema import ensure_schema
+
+    await ensure_schema(init_engine())
+
+
+async def dispose_engine() -> None:
+    global engine, SessionLocal
+    if engine is not None:
+        await engine.dispose()
+    engine = None
+    SessionLocal = None
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """Unit of work запроса; транзакции фиксирует сервис, здесь — только закрытие сессии."""
+    async with _session_factory()() as db:
+        yield UnitOfWork(db)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Отдельная сессия, не привязанная к жизненному циклу запроса (стриминг, фоновые задачи).
+
+    При успешном выходе изменения фиксируются, при исключении — откатываются.
+    """
+    async with _session_factory()() as db, UnitOfWork(db):
         yield db
-    finally:
-        await db.close()
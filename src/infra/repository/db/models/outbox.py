@@ -0,0 +1,42 @@
+import datetime
+import uuid
+from typing import Any
+
+from sqlalchemy import JSON, BigInteger, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.repository.db.base import Base
+
+
+class UserOutboxDBModel(Base):
+    """Событие изменения пользователя, записанное в одной транзакции с самим изменением."""
+
+    __tablename__ = "user_outbox"
+    __table_args__ = (
+        # Частичный индекс: релей читает только неопубликованные события
+        Index(
+            "ix_user_outbox_unpublished",
+            "id",
+            postgresql_where=text("published_at IS NULL"),
+            sqlite_where=text("published_at IS NULL"),
+        ),
+        Index("ix_user_outbox_created_at", "created_at"),
+        Index("ix_user_outbox_seq", "seq", unique=True),
+    )
+
+    # SQLite выдает автоинкремент только для INTEGER PRIMARY KEY
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event: Mapped[str] = mapped_column(String(16), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), nullable=False
+    )
+    published_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Номер в ленте изменений: выдается релеем после COMMIT изменения, по порядку
+    seq: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
@@ -0,0 +1,15 @@
+import datetime
+
+from sqlalchemy import DateTime, Integer, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.repository.db.base import Base
+
+
+class SchemaVersionDBModel(Base):
+    __tablename__ = "schema_version"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+    applied_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("CURRENT_TIMESTAMP"), nullable=False
+    )
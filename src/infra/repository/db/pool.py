@@ -0,0 +1,52 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.config import service_settings
+from src.infra.metrics import db_pool_checkout_wait, db_pool_hold, db_pool_in_use
+
+
+class MeteredAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания свободного соединения."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started)
+
+
+def engine_pool_options(database_url: str) -> dict[str, Any]:
+    """Параметры `create_async_engine` для пула с метриками.
+
+    SQLite в памяти работает на `StaticPool` с одним соединением, там ждать нечего.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": MeteredAsyncAdaptedQueuePool,
+        "pool_size": service_settings.DB_POOL_SIZE,
+        "max_overflow": service_settings.DB_MAX_OVERFLOW,
+    }
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """Счетчик выданных из пула соединений и время их удержания через события пула."""
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(_: Any, record: ConnectionPoolEntry, *__: Any) -> None:
+        record.info["checked_out_at"] = time.perf_counter()
+        db_pool_in_use.inc()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(_: Any, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            db_pool_hold.observe(time.perf_counter() - checked_out_at)
+        db_pool_in_use.dec()
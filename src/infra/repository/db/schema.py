@@ -0,0 +1,105 @@
+from typing import Optional
+
+from sqlalchemy import Connection, func, insert, inspect, select
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from tools_openverse.common.logger_ import setup_logger
+
+from src.infra.repository.db.base import Base
+from src.infra.repository.db.models.outbox import UserOutboxDBModel  # noqa: F401
+from src.infra.repository.db.models.schema_version import SchemaVersionDBModel
+from src.infra.repository.db.models.user import UserDBModel  # noqa: F401
+
+logger = setup_logger("repository")
+
+# Увеличивается при любом изменении таблиц, индексов или DIALECT_DDL
+SCHEMA_VERSION = 4
+
+# DDL, который не выражается метаданными SQLAlchemy, по диалектам.
+# Все выражения идемпотентны: повторный прогон не должен ничего ломать.
+DIALECT_DDL: dict[str, tuple[str, ...]] = {
+    "postgresql": (
+        # Поиск пользователей: триграммные GIN-индексы для ILIKE и similarity()
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_users_login_trgm ON users USING gin (login gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users USING gin (name gin_trgm_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING gin (email gin_trgm_ops)",
+    ),
+    "sqlite": (
+        # Поиск пользователей: FTS5 с триграммным токенизатором (SQLite >= 3.34),
+        # синхронизируется с users триггерами
+        "CREATE VIRTUAL TABLE IF NOT EXISTS users_search "
+        "USING fts5(id UNINDEXED, login, name, email, tokenize='trigram')",
+        "DELETE FROM users_search",
+        "INSERT INTO users_search (id, login, name, email) "
+        "SELECT id, login, name, email FROM users",
+        "CREATE TRIGGER IF NOT EXISTS users_search_ai AFTER INSERT ON users BEGIN "
+        "INSERT INTO users_search (id, login, name, email) "
+        "VALUES (new.id, new.login, new.name, new.email); END",
+        "CREATE TRIGGER IF NOT EXISTS users_search_ad AFTER DELETE ON users BEGIN "
+        "DELETE FROM users_search WHERE id = old.id; END",
+        "CREATE TRIGGER IF NOT EXISTS users_search_au "
+        "AFTER UPDATE OF login, name, email ON users BEGIN "
+        "UPDATE users_search SET login = new.login, name = new.name, email = new.email "
+        "WHERE id = old.id; END",
+    ),
+}
+
+
+# Переносы данных после изменения таблиц, для всех диалектов; тоже идемпотентны
+DATA_MIGRATIONS: tuple[str, ...] = (
+    # Уже опубликованные события получают номер в ленте, равный ID: курсоры
+    # потребителей, читавших ленту по ID, остаются верными
+    "UPDATE user_outbox SET seq = id WHERE seq IS NULL AND published_at IS NOT NULL",
+)
+
+
+async def current_schema_version(engine: AsyncEngine) -> Optional[int]:
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(select(func.max(SchemaVersionDBModel.version)))
+            return result.scalar()
+    except DBAPIError:
+        # Таблицы schema_version еще нет
+        return None
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    # create_all не меняет уже существующие таблицы; новые колонки должны быть nullable
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                )
+
+
+def _migrate(conn: Connection) -> None:
+    Base.metadata.create_all(conn)
+    _add_missing_columns(conn)
+    # create_all не добавляет индексы к уже существующим таблицам
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    for statement in (*DATA_MIGRATIONS, *DIALECT_DDL.get(conn.dialect.name, ())):
+        conn.exec_driver_sql(statement)
+
+
+async def ensure_schema(engine: AsyncEngine) -> None:
+    """Один запрос версии схемы при старте; `create_all` только если версия устарела."""
+    version = await current_schema_version(engine)
+    if version is not None and version >= SCHEMA_VERSION:
+        logger.info("Схема БД актуальна, версия %s", version)
+        return
+
+    logger.info("Обновление схемы БД с версии %s до %s", version, SCHEMA_VERSION)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(_migrate)
+            await conn.execute(insert(SchemaVersionDBModel).values(version=SCHEMA_VERSION))
+    except IntegrityError:
+        # Схему одновременно обновил другой экземпляр сервиса
+        logger.info("Схема БД версии %s уже применена другим экземпляром", SCHEMA_VERSION)
@@ -0,0 +1,38 @@
+from types import TracebackType
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """Граница транзакции поверх сессии.
+
+    Соединение берется из пула только при первом запросе к БД (autobegin сессии):
+    ответы из кэша пул не трогают. `async with uow:` фиксирует изменения при
+    успешном выходе и откатывает при исключении; в обоих случаях соединение сразу
+    возвращается в пул — до хеширования паролей и сериализации ответа. Репозитории
+    не коммитят: границы транзакций задает сервис.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -0,0 +1,123 @@
+from datetime import datetime
+from typing import Sequence, cast
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from tools_openverse.common.logger_ import setup_logger
+
+from src.entities.user.dto import UserChangeDTO, UserChangeEvent, UserResponseDTO
+from src.infra.metrics import timed_query
+from src.infra.repository.db.models.outbox import UserOutboxDBModel
+
+logger = setup_logger("repository")
+
+# Ключ advisory-блокировки релея на PostgreSQL
+RELAY_LOCK_KEY = 0x75736572
+
+
+def to_user_change_dto(event: UserOutboxDBModel) -> UserChangeDTO:
+    return UserChangeDTO(
+        id=event.id,
+        seq=event.seq,
+        event=cast(UserChangeEvent, event.event),
+        user_id=event.user_id,
+        # ID из колонки: в payload, собранном в SQL, формат UUID зависит от диалекта
+        user=UserResponseDTO.model_validate({**event.payload, "id": event.user_id}),
+        occurred_at=event.created_at,
+    )
+
+
+class OutboxRepository:
+    """Таблица `user_outbox`: события пишутся в сессии изменения и фиксируются
+    тем же COMMIT, что и сами данные пользователя.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, event: UserChangeEvent, users: Sequence[UserResponseDTO]) -> None:
+        """Добавляет события в текущую транзакцию, не фиксируя ее."""
+        if not users:
+            return
+        now = datetime.now()
+        rows = [
+            {
+                "user_id": user.id,
+                "event": event,
+                "payload": user.model_dump(mode="json"),
+                "created_at": now,
+            }
+            for user in users
+        ]
+        await self._session.execute(insert(UserOutboxDBModel), rows)
+
+    @timed_query
+    async def changes_since(self, since: int, limit: int) -> list[UserChangeDTO]:
+        """События с номером в ленте больше `since`, по возрастанию номера."""
+        stmt = (
+            select(UserOutboxDBModel)
+            .where(UserOutboxDBModel.seq > since)
+            .order_by(UserOutboxDBModel.seq)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [to_user_change_dto(event) for event in result.scalars()]
+
+    async def lock_relay(self) -> None:
+        """Сериализует релеи до конца транзакции.
+
+        На PostgreSQL — advisory-блокировка транзакции: следующий релей читает
+        последний `seq` только после COMMIT предыдущего. SQLite и так выполняет
+        записи по одной; повтор номера отсекает уникальный индекс.
+        """
+        if self._session.get_bind().dialect.name == "postgresql":
+            await self._session.execute(select(func.pg_advisory_xact_lock(RELAY_LOCK_KEY)))
+
+    @timed_query
+    async def last_seq(self) -> int:
+        result = await self._session.execute(select(func.max(UserOutboxDBModel.seq)))
+        return result.scalar() or 0
+
+    @timed_query
+    async def claim_unpublished(self, limit: int) -> list[UserChangeDTO]:
+        """Пачка неопубликованных событий, заблокированная до конца транзакции.
+
+        На PostgreSQL строки, уже взятые другим экземпляром релея, пропускаются
+        (SKIP LOCKED); на SQLite блокировка строк не поддерживается и опускается.
+        """
+        stmt = (
+            select(UserOutboxDBModel)
+            .where(UserOutboxDBModel.published_at.is_(None))
+            .order_by(UserOutboxDBModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(stmt)
+        return [to_user_change_dto(event) for event in result.scalars()]
+
+    @timed_query
+    async def mark_published(self, events: Sequence[UserChangeDTO]) -> None:
+        """Сохраняет выданные событиям номера в ленте и время публикации."""
+        now = datetime.now()
+        await self._session.execute(
+            update(UserOutboxDBModel),
+            [{"id": event.id, "seq": event.seq, "published_at": now} for event in events],
+        )
+
+    @timed_query
+    async def purge(self, before: datetime) -> int:
+        """Удаляет опубликованные события старше `before`.
+
+        Событие с наибольшим `seq` остается всегда: `last_seq` берет из него
+        последний выданный номер, и без него нумерация ленты начиналась бы
+        заново — читатели с курсором выше пропустили бы новые изменения.
+        """
+        max_seq = select(func.max(UserOutboxDBModel.seq)).scalar_subquery()
+        stmt = delete(UserOutboxDBModel).where(
+            UserOutboxDBModel.published_at.is_not(None),
+            UserOutboxDBModel.created_at < before,
+            UserOutboxDBModel.seq < max_seq,
+        )
+        result = await self._session.execute(stmt)
+        logger.info("Удалено %s опубликованных событий outbox", result.rowcount)
+        return result.rowcount
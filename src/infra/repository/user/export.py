@@ -0,0 +1,228 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import Row, select
+from tools_openverse.common.logger_ import setup_logger
+
+from src.entities.user.dto import UserExportFormat
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.db.models.user import UserDBModel
+
+from .exc import BaseUserHTTPException
+
+logger = setup_logger("repository")
+
+EXPORT_COLUMNS = ("id", "login", "name", "email", "is_active", "created_at", "updated_at")
+
+MEDIA_TYPES: dict[UserExportFormat, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Сколько блоков COPY может ждать отправки клиенту
+COPY_QUEUE_CHUNKS = 16
+
+# Булевы значения и даты в том же виде, что и при COPY на PostgreSQL (to_json)
+_PG_CSV_QUERY = (
+    "SELECT id, login, name, email, is_active::text AS is_active, "
+    "to_json(created_at) #>> '{}' AS created_at, to_json(updated_at) #>> '{}' AS updated_at "
+    "FROM users"
+)
+_PG_NDJSON_QUERY = (
+    "SELECT row_to_json(u)::text FROM "
+    "(SELECT id, login, name, email, is_active, created_at, updated_at FROM users) u"
+)
+
+
+def require_format_support(export_format: UserExportFormat) -> None:
+    """Проверка до начала ответа: без pyarrow Parquet недоступен."""
+    if export_format != "parquet":
+        return
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        logger.error("Экспорт в Parquet недоступен: не установлен pyarrow")
+        raise BaseUserHTTPException(
+            message="Экспорт в Parquet требует пакет pyarrow."
+        ) from exc
+
+
+def export_chunks(
+    dialect: str, export_format: UserExportFormat, batch_size: int
+) -> AsyncIterator[bytes]:
+    if dialect == "postgresql" and export_format == "csv":
+        return _copy_out(_PG_CSV_QUERY, format="csv", header=True)
+    if dialect == "postgresql" and export_format == "ndjson":
+        # CSV-режим COPY не экранирует обратные слэши, а управляющих символов
+        # \x01/\x02 в JSON нет (они экранируются), так что строки идут как есть
+        return _copy_out(_PG_NDJSON_QUERY, format="csv", quote="\x01", delimiter="\x02")
+    if export_format == "csv":
+        return _csv_chunks(batch_size)
+    if export_format == "ndjson":
+        return _ndjson_chunks(batch_size)
+    return _parquet_chunks(batch_size)
+
+
+async def _copy_out(query: str, **options: Any) -> AsyncIterator[bytes]:
+    """`COPY (query) TO STDOUT` через соединение asyncpg.
+
+    Блоки COPY передаются через ограниченную очередь: если клиент читает медленно,
+    чтение из PostgreSQL приостанавливается, и память не растет.
+    """
+    async with session_scope() as session:
+        conn = await session.connection()
+        raw = await conn.get_raw_connection()
+        driver_connection = raw.driver_connection
+        assert driver_connection is not None
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=COPY_QUEUE_CHUNKS)
+        copy = asyncio.create_task(
+            driver_connection.copy_from_query(query, output=queue.put, **options)
+        )
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait((getter, copy), return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    getter.cancel()
+                    break
+                yield getter.result()
+            while not queue.empty():
+                yield queue.get_nowait()
+            status = copy.result()
+            logger.info("Экспорт пользователей через COPY завершен: %s", status)
+        finally:
+            if not copy.done():
+                copy.cancel()
+
+
+async def _partitions(batch_size: int) -> AsyncIterator[Sequence[Row[Any]]]:
+    # Колонки Core без ORM-объектов; серверный курсор в собственной сессии,
+    # так как сессия запроса закрывается до отправки тела ответа
+    stmt = select(*(getattr(UserDBModel, name) for name in EXPORT_COLUMNS)).execution_options(
+        yield_per=batch_size
+    )
+    async with session_scope() as session:
+        result = await session.stream(stmt)
+        async for partition in result.partitions(batch_size):
+            yield partition
+
+
+def _text_row(row: Row[Any]) -> tuple[str, ...]:
+    user_id, login, name, email, is_active, created_at, updated_at = row
+    return (
+        str(user_id),
+        login,
+        name,
+        email,
+        "true" if is_active else "false",
+        created_at.isoformat(),
+        updated_at.isoformat(),
+    )
+
+
+async def _csv_chunks(batch_size: int) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    async for partition in _partitions(batch_size):
+        writer.writerows(_text_row(row) for row in partition)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _ndjson_chunks(batch_size: int) -> AsyncIterator[bytes]:
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    async for partition in _partitions(batch_size):
+        lines = []
+        for row in partition:
+            user_id, login, name, email, is_active, created_at, updated_at = row
+            lines.append(
+                encode(
+                    {
+                        "id": str(user_id),
+                        "login": login,
+                        "name": name,
+                        "email": email,
+                        "is_active": is_active,
+                        "created_at": created_at.isoformat(),
+                        "updated_at": updated_at.isoformat(),
+                    }
+                )
+            )
+        lines.append("")
+        yield "\n".join(lines).encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Файл для ParquetWriter, из которого записанные байты забираются по частям."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _utc(value: datetime) -> datetime:
+    # Наивные даты (SQLite) считаются локальным временем
+    return value.astimezone(timezone.utc)
+
+
+async def _parquet_chunks(batch_size: int) -> AsyncIterator[bytes]:
+    """Parquet пишется по группе строк на пачку; байты отдаются сразу после записи группы."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("id", pa.string()),
+            ("login", pa.string()),
+            ("name", pa.string()),
+            ("email", pa.string()),
+            ("is_active", pa.bool_()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("updated_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for partition in _partitions(batch_size):
+            user_ids, logins, names, emails, actives, created, updated = zip(*partition)
+            table = pa.Table.from_arrays(
+                [
+                    pa.array([str(user_id) for user_id in user_ids], pa.string()),
+                    pa.array(logins, pa.string()),
+                    pa.array(names, pa.string()),
+                    pa.array(emails, pa.string()),
+                    pa.array(actives, pa.bool_()),
+                    pa.array([_utc(value) for value in created], schema.field(5).type),
+                    pa.array([_utc(value) for value in updated], schema.field(6).type),
+                ],
+                schema=schema,
+            )
+            # Кодирование и сжатие отпускают GIL — выполняются вне event loop
+            await asyncio.to_thread(writer.write_table, table)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
@@ -0,0 +1,176 @@
+import datetime
+import uuid
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+)
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from tools_openverse.common.logger_ import setup_logger
+
+from src.infra.metrics import timed_query
+from src.infra.repository.db.models.outbox import UserOutboxDBModel
+from src.infra.repository.db.models.user import UserDBModel
+
+logger = setup_logger("repository")
+
+# Строка staging-таблицы: (id, login, name, email, password, is_active, created_at, line)
+StagedUser = tuple[uuid.UUID, str, str, str, str, bool, datetime.datetime, int]
+
+STAGING_COLUMNS = ("id", "login", "name", "email", "password", "is_active", "created_at", "line")
+
+SQLITE_DATETIME = "%Y-%m-%d %H:%M:%S.%f"
+
+# Отдельные метаданные: временная таблица не должна попасть в create_all схемы
+_staging_metadata = MetaData()
+users_import = Table(
+    "users_import",
+    _staging_metadata,
+    Column("id", UUID(as_uuid=True), primary_key=True),
+    Column("login", String, nullable=False),
+    Column("name", String, nullable=False),
+    Column("email", String, nullable=False),
+    Column("password", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("line", BigInteger, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+class UserImportStaging:
+    """Загрузка пользователей через временную таблицу `users_import`.
+
+    Все шаги идут в одной транзакции сессии: временная таблица видна только этому
+    соединению и удаляется вместе с ним. Строки попадают в `users` одним
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING, события outbox — вторым INSERT ... SELECT.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._dialect = session.get_bind().dialect.name
+        self._sqlite_insert = (
+            f"INSERT INTO {users_import.name} ({', '.join(STAGING_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in STAGING_COLUMNS)})"
+        )
+
+    async def create(self) -> None:
+        conn = await self._session.connection()
+        await conn.run_sync(lambda sync_conn: users_import.create(sync_conn, checkfirst=True))
+        await conn.execute(users_import.delete())
+
+    @timed_query
+    async def load(self, rows: Sequence[StagedUser]) -> None:
+        if not rows:
+            return
+        if self._dialect == "postgresql":
+            # Бинарный COPY через соединение asyncpg
+            conn = await self._session.connection()
+            raw = await conn.get_raw_connection()
+            driver_connection = raw.driver_connection
+            assert driver_connection is not None
+            await driver_connection.copy_records_to_table(
+                users_import.name, records=rows, columns=STAGING_COLUMNS
+            )
+            return
+        # Без построения параметров SQLAlchemy на каждую строку: значения приводятся
+        # к тому же виду, в котором их хранят типы UUID и DateTime на SQLite
+        conn = await self._session.connection()
+        await conn.exec_driver_sql(
+            self._sqlite_insert,
+            [
+                (
+                    user_id.hex,
+                    login,
+                    name,
+                    email,
+                    password,
+                    is_active,
+                    created_at.strftime(SQLITE_DATETIME),
+                    line,
+                )
+                for user_id, login, name, email, password, is_active, created_at, line in rows
+            ],
+        )
+
+    @timed_query
+    async def merge(self) -> int:
+        """Переносит строки staging в `users`, пропуская занятые логины и email.
+
+        Возвращает число добавленных пользователей. Транзакцию не фиксирует.
+        """
+        columns = ("id", "login", "name", "email", "password", "is_active", "created_at")
+        # WHERE true обязателен в SQLite: иначе ON CONFLICT после SELECT неоднозначен
+        source = select(
+            *(users_import.c[name] for name in columns),
+            users_import.c.created_at.label("updated_at"),
+        ).where(true())
+        stmt = (
+            pg_insert(UserDBModel)
+            .from_select([*columns, "updated_at"], source)
+            .on_conflict_do_nothing()
+        )
+        result = await self._session.execute(stmt)
+
+        # ID в staging новые (uuid4), поэтому строка в users с тем же ID — вставленная
+        inserted = (
+            select(
+                UserDBModel.id,
+                UserDBModel.login,
+                UserDBModel.name,
+                UserDBModel.email,
+                UserDBModel.is_active,
+                UserDBModel.created_at,
+                UserDBModel.updated_at,
+            )
+            .join(users_import, users_import.c.id == UserDBModel.id)
+            .subquery()
+        )
+        json_object = func.json_build_object if self._dialect == "postgresql" else func.json_object
+        payload = json_object(
+            "id", inserted.c.id,
+            "login", inserted.c.login,
+            "name", inserted.c.name,
+            "email", inserted.c.email,
+            "is_active", inserted.c.is_active,
+            "created_at", inserted.c.created_at,
+            "updated_at", inserted.c.updated_at,
+        )
+        await self._session.execute(
+            insert(UserOutboxDBModel).from_select(
+                ["user_id", "event", "payload", "created_at"],
+                select(
+                    inserted.c.id,
+                    literal("created"),
+                    payload,
+                    literal(datetime.datetime.now(), DateTime(timezone=True)),
+                ),
+            )
+        )
+        logger.info("Из staging добавлено %s пользователей", result.rowcount)
+        return result.rowcount
+
+    async def conflicts(self, batch_size: int) -> AsyncIterator[tuple[int, str, str]]:
+        """(строка, логин, email) записей staging, не попавших в `users` при merge."""
+        stmt = (
+            select(users_import.c.line, users_import.c.login, users_import.c.email)
+            .where(~select(UserDBModel.id).where(UserDBModel.id == users_import.c.id).exists())
+            .order_by(users_import.c.line)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(stmt)
+        async for line, login, email in result:
+            yield line, login, email
@@ -1,70 +1,250 @@
+import base64
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Any, AsyncIterator, Optional, Sequence
 from uuid import UUID
 
-from fastapi import Depends
-from sqlalchemy import delete, or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    Select,
+    bindparam,
+    case,
+    column,
+    delete,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from tools_openverse.common.logger_ import setup_logger
-from tools_openverse.common.models import LoginOAuth2PasswordRequestForm
 
-from src.entities.user.dto import UserResponseDTO, UserUpdateDTO, to_user_response_dto
+from src.entities.user.dto import (
+    USER_RESPONSE_FIELDS,
+    UserChangeDTO,
+    UserExportFormat,
+    UserFilterDTO,
+    UserPageDTO,
+    UserResponseDTO,
+    UserSearchResultDTO,
+    UserUpdateDTO,
+    to_user_response_dto,
+    to_user_response_dto_from_row,
+)
 from src.entities.user.entity import User
+from src.infra.metrics import timed_query
 from src.infra.repository.db.models.user import UserDBModel
+from src.infra.repository.outbox.outbox import OutboxRepository
 
-from ..db.base import get_db
+from ..db.base import session_scope
 from .exc import (
     AttributeAlreadyExists,
     BaseUserHTTPException,
-    InvalidCredentialsHTTPException,
     UserNotFoundHTTPException,
 )
+from .export import export_chunks, require_format_support
 
 logger = setup_logger("repository")
 
+# Ограничение PostgreSQL на число bind-параметров в одном запросе
+MAX_BIND_PARAMS = 32767
+
+# Чтение идет колонками ответа через Core, без ORM-объектов и колонки password;
+# ORM (RETURNING UserDBModel) остается для записи
+_USER_COLUMNS = tuple(getattr(UserDBModel, field) for field in USER_RESPONSE_FIELDS)
+
+# Горячие запросы собираются один раз, значения передаются bind-параметрами: на вызове
+# не строится конструкция select, а скомпилированный SQL берется из кэша движка
+_USER_BY_ID = select(*_USER_COLUMNS).where(UserDBModel.id == bindparam("user_id"))
+_USER_BY_LOGIN = select(*_USER_COLUMNS).where(UserDBModel.login == bindparam("user_login"))
+_CREDENTIALS_BY_LOGIN = select(*_USER_COLUMNS, UserDBModel.password).where(
+    UserDBModel.login == bindparam("user_login")
+)
+_VERSION_BY_ID = select(UserDBModel.id, UserDBModel.updated_at).where(
+    UserDBModel.id == bindparam("user_id")
+)
+_VERSION_BY_LOGIN = select(UserDBModel.id, UserDBModel.updated_at).where(
+    UserDBModel.login == bindparam("user_login")
+)
+
+
+def _conflicting_attribute(exc: IntegrityError) -> Optional[str]:
+    # asyncpg: 'duplicate key value violates unique constraint "ix_users_login"'
+    # sqlite: 'UNIQUE constraint failed: users.login'
+    # Смотрим только первую строку: в DETAIL PostgreSQL выводит само значение
+    message = str(exc.orig).splitlines()[0] if str(exc.orig) else ""
+    if "users_login" in message or "users.login" in message:
+        return "Логин"
+    if "users_email" in message or "users.email" in message:
+        return "Email"
+    return None
+
+
+def _filter_conditions(user_filter: UserFilterDTO) -> list[ColumnElement[bool]]:
+    conditions: list[ColumnElement[bool]] = []
+    if user_filter.login_prefix:
+        conditions.append(UserDBModel.login.startswith(user_filter.login_prefix, autoescape=True))
+    if user_filter.email_domain:
+        conditions.append(
+            UserDBModel.email.endswith(f"@{user_filter.email_domain}", autoescape=True)
+        )
+    if user_filter.created_after:
+        conditions.append(UserDBModel.created_at >= user_filter.created_after)
+    if user_filter.created_before:
+        conditions.append(UserDBModel.created_at < user_filter.created_before)
+    return conditions
+
+
+def _search_postgresql(query: str) -> Select[Any]:
+    # Подстрока (ILIKE) и нечеткое совпадение (pg_trgm %), оба по GIN-индексам;
+    # выше — совпадение по началу логина/email, дальше — по триграммной близости
+    columns = (UserDBModel.login, UserDBModel.name, UserDBModel.email)
+    matches = or_(
+        *(field.icontains(query, autoescape=True) for field in columns),
+        *(field.op("%")(query) for field in columns),
+    )
+    similarity = func.greatest(*(func.similarity(field, query) for field in columns))
+    login_prefix = case((UserDBModel.login.istartswith(query, autoescape=True), 2.0), else_=0.0)
+    email_prefix = case((UserDBModel.email.istartswith(query, autoescape=True), 1.0), else_=0.0)
+    rank = similarity + login_prefix + email_prefix
+    return select(*_USER_COLUMNS).where(matches).order_by(rank.desc(), UserDBModel.id)
+
+
+def _search_sqlite(query: str) -> Select[Any]:
+    # FTS5 с триграммным токенизатором: фраза в кавычках ищется как подстрока
+    users_search = table("users_search", column("id"))
+    phrase = '"' + query.replace('"', '""') + '"'
+    prefix_rank = case(
+        (UserDBModel.login.istartswith(query, autoescape=True), 0),
+        (UserDBModel.email.istartswith(query, autoescape=True), 1),
+        else_=2,
+    )
+    return (
+        select(*_USER_COLUMNS)
+        .join(users_search, users_search.c.id == UserDBModel.id)
+        .where(literal_column("users_search").match(phrase))
+        .order_by(prefix_rank, func.bm25(literal_column("users_search")), UserDBModel.id)
+    )
+
+
+def _page_query(stmt: Select[Any], limit: int, cursor: Optional[str]) -> Select[Any]:
+    # Keyset-пагинация по (created_at, id); лишняя строка — признак следующей страницы
+    stmt = stmt.order_by(UserDBModel.created_at, UserDBModel.id).limit(limit + 1)
+    if cursor:
+        created_at, user_id = decode_cursor(cursor)
+        after = tuple_(
+            literal(created_at, UserDBModel.created_at.type),
+            literal(user_id, UserDBModel.id.type),
+        )
+        stmt = stmt.where(tuple_(UserDBModel.created_at, UserDBModel.id) > after)
+    return stmt
+
+
+def encode_cursor(created_at: datetime, user_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, user_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(user_id)
+    except ValueError as exc:
+        logger.error("Некорректный курсор пагинации: %s", cursor)
+        raise BaseUserHTTPException(message="Некорректный курсор пагинации.") from exc
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
+        # События изменений пишутся в той же сессии и фиксируются тем же COMMIT,
+        # который выполняет unit of work сервиса
+        self._outbox = OutboxRepository(session)
 
+    @timed_query
     async def create(self, user: User) -> UserResponseDTO:
-        logger.info("Добавление нового пользователя в базу данных: %s", user.login)
-        stmt = insert(UserDBModel).values(
-            id=user.id,
-            login=user.login,
-            name=user.name,
-            email=user.email,
-            password=user.password,
-            created_at=user.created_at,
-            updated_at=user.created_at,
-        )
-
-        await self._session.execute(stmt)
-        await self._session.commit()
-        logger.info("Пользователь %s успешно добавлен в базу данных", user.login)
-        return to_user_response_dto(user)
+        """Создание одним INSERT ... RETURNING.
 
-    async def get_exists_user_db(self, user: User) -> bool:
-        stmt = select(UserDBModel).filter(
-            or_(UserDBModel.login == user.login, UserDBModel.email == user.email)
+        Уникальность логина и email проверяет сама БД: нарушение индекса
+        преобразуется в `AttributeAlreadyExists`, без предварительного SELECT.
+        """
+        logger.info("Добавление нового пользователя в базу данных: %s", user.login)
+        stmt = (
+            insert(UserDBModel)
+            .values(
+                id=user.id,
+                login=user.login,
+                name=user.name,
+                email=user.email,
+                password=user.password,
+                is_active=user.is_active,
+                created_at=user.created_at,
+                updated_at=user.created_at,
+            )
+            .returning(UserDBModel)
         )
 
-        result = await self._session.execute(stmt)
-        user_db = result.scalars().first()
-
-        if user_db:
-            if user.login == user_db.login:
-                logger.error("Пользователь с таким логином: %s уже существует", user.login)
-                raise AttributeAlreadyExists(attribute="Логин")
-            if user.email == user_db.email:
-                logger.error("Пользователь с таким email: %s уже существует", user.email)
-                raise AttributeAlreadyExists(attribute="Email")
+        try:
+            result = await self._session.execute(stmt)
+            created_user = to_user_response_dto(result.scalar_one())
+            await self._outbox.add("created", [created_user])
+        except IntegrityError as exc:
+            attribute = _conflicting_attribute(exc)
+            if attribute is None:
+                raise
+            logger.error("%s пользователя %s уже существует", attribute, user.login)
+            raise AttributeAlreadyExists(attribute=attribute) from exc
 
-            return True
+        logger.info("Пользователь %s успешно добавлен в базу данных", user.login)
+        return created_user
+
+    @timed_query
+    async def bulk_create(self, users: Sequence[User]) -> list[UserResponseDTO]:
+        """Пакетная вставка одним INSERT ... ON CONFLICT DO NOTHING RETURNING.
+
+        Возвращает только реально созданных пользователей: строки, конфликтующие по
+        логину или email с уже существующими, пропускаются.
+        """
+        logger.info("Пакетное добавление %s пользователей в базу данных", len(users))
+        rows = [
+            {
+                "id": user.id,
+                "login": user.login,
+                "name": user.name,
+                "email": user.email,
+                "password": user.password,
+                "is_active": user.is_active,
+                "created_at": user.created_at,
+                "updated_at": user.created_at,
+            }
+            for user in users
+        ]
+        if not rows:
+            return []
+
+        created: list[UserResponseDTO] = []
+        chunk_size = MAX_BIND_PARAMS // len(rows[0])
+        for start in range(0, len(rows), chunk_size):
+            stmt = (
+                insert(UserDBModel)
+                .values(rows[start : start + chunk_size])
+                .on_conflict_do_nothing()
+                .returning(UserDBModel)
+            )
+            result = await self._session.execute(stmt)
+            created.extend(to_user_response_dto(db_user) for db_user in result.scalars())
 
-        return False
+        await self._outbox.add("created", created)
+        logger.info("Добавлено %s из %s пользователей", len(created), len(rows))
+        return created
 
+    @timed_query
     async def find_user_by_id_or_login(
         self, user_id: Optional[UUID | str] = None, user_login: Optional[str] = None
     ) -> UserResponseDTO | None:
@@ -76,38 +256,135 @@ class UserRepository:
         if user_id:
             if isinstance(user_id, str):
                 user_id = UUID(user_id)
-        stmt = select(UserDBModel)
-        if user_id:
-            stmt = stmt.where(UserDBModel.id == user_id)
-        elif user_login:
-            stmt = stmt.where(UserDBModel.login == user_login)
-
-        result = await self._session.execute(stmt)
-        db_user = result.scalar_one_or_none()
+            result = await self._session.execute(_USER_BY_ID, {"user_id": user_id})
+        else:
+            result = await self._session.execute(_USER_BY_LOGIN, {"user_login": user_login})
+        row = result.one_or_none()
 
-        if not db_user:
+        if not row:
             logger.error("Пользователь не найден. ID: %s, Логин: %s", user_id, user_login)
             raise UserNotFoundHTTPException(user_id=user_id, user_login=user_login)
 
-        logger.info("Пользователь найден: %s", db_user.login)
-        return to_user_response_dto(db_user)
+        logger.info("Пользователь найден: %s", row.login)
+        return to_user_response_dto_from_row(row)
+
+    @timed_query
+    async def find_version(
+        self, user_id: Optional[UUID | str] = None, user_login: Optional[str] = None
+    ) -> Optional[tuple[UUID, datetime]]:
+        """Только (id, updated_at) — для проверки ETag без загрузки всей строки."""
+        if user_id:
+            result = await self._session.execute(_VERSION_BY_ID, {"user_id": UUID(str(user_id))})
+        elif user_login:
+            result = await self._session.execute(_VERSION_BY_LOGIN, {"user_login": user_login})
+        else:
+            raise BaseUserHTTPException(message="Должен быть ID пользователя или Логин.")
+        row = result.one_or_none()
+        return (row.id, row.updated_at) if row else None
+
+    @timed_query
+    async def find_many(
+        self, user_ids: Sequence[UUID], user_logins: Sequence[str]
+    ) -> list[UserResponseDTO]:
+        logger.info(
+            "Пакетный поиск пользователей: %s ID, %s логинов", len(user_ids), len(user_logins)
+        )
+        conditions = []
+        if user_ids:
+            conditions.append(UserDBModel.id.in_(user_ids))
+        if user_logins:
+            conditions.append(UserDBModel.login.in_(user_logins))
+        if not conditions:
+            return []
+
+        result = await self._session.execute(select(*_USER_COLUMNS).where(or_(*conditions)))
+        users = [to_user_response_dto_from_row(row) for row in result]
+        logger.info("Найдено %s пользователей", len(users))
+        return users
 
+    @timed_query
     async def update(self, user: UserUpdateDTO) -> UserResponseDTO:
         logger.info("Обновление данных пользователя: %s", user.login)
-        if not any([user.login, user.password, user.name, user.email]):
+        changes = user.model_dump(exclude={"login"}, exclude_none=True)
+        if not user.login or not changes:
             logger.error("Не переданы данные для обновления пользователя")
             raise BaseUserHTTPException(message="Не переданы данные для обновления.")
 
         stmt = (
             update(UserDBModel)
             .where(UserDBModel.login == user.login)
-            .values(
-                login=user.login,
-                name=user.name,
-                email=user.email,
-                password=user.password,
-                updated_at=datetime.now(),
+            .values(**changes, updated_at=datetime.now())
+            .returning(UserDBModel)
+        )
+        db_user = await self._execute_write(stmt)
+
+        if not db_user:
+            logger.error("Пользователь с логином %s не найден для обновления", user.login)
+            raise UserNotFoundHTTPException(user_id=None, user_login=user.login)
+
+        updated_user = to_user_response_dto(db_user)
+        await self._outbox.add("updated", [updated_user])
+        logger.info("Данные пользователя %s успешно обновлены", user.login)
+        return updated_user
+
+    @timed_query
+    async def patch(self, user_id: UUID | str, changes: dict[str, Any]) -> UserResponseDTO:
+        """Частичное обновление: пишутся только переданные колонки.
+
+        Если ни одно значение не отличается от текущего, UPDATE не затрагивает строку
+        (условие IS DISTINCT FROM), и возвращается текущее состояние пользователя.
+        """
+        user_id = UUID(str(user_id))
+        logger.info("Частичное обновление пользователя %s: %s", user_id, sorted(changes))
+        if changes:
+            stmt = (
+                update(UserDBModel)
+                .where(
+                    UserDBModel.id == user_id,
+                    or_(
+                        *(
+                            getattr(UserDBModel, field).is_distinct_from(value)
+                            for field, value in changes.items()
+                        )
+                    ),
+                )
+                .values(**changes, updated_at=datetime.now())
+                .returning(UserDBModel)
             )
+            db_user = await self._execute_write(stmt)
+            if db_user:
+                updated_user = to_user_response_dto(db_user)
+                await self._outbox.add("updated", [updated_user])
+                logger.info("Пользователь %s частично обновлен", user_id)
+                return updated_user
+
+        logger.info("Данные пользователя %s не изменились, запись пропущена", user_id)
+        current_user = await self.find_user_by_id_or_login(user_id=user_id)
+        if current_user is None:
+            raise UserNotFoundHTTPException(user_id=user_id)
+        return current_user
+
+    async def _execute_write(self, stmt: Executable) -> Optional[UserDBModel]:
+        try:
+            result = await self._session.execute(stmt)
+            return result.scalar_one_or_none()
+        except IntegrityError as exc:
+            attribute = _conflicting_attribute(exc)
+            if attribute is None:
+                raise
+            logger.error("%s уже занят другим пользователем", attribute)
+            raise AttributeAlreadyExists(attribute=attribute) from exc
+
+    @timed_query
+    async def set_active(
+        self, user_id: UUID | str, is_active: bool
+    ) -> tuple[UserResponseDTO, bool]:
+        """Возвращает пользователя и признак того, что статус действительно изменился."""
+        logger.info("Смена статуса пользователя %s: is_active=%s", user_id, is_active)
+        stmt = (
+            update(UserDBModel)
+            .where(UserDBModel.id == UUID(str(user_id)), UserDBModel.is_active.is_not(is_active))
+            .values(is_active=is_active, updated_at=datetime.now())
             .returning(UserDBModel)
         )
 
@@ -115,15 +392,60 @@ class UserRepository:
         db_user = result.scalar_one_or_none()
 
         if not db_user:
-            logger.error("Пользователь с логином %s не найден для обновления", user.login)
-            raise UserNotFoundHTTPException(user_id=None, user_login=user.login)
+            # Статус уже такой (или пользователя нет — тогда UserNotFound)
+            current = await self.find_user_by_id_or_login(user_id=UUID(str(user_id)))
+            if current is None:
+                raise UserNotFoundHTTPException(user_id=user_id)
+            logger.info("Статус пользователя %s не изменился: is_active=%s", user_id, is_active)
+            return current, False
+
+        updated_user = to_user_response_dto(db_user)
+        await self._outbox.add("updated", [updated_user])
+        logger.info("Статус пользователя %s изменен: is_active=%s", user_id, is_active)
+        return updated_user, True
+
+    @timed_query
+    async def set_active_by_ids(
+        self, is_active: bool, user_ids: Sequence[UUID]
+    ) -> list[tuple[UUID, str]]:
+        """Смена статуса по списку ID; возвращает (ID, логин) измененных пользователей."""
+        return await self._set_active_where(is_active, UserDBModel.id.in_(user_ids))
+
+    @timed_query
+    async def set_active_by_filter(
+        self, is_active: bool, user_filter: UserFilterDTO, limit: int
+    ) -> list[tuple[UUID, str]]:
+        """Смена статуса не более чем у `limit` пользователей под фильтром.
+
+        Затрагиваются только пользователи, у которых статус действительно меняется,
+        поэтому повторные вызовы проходят фильтр пачками до пустого результата.
+        """
+        chunk_ids = (
+            select(UserDBModel.id)
+            .where(*_filter_conditions(user_filter), UserDBModel.is_active.is_not(is_active))
+            .limit(limit)
+            .scalar_subquery()
+        )
+        return await self._set_active_where(is_active, UserDBModel.id.in_(chunk_ids))
 
-        logger.info("Данные пользователя %s успешно обновлены", user.login)
-        return to_user_response_dto(db_user)
+    async def _set_active_where(
+        self, is_active: bool, condition: ColumnElement[bool]
+    ) -> list[tuple[UUID, str]]:
+        stmt = (
+            update(UserDBModel)
+            .where(condition, UserDBModel.is_active.is_not(is_active))
+            .values(is_active=is_active, updated_at=datetime.now())
+            .returning(UserDBModel)
+        )
+        result = await self._session.execute(stmt)
+        changed = [to_user_response_dto(db_user) for db_user in result.scalars()]
+        await self._outbox.add("updated", changed)
+        return [(UUID(str(user.id)), user.login) for user in changed]
 
+    @timed_query
     async def delete(
         self, user_id: Optional[UUID] = None, user_login: Optional[str] = None
-    ) -> None:
+    ) -> UserResponseDTO:
         logger.info("Удаление пользователя с ID: %s или логином: %s", user_id, user_login)
         if not user_login and not user_id:
             logger.error("Не указан ID пользователя или Логин для удаления")
@@ -131,65 +453,146 @@ class UserRepository:
                 message="Должен быть введен хотя бы ID пользователя либо Логин."
             )
 
-        stmt = delete(UserDBModel).where(
-            or_(UserDBModel.id == user_id, UserDBModel.login == user_login)
+        stmt = (
+            delete(UserDBModel)
+            .where(or_(UserDBModel.id == user_id, UserDBModel.login == user_login))
+            .returning(UserDBModel)
         )
 
         result = await self._session.execute(stmt)
+        db_user = result.scalars().first()
 
-        if result.rowcount == 0:
+        if not db_user:
             logger.error(
                 "Пользователь не найден для удаления. ID: %s, Логин: %s", user_id, user_login
             )
             raise UserNotFoundHTTPException(user_id=user_id, user_login=user_login)
 
-        await self._session.commit()
+        deleted_user = to_user_response_dto(db_user)
+        await self._outbox.add("deleted", [deleted_user])
         logger.info("Пользователь с ID: %s или логином: %s успешно удален", user_id, user_login)
+        return deleted_user
 
-    async def get_all_users(self) -> Sequence[UserDBModel]:
-        logger.info("Получение всех пользователей из базы данных")
-        stmt = select(UserDBModel)
+    @timed_query
+    async def get_users_page(self, limit: int, cursor: Optional[str] = None) -> UserPageDTO:
+        logger.info("Получение страницы пользователей: limit=%s, cursor=%s", limit, cursor)
+        stmt = _page_query(select(*_USER_COLUMNS), limit, cursor)
         result = await self._session.execute(stmt)
-        users = result.scalars().all()
-        if users:
-            logger.info("Получено %s пользователей", len(users))
-            for user in users:
-                print(user)
-        return users
-
-    async def log_in(self, form_data: LoginOAuth2PasswordRequestForm) -> Optional[UserResponseDTO]:
-        logger.info("Получение пользователя из базы данных")
-        try:
-            stmt = select(UserDBModel).filter(UserDBModel.login == form_data.login)
-            result = await self._session.execute(stmt)
-            db_user = result.scalar_one_or_none()
-
-            if not db_user:
-                raise UserNotFoundHTTPException(
-                    message=f"User with login: {form_data.login} not found"
-                )
-
-            if db_user.password != form_data.password:
-                raise InvalidCredentialsHTTPException(
-                    message=f"Password: {form_data.password} incorrect"
-                )
+        rows = result.all()
 
-            return UserResponseDTO(
-                id=db_user.id,
-                login=db_user.login,
-                name=db_user.name,
-                email=db_user.email,
-                created_at=db_user.created_at,
-                updated_at=db_user.updated_at,
-                is_active=db_user.is_active,
-            )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
 
-        except Exception as exc:
-            logger.error("Ошибка при получении пользователя из базы данных: %s", str(exc))
-            raise
+        logger.info("Получено %s пользователей", len(rows))
+        return UserPageDTO(
+            items=[to_user_response_dto_from_row(row) for row in rows], next_cursor=next_cursor
+        )
 
+    async def get_changes(self, since: int, limit: int) -> list[UserChangeDTO]:
+        """Лента изменений по курсору — `seq` последнего прочитанного события.
+
+        В ленте только события, которым релей outbox уже выдал номер: номера идут в
+        порядке COMMIT, и событие не может появиться позади курсора.
+        """
+        logger.info("Получение изменений пользователей: since=%s, limit=%s", since, limit)
+        return await self._outbox.changes_since(since, limit=limit)
+
+    @timed_query
+    async def get_page_versions(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> tuple[list[tuple[UUID, datetime]], bool]:
+        """(id, updated_at) пользователей страницы и признак следующей — для ETag страницы."""
+        stmt = _page_query(select(UserDBModel.id, UserDBModel.updated_at), limit, cursor)
+        result = await self._session.execute(stmt)
+        versions = [(user_id, updated_at) for user_id, updated_at in result.all()]
+        return versions[:limit], len(versions) > limit
+
+    @timed_query
+    async def count_stats(self, since: datetime) -> tuple[int, int, int]:
+        """Всего пользователей, активных и созданных начиная с `since` — одним запросом."""
+        stmt = select(
+            func.count(),
+            func.count().filter(UserDBModel.is_active.is_(True)),
+            func.count().filter(UserDBModel.created_at >= since),
+        ).select_from(UserDBModel)
+        result = await self._session.execute(stmt)
+        total, active, signups = result.one()
+        logger.info("Пересчет пользователей: всего %s, активных %s", total, active)
+        return total, active, signups
+
+    @timed_query
+    async def search(self, query: str, limit: int, offset: int = 0) -> UserSearchResultDTO:
+        """Поиск по логину, имени и email: подстрока и начало строки, на PostgreSQL
+        еще и нечеткое совпадение. Результаты отсортированы по релевантности.
+        """
+        logger.info("Поиск пользователей: limit=%s, offset=%s", limit, offset)
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = _search_postgresql(query)
+        elif dialect == "sqlite":
+            stmt = _search_sqlite(query)
+        else:
+            raise BaseUserHTTPException(message=f"Поиск не поддерживается для {dialect}.")
+
+        result = await self._session.execute(stmt.limit(limit + 1).offset(offset))
+        rows = result.all()
+
+        next_offset = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_offset = offset + limit
+
+        logger.info("Найдено %s пользователей", len(rows))
+        return UserSearchResultDTO(
+            items=[to_user_response_dto_from_row(row) for row in rows], next_offset=next_offset
+        )
 
-async def get_user_repository(
-    session: AsyncSession = Depends(get_db),
-) -> UserRepository:
-    return UserRepository(session)
+    async def stream_users(self, batch_size: int) -> AsyncIterator[UserResponseDTO]:
+        logger.info("Потоковая выгрузка пользователей, batch_size=%s", batch_size)
+        stmt = (
+            select(*_USER_COLUMNS)
+            .order_by(UserDBModel.created_at, UserDBModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        # Сессия запроса закрывается до отправки тела ответа, поэтому
+        # серверный курсор открывается в собственной сессии.
+        async with session_scope() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield to_user_response_dto_from_row(row)
+
+    def export_users(
+        self, export_format: UserExportFormat, batch_size: int
+    ) -> AsyncIterator[bytes]:
+        """Выгрузка таблицы блоками байт: на PostgreSQL CSV/NDJSON — через COPY,
+        иначе (и для Parquet) — серверным курсором по колонкам, без ORM-объектов.
+        """
+        require_format_support(export_format)
+        dialect = self._session.get_bind().dialect.name
+        logger.info("Экспорт пользователей: format=%s, dialect=%s", export_format, dialect)
+        return export_chunks(dialect, export_format, batch_size)
+
+    @timed_query
+    async def find_user_credentials(self, user_login: str) -> tuple[UserResponseDTO, str]:
+        """Пользователь и хеш его пароля для проверки учетных данных."""
+        logger.info("Получение учетных данных пользователя %s из базы данных", user_login)
+        result = await self._session.execute(_CREDENTIALS_BY_LOGIN, {"user_login": user_login})
+        row = result.one_or_none()
+
+        if not row:
+            logger.error("Пользователь с логином %s не найден", user_login)
+            raise UserNotFoundHTTPException(message=f"User with login: {user_login} not found")
+
+        return to_user_response_dto_from_row(row[:-1]), row.password
+
+    @timed_query
+    async def update_password_hash(self, user_id: UUID | str, password_hash: str) -> None:
+        logger.info("Обновление хеша пароля пользователя %s", user_id)
+        stmt = (
+            update(UserDBModel)
+            .where(UserDBModel.id == UUID(str(user_id)))
+            .values(password=password_hash)
+        )
+        await self._session.execute(stmt)
@@ -0,0 +1,133 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from src.config import service_settings
+
+T = TypeVar("T")
+
+SCHEME = "scrypt"
+SALT_SIZE = 16
+KEY_SIZE = 64
+
+
+@dataclass(frozen=True)
+class ScryptHash:
+    n: int
+    r: int
+    p: int
+    salt: bytes
+    key: bytes
+
+
+def parse_password_hash(encoded: str) -> Optional[ScryptHash]:
+    """Разбирает `scrypt$n$r$p$salt$key`; None — не хеш scrypt или поврежденное значение."""
+    parts = encoded.split("$")
+    if len(parts) != 6 or parts[0] != SCHEME:
+        return None
+    try:
+        n, r, p = (int(value) for value in parts[1:4])
+        salt = base64.b64decode(parts[4], validate=True)
+        key = base64.b64decode(parts[5], validate=True)
+    except ValueError:
+        return None
+    # n — степень двойки больше 1, иначе hashlib.scrypt падает с ValueError
+    if n < 2 or n & (n - 1) or r < 1 or p < 1 or not salt or len(key) != KEY_SIZE:
+        return None
+    return ScryptHash(n=n, r=r, p=p, salt=salt, key=key)
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        dklen=KEY_SIZE,
+        maxmem=2 * 128 * r * (n + p + 2),
+    )
+
+
+def hash_password(password: str, n: int, r: int, p: int) -> str:
+    salt = os.urandom(SALT_SIZE)
+    key = _scrypt(password, salt, n, r, p)
+    encoded_salt = base64.b64encode(salt).decode()
+    encoded_key = base64.b64encode(key).decode()
+    return "$".join((SCHEME, str(n), str(r), str(p), encoded_salt, encoded_key))
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    if not encoded.startswith(f"{SCHEME}$"):
+        # Пароли, сохраненные до введения хеширования, лежат в открытом виде
+        return hmac.compare_digest(password.encode(), encoded.encode())
+
+    parsed = parse_password_hash(encoded)
+    if parsed is None:
+        # Поврежденный хеш не совпадает ни с одним паролем
+        return False
+    try:
+        actual = _scrypt(password, parsed.salt, parsed.n, parsed.r, parsed.p)
+    except (ValueError, MemoryError):
+        # Параметры стоимости за пределами допустимых для scrypt
+        return False
+    return hmac.compare_digest(actual, parsed.key)
+
+
+class PasswordHasher:
+    """Хеширование паролей scrypt вне event loop.
+
+    KDF специально медленный, поэтому вызовы уходят в ограниченный пул потоков или
+    процессов (`PASSWORD_HASH_EXECUTOR`), чтобы не блокировать остальные запросы воркера.
+    """
+
+    def __init__(
+        self,
+        n: int = service_settings.PASSWORD_SCRYPT_N,
+        r: int = service_settings.PASSWORD_SCRYPT_R,
+        p: int = service_settings.PASSWORD_SCRYPT_P,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.n = n
+        self.r = r
+        self.p = p
+        self._executor = executor
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.n, self.r, self.p)
+
+    async def verify(self, password: str, encoded: str) -> bool:
+        return await self._run(verify_password, password, encoded)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        parsed = parse_password_hash(encoded)
+        return parsed is None or (parsed.n, parsed.r, parsed.p) != (self.n, self.r, self.p)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        if self._executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+
+def create_executor(kind: str, workers: int) -> Optional[Executor]:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return None
+
+
+password_hasher = PasswordHasher(
+    executor=create_executor(
+        service_settings.PASSWORD_HASH_EXECUTOR, service_settings.PASSWORD_HASH_WORKERS
+    )
+)
@@ -1,6 +1,7 @@
 import asyncio
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import AsyncIterator, Awaitable, Iterator, TypeVar
 
 import uvicorn
 from fastapi import APIRouter, FastAPI
@@ -9,26 +10,87 @@ from tools_openverse.common.config import get_redis, settings
 
 from tools_openverse import setup_logger
 
+from src.config import service_settings
+from src.delivery.middleware import MetricsMiddleware, ProfilingMiddleware
+from src.delivery.route.metrics import MetricsRoute
 from src.delivery.route.user import UserRoute
-from src.infra.repository.db.base import init_db
+from src.infra.events.publisher import RedisStreamPublisher
+from src.infra.logs import log_pipeline
+from src.infra.repository.db.base import dispose_engine, init_db, init_engine
+from src.infra.security.password import password_hasher
+from src.usecases.outbox import run_outbox_relay
+from src.usecases.stats import run_stats_reconciliation
 
 
+T = TypeVar("T")
+
 logger = setup_logger()
 
 
+@contextmanager
+def _phase(timings: dict[str, float], name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def _timed(timings: dict[str, float], name: str, awaitable: Awaitable[T]) -> T:
+    with _phase(timings, name):
+        return await awaitable
+
+
 @asynccontextmanager
 async def lifespan(fast_app: FastAPI) -> AsyncIterator[None]:
-    logger.info("Starting application lifespan for %s", settings.PROJECT_NAME)
-    logger.info("Initializing database, redis connection")
-    db_task = asyncio.create_task(init_db())
-    redis_client = asyncio.create_task(get_redis())
-    await asyncio.gather(db_task, redis_client)
-    logger.info("Database, redis initialized successfully")
-
-    router = APIRouter(tags=["Users"])
-    UserRoute(router)
-    fast_app.include_router(router)
-    logger.info("User routes registered successfully")
+    timings: dict[str, float] = {}
+    with _phase(timings, "total"):
+        log_pipeline.start()
+        logger.info("Starting application lifespan for %s", settings.PROJECT_NAME)
+        with _phase(timings, "engine"):
+            init_engine()
+
+        logger.info("Checking database schema, initializing redis connection")
+        _, redis_client = await asyncio.gather(
+            _timed(timings, "schema", init_db()),
+            _timed(timings, "redis", get_redis()),
+        )
+        fast_app.state.redis = redis_client
+        logger.info("Database, redis initialized successfully")
+
+        background: list[asyncio.Task[None]] = []
+        if service_settings.USER_STATS_ENABLED:
+            background.append(asyncio.create_task(
+                run_stats_reconciliation(
+                    redis_client, service_settings.USER_STATS_RECONCILE_INTERVAL
+                )
+            ))
+        # Релей нумерует события для /users/changes и без публикации в Redis
+        background.append(asyncio.create_task(
+            run_outbox_relay(
+                RedisStreamPublisher(redis_client)
+                if service_settings.USER_OUTBOX_RELAY_ENABLED
+                else None,
+                interval=service_settings.USER_OUTBOX_RELAY_INTERVAL,
+                batch_size=service_settings.USER_OUTBOX_BATCH_SIZE,
+                retention_days=service_settings.USER_OUTBOX_RETENTION_DAYS,
+            )
+        ))
+
+        with _phase(timings, "routes"):
+            router = APIRouter(tags=["Users"])
+            UserRoute(router)
+            fast_app.include_router(router)
+
+            metrics_router = APIRouter(tags=["Metrics"])
+            MetricsRoute(metrics_router)
+            fast_app.include_router(metrics_router)
+        logger.info("User routes registered successfully")
+    logger.info(
+        "Startup finished in %s ms: %s",
+        timings.pop("total"),
+        ", ".join(f"{name}={ms} ms" for name, ms in timings.items()),
+    )
     # heath_check = HealthCheck()
     # db_health_task = asyncio.create_task(
     #     heath_check.add_service(DatabaseHealthService("database", session))
@@ -39,19 +101,36 @@ async def lifespan(fast_app: FastAPI) -> AsyncIterator[None]:
     # await asyncio.gather(db_health_task, redis_health_task)
     # # await heath_check.display_start_message()
     yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hasher.shutdown()
+    await dispose_engine()
+    log_pipeline.stop()
 
 
 app = ApplicationManager.create(
     service_name=settings.PROJECT_NAME,
     lifespan=lifespan
 )
+app.get_app.add_middleware(MetricsMiddleware)
+if service_settings.PROFILING_ENABLED:
+    app.get_app.add_middleware(
+        ProfilingMiddleware,
+        secret=service_settings.PROFILING_SECRET,
+        sample_rate=service_settings.PROFILING_SAMPLE_RATE,
+        directory=service_settings.PROFILING_DIR,
+    )
 
 
 async def _run_application() -> None:
-    jaeger_service = JaegerService()
-    await jaeger_service.init(service_name=settings.PROJECT_NAME)
-    app.add_service(jaeger_service)
-    await app.initialize_application(config=settings.to_dict(), with_tracers=True,
+    if service_settings.TRACING_ENABLED:
+        jaeger_service = JaegerService()
+        await jaeger_service.init(service_name=settings.PROJECT_NAME)
+        app.add_service(jaeger_service)
+    await app.initialize_application(config=settings.to_dict(),
+                                     with_tracers=service_settings.TRACING_ENABLED,
                                      with_metrics=False, health_check=True)
 
 if __name__ == "__main__":
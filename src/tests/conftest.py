@@ -0,0 +1,72 @@
+import os
+
+# Настройки читаются при импорте src: дешевый scrypt и хеширование в потоке запроса
+os.environ.setdefault("PASSWORD_SCRYPT_N", "1024")
+os.environ.setdefault("PASSWORD_HASH_EXECUTOR", "inline")
+
+from pathlib import Path  # noqa: E402
+from typing import Any, AsyncIterator, Awaitable, Callable  # noqa: E402
+
+import pytest  # noqa: E402
+from fakeredis import FakeServer  # noqa: E402
+from fakeredis.aioredis import FakeRedis  # noqa: E402
+from fastapi import APIRouter, FastAPI  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from src.delivery.route.user import UserRoute  # noqa: E402
+from src.infra.repository.db.base import dispose_engine, init_db, init_engine  # noqa: E402
+
+PASSWORD = "S3cure!Pass"
+
+CreateUser = Callable[..., Awaitable[dict[str, Any]]]
+
+
+@pytest.fixture
+async def database(tmp_path: Path) -> AsyncIterator[None]:
+    """Отдельная база SQLite на тест, схема — как при старте сервиса."""
+    init_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    await init_db()
+    yield
+    await dispose_engine()
+
+
+@pytest.fixture
+async def redis() -> AsyncIterator[FakeRedis]:
+    client = FakeRedis(server=FakeServer())
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def app(database: None, redis: FakeRedis) -> FastAPI:
+    application = FastAPI()
+    router = APIRouter(tags=["Users"])
+    UserRoute(router)
+    application.include_router(router)
+    application.state.redis = redis
+    return application
+
+
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def create_user(client: AsyncClient) -> CreateUser:
+    async def create(login: str, **fields: Any) -> dict[str, Any]:
+        payload = {
+            "login": login,
+            "name": "Tester",
+            "email": f"{login}@example.com",
+            "password": PASSWORD,
+            **fields,
+        }
+        response = await client.post("/users/create", json=payload)
+        assert response.status_code == 201, response.text
+        user: dict[str, Any] = response.json()
+        return user
+
+    return create
@@ -0,0 +1,88 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from src.entities.user.value_objects.validators import user_validator
+from src.tests.conftest import PASSWORD, CreateUser
+
+
+def _payload(login: str, password: str = PASSWORD) -> dict[str, str]:
+    return {
+        "login": login,
+        "name": "Bulk",
+        "email": f"{login}@example.com",
+        "password": password,
+    }
+
+
+async def test_bulk_create_reports_status_per_item(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    await create_user("existing1")
+
+    response = await client.post(
+        "/users/bulk_create",
+        json=[
+            _payload("bulkuser1"),
+            _payload("bulkuser1"),
+            _payload("existing1"),
+            _payload("bulkuser2", password="weak"),
+            _payload("bulkuser3"),
+        ],
+    )
+    assert response.status_code == 200
+    result = response.json()
+
+    statuses = [(item["index"], item["status"]) for item in result["items"]]
+    assert sorted(statuses) == [
+        (0, "created"),
+        (1, "duplicate"),
+        (2, "duplicate"),
+        (3, "invalid"),
+        (4, "created"),
+    ]
+    assert (result["created"], result["duplicates"], result["invalid"]) == (2, 2, 1)
+    invalid = next(item for item in result["items"] if item["status"] == "invalid")
+    assert invalid["detail"] and invalid["user"] is None
+
+    assert (await client.get("/users/login/bulkuser3")).status_code == 200
+    assert (await client.get("/users/login/bulkuser2")).status_code == 400
+
+
+async def test_batch_get_returns_missing_keys(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    first = await create_user("batchuser1")
+    await create_user("batchuser2")
+    unknown_id = str(uuid4())
+
+    response = await client.post(
+        "/users/batch_get",
+        json={"ids": [first["id"], unknown_id], "logins": ["batchuser2", "nobody1"]},
+    )
+    assert response.status_code == 200
+    result = response.json()
+
+    assert sorted(user["login"] for user in result["users"]) == ["batchuser1", "batchuser2"]
+    assert sorted(result["missing"]) == sorted([unknown_id, "nobody1"])
+
+
+async def test_bulk_create_checks_each_record_once(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    checked: list[str] = []
+    check = user_validator.check
+
+    def counting_check(record: Any) -> Any:
+        checked.append(record.get("login"))
+        return check(record)
+
+    monkeypatch.setattr(user_validator, "check", counting_check)
+    response = await client.post(
+        "/users/bulk_create", json=[_payload("onceuser1"), _payload("onceuser2")]
+    )
+
+    assert response.json()["created"] == 2
+    assert checked == ["onceuser1", "onceuser2"]
@@ -0,0 +1,111 @@
+from uuid import UUID
+
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from src.infra.cache.user import UserCache
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.db.models.user import UserDBModel
+from src.tests.conftest import CreateUser
+
+
+async def _rename_in_db(user_id: str, name: str) -> None:
+    # Мимо сервиса: кэш об изменении не знает
+    async with session_scope() as session:
+        await session.execute(
+            update(UserDBModel).where(UserDBModel.id == UUID(user_id)).values(name=name)
+        )
+
+
+async def test_get_user_reads_through_cache(
+    client: AsyncClient, redis: FakeRedis, create_user: CreateUser
+) -> None:
+    user = await create_user("cacheduser")
+    cache = UserCache(redis)
+
+    response = await client.get(f"/users/get/{user['id']}")
+    assert response.status_code == 200
+    assert await redis.exists(cache.id_key(user["id"]), cache.login_key("cacheduser")) == 2
+
+    await _rename_in_db(user["id"], "Renamed")
+    assert (await client.get(f"/users/get/{user['id']}")).json()["name"] == "Tester"
+    assert (await client.get("/users/login/cacheduser")).json()["name"] == "Tester"
+
+
+async def test_put_refreshes_cached_user(client: AsyncClient, create_user: CreateUser) -> None:
+    user = await create_user("putuser1")
+    await client.get(f"/users/get/{user['id']}")
+
+    response = await client.put("/users/update", json={"login": "putuser1", "name": "Updated"})
+    assert response.status_code == 200
+
+    assert (await client.get(f"/users/get/{user['id']}")).json()["name"] == "Updated"
+    assert (await client.get("/users/login/putuser1")).json()["name"] == "Updated"
+
+
+async def test_patch_refreshes_cached_user(client: AsyncClient, create_user: CreateUser) -> None:
+    user = await create_user("patchuser1")
+    await client.get(f"/users/get/{user['id']}")
+
+    response = await client.patch(f"/users/{user['id']}", json={"name": "Patched"})
+    assert response.status_code == 200
+
+    assert (await client.get(f"/users/get/{user['id']}")).json()["name"] == "Patched"
+
+
+async def test_login_rename_invalidates_old_login(
+    client: AsyncClient, redis: FakeRedis, create_user: CreateUser
+) -> None:
+    user = await create_user("oldlogin1")
+    await client.get(f"/users/get/{user['id']}")
+
+    response = await client.patch(f"/users/{user['id']}", json={"login": "newlogin1"})
+    assert response.status_code == 200
+
+    assert not await redis.exists(UserCache(redis).login_key("oldlogin1"))
+    assert (await client.get("/users/login/oldlogin1")).status_code == 400
+    assert (await client.get("/users/login/newlogin1")).json()["id"] == user["id"]
+    assert (await client.get(f"/users/get/{user['id']}")).json()["login"] == "newlogin1"
+
+
+async def test_delete_invalidates_cached_user(
+    client: AsyncClient, redis: FakeRedis, create_user: CreateUser
+) -> None:
+    user = await create_user("deleteduser")
+    await client.get(f"/users/get/{user['id']}")
+
+    assert (await client.delete(f"/users/delete/{user['id']}")).status_code == 200
+
+    cache = UserCache(redis)
+    assert await redis.exists(cache.id_key(user["id"]), cache.login_key("deleteduser")) == 0
+    assert (await client.get(f"/users/get/{user['id']}")).status_code == 400
+    assert (await client.get("/users/login/deleteduser")).status_code == 400
+
+
+async def test_activation_refreshes_cached_user(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("activeuser")
+    await client.get(f"/users/get/{user['id']}")
+
+    await client.post(f"/users/deactivate/{user['id']}")
+    assert (await client.get(f"/users/get/{user['id']}")).json()["is_active"] is False
+    assert (await client.get("/users/login/activeuser")).json()["is_active"] is False
+
+    await client.post(f"/users/activate/{user['id']}")
+    assert (await client.get(f"/users/get/{user['id']}")).json()["is_active"] is True
+
+
+async def test_bulk_status_invalidates_cached_users(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("bulkstatus1")
+    await client.get(f"/users/get/{user['id']}")
+
+    response = await client.post(
+        "/users/bulk_status", json={"is_active": False, "filter": {"login_prefix": "bulkst"}}
+    )
+    assert response.json()["updated"] == 1
+
+    assert (await client.get(f"/users/get/{user['id']}")).json()["is_active"] is False
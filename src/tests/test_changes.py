@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from httpx import AsyncClient
+from sqlalchemy import insert
+
+from src.infra.events.publisher import InMemoryPublisher
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.db.models.outbox import UserOutboxDBModel
+from src.tests.conftest import CreateUser
+from src.usecases.outbox import purge_outbox, relay_outbox_batch
+
+
+async def _changes(client: AsyncClient, since: int) -> dict[str, Any]:
+    response = await client.get("/users/changes", params={"since": since})
+    assert response.status_code == 200
+    page: dict[str, Any] = response.json()
+    return page
+
+
+async def test_changes_are_numbered_by_relay(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("feeduser1")
+    await client.patch(f"/users/{user['id']}", json={"name": "Feed"})
+    await client.post(f"/users/deactivate/{user['id']}")
+
+    # До релея события не пронумерованы и в ленту не попадают
+    page = await _changes(client, 0)
+    assert page == {"items": [], "next_since": 0}
+
+    publisher = InMemoryPublisher()
+    assert await relay_outbox_batch(publisher, 2) == 2
+    assert await relay_outbox_batch(publisher, 2) == 1
+    assert [event.seq for event in publisher.events] == [1, 2, 3]
+
+    page = await _changes(client, 0)
+    assert [item["seq"] for item in page["items"]] == [1, 2, 3]
+    assert [item["event"] for item in page["items"]] == ["created", "updated", "updated"]
+    assert page["next_since"] == 3
+    assert [item["id"] for item in page["items"]] == [event.id for event in publisher.events]
+
+    page = await _changes(client, 3)
+    assert page == {"items": [], "next_since": 3}
+
+
+async def test_late_commit_is_not_skipped(client: AsyncClient, create_user: CreateUser) -> None:
+    user = await create_user("feeduser2")
+    await relay_outbox_batch(None, 100)
+    cursor = (await _changes(client, 0))["next_since"]
+
+    # Событие транзакции, начатой раньше, чем прочитан курсор: старое время создания
+    async with session_scope() as session:
+        await session.execute(
+            insert(UserOutboxDBModel).values(
+                user_id=UUID(user["id"]),
+                event="updated",
+                payload=user,
+                created_at=datetime.now() - timedelta(hours=1),
+            )
+        )
+    await relay_outbox_batch(None, 100)
+
+    page = await _changes(client, cursor)
+    assert [item["seq"] for item in page["items"]] == [cursor + 1]
+    assert page["items"][0]["event"] == "updated"
+
+
+async def test_numbering_survives_purge(client: AsyncClient, create_user: CreateUser) -> None:
+    await create_user("feeduser3")
+    await create_user("feeduser4")
+    await relay_outbox_batch(None, 100)
+    cursor = (await _changes(client, 0))["next_since"]
+
+    await purge_outbox(0)
+    page = await _changes(client, 0)
+    assert [item["seq"] for item in page["items"]] == [cursor]
+
+    await create_user("feeduser5")
+    await relay_outbox_batch(None, 100)
+    page = await _changes(client, cursor)
+    assert [item["seq"] for item in page["items"]] == [cursor + 1]
+    assert page["items"][0]["user"]["login"] == "feeduser5"
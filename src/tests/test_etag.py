@@ -0,0 +1,35 @@
+from httpx import AsyncClient
+
+from src.tests.conftest import CreateUser
+
+
+async def test_get_user_not_modified(client: AsyncClient, create_user: CreateUser) -> None:
+    user = await create_user("etaguser1")
+    response = await client.get(f"/users/get/{user['id']}")
+    etag = response.headers["etag"]
+
+    response = await client.get(f"/users/get/{user['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    await client.patch(f"/users/{user['id']}", json={"name": "Changed"})
+    response = await client.get(f"/users/get/{user['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+async def test_get_all_page_not_modified(client: AsyncClient, create_user: CreateUser) -> None:
+    await create_user("pageuser1")
+    await create_user("pageuser2")
+    etag = (await client.get("/users/get_all", params={"limit": 10})).headers["etag"]
+
+    response = await client.get(
+        "/users/get_all", params={"limit": 10}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    await create_user("pageuser3")
+    response = await client.get(
+        "/users/get_all", params={"limit": 10}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 3
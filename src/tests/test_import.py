@@ -0,0 +1,46 @@
+import csv
+from pathlib import Path
+
+from httpx import AsyncClient
+
+from src.infra.security.password import hash_password
+from src.tests.conftest import PASSWORD, CreateUser
+from src.usecases.importer import import_users
+
+
+async def test_import_reports_rejected_rows(
+    tmp_path: Path, client: AsyncClient, create_user: CreateUser
+) -> None:
+    await create_user("existing2")
+    source = tmp_path / "users.csv"
+    rejects = tmp_path / "rejects.csv"
+    pre_hashed = hash_password(PASSWORD, 1024, 8, 1)
+    with open(source, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(("login", "name", "email", "password", "is_active"))
+        writer.writerows(
+            [
+                ("imported1", "Imp", "imported1@example.com", PASSWORD, "true"),
+                ("imported2", "Imp", "imported2@example.com", pre_hashed, ""),
+                ("brokenhash2", "Imp", "brokenhash2@example.com", "scrypt$1024$8$1$!!$!!", ""),
+                ("imported1", "Imp", "other1@example.com", PASSWORD, ""),
+                ("bademail1", "Imp", "not-an-email", PASSWORD, ""),
+                ("existing2", "Imp", "existing2-new@example.com", PASSWORD, ""),
+            ]
+        )
+
+    report = await import_users(str(source), "csv", str(rejects), batch_size=2, workers=1)
+
+    assert report.processed == 6
+    assert (report.imported, report.invalid, report.duplicates, report.conflicts) == (2, 2, 1, 1)
+    with open(rejects, newline="", encoding="utf-8") as file:
+        reasons = {row["login"]: row["reason"] for row in csv.DictReader(file)}
+    assert reasons["brokenhash2"] == "Некорректный хеш пароля"
+    assert reasons["imported1"] == "Логин повторяется в файле"
+    assert reasons["bademail1"].startswith("Некорректный email")
+    assert reasons["existing2"] == "Логин или email уже существует"
+
+    response = await client.post(
+        "/users/log_in", data={"login": "imported2", "password": PASSWORD}
+    )
+    assert response.status_code == 200
@@ -0,0 +1,33 @@
+import asyncio
+
+from src.infra.repository.db import base
+from src.infra.repository.db.uow import UnitOfWork
+from src.tests.conftest import CreateUser
+from src.usecases.user import UserService, user_lookup_flight
+
+
+async def test_coalesced_lookup_survives_leader_cancellation(
+    database: None, create_user: CreateUser
+) -> None:
+    user = await create_user("coalesced1")
+    assert base.SessionLocal is not None
+    leader_session = base.SessionLocal()
+    follower_session = base.SessionLocal()
+    before = user_lookup_flight.coalesced
+
+    leader = asyncio.ensure_future(
+        UserService(UnitOfWork(leader_session)).get_user_by_id_or_login(user_id=user["id"])
+    )
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(
+        UserService(UnitOfWork(follower_session)).get_user_by_id_or_login(user_id=user["id"])
+    )
+    await asyncio.sleep(0)
+    # Запрос-лидер отменен, его сессия закрыта, пока общий запрос еще идет
+    leader.cancel()
+    await leader_session.close()
+
+    result = await follower
+    await follower_session.close()
+    assert result is not None and result.login == "coalesced1"
+    assert user_lookup_flight.coalesced == before + 1
@@ -0,0 +1,48 @@
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.db.models.user import UserDBModel
+from src.infra.security.password import hash_password, parse_password_hash, verify_password
+from src.tests.conftest import PASSWORD, CreateUser
+
+MALFORMED_HASHES = [
+    "scrypt$1024$8$1$!!!$!!!",
+    "scrypt$1000$8$1$c2FsdA==$a2V5",
+    "scrypt$1024$8",
+    "scrypt$x$8$1$c2FsdA==$a2V5",
+]
+
+
+def test_password_hash_round_trip() -> None:
+    encoded = hash_password(PASSWORD, 1024, 8, 1)
+
+    assert parse_password_hash(encoded) is not None
+    assert verify_password(PASSWORD, encoded)
+    assert not verify_password("Wrong!Pass1", encoded)
+
+
+@pytest.mark.parametrize("encoded", MALFORMED_HASHES)
+def test_malformed_hash_does_not_verify(encoded: str) -> None:
+    assert parse_password_hash(encoded) is None
+    assert not verify_password(PASSWORD, encoded)
+
+
+async def test_log_in_with_malformed_hash_is_rejected(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("brokenhash")
+    async with session_scope() as session:
+        await session.execute(
+            update(UserDBModel)
+            .where(UserDBModel.id == UUID(user["id"]))
+            .values(password=MALFORMED_HASHES[0])
+        )
+
+    response = await client.post(
+        "/users/log_in", data={"login": "brokenhash", "password": PASSWORD}
+    )
+    assert response.status_code == 401
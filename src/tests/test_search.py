@@ -0,0 +1,16 @@
+from httpx import AsyncClient
+
+from src.tests.conftest import CreateUser
+
+
+async def test_search_strips_query_before_length_check(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    await create_user("searchable1")
+
+    response = await client.get("/users/search", params={"q": "   a "})
+    assert response.status_code == 400
+
+    response = await client.get("/users/search", params={"q": "  searchable "})
+    assert response.status_code == 200
+    assert [user["login"] for user in response.json()["items"]] == ["searchable1"]
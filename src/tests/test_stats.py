@@ -0,0 +1,20 @@
+from httpx import AsyncClient
+
+from src.tests.conftest import CreateUser
+
+
+async def test_repeated_status_change_keeps_stats(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("statsuser1")
+    await create_user("statsuser2")
+
+    await client.post(f"/users/deactivate/{user['id']}")
+    await client.post(f"/users/deactivate/{user['id']}")
+    stats = (await client.get("/users/stats")).json()
+    assert (stats["total"], stats["active"]) == (2, 1)
+
+    await client.post(f"/users/activate/{user['id']}")
+    await client.post(f"/users/activate/{user['id']}")
+    stats = (await client.get("/users/stats")).json()
+    assert (stats["total"], stats["active"]) == (2, 2)
@@ -0,0 +1,46 @@
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from src.entities.user.entity import User
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.outbox.outbox import OutboxRepository
+from src.infra.repository.user.exc import AttributeAlreadyExists
+from src.infra.repository.user.user import UserRepository
+from src.tests.conftest import PASSWORD, CreateUser
+from src.usecases.outbox import relay_outbox_batch
+
+
+async def test_duplicate_insert_raises_attribute_already_exists(
+    create_user: CreateUser,
+) -> None:
+    await create_user("takenlogin")
+    user = User(
+        id=uuid4(),
+        login="takenlogin",
+        name="Other",
+        password=PASSWORD,
+        email="other@example.com",
+    )
+
+    with pytest.raises(AttributeAlreadyExists):
+        async with session_scope() as session:
+            await UserRepository(session).create(user)
+
+
+async def test_patch_without_changes_is_noop(
+    client: AsyncClient, create_user: CreateUser
+) -> None:
+    user = await create_user("noopuser1")
+    await relay_outbox_batch(None, 100)
+    async with session_scope() as session:
+        last_seq = await OutboxRepository(session).last_seq()
+
+    response = await client.patch(f"/users/{user['id']}", json={"name": user["name"]})
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == user["updated_at"]
+
+    assert await relay_outbox_batch(None, 100) == 0
+    async with session_scope() as session:
+        assert await OutboxRepository(session).last_seq() == last_seq
@@ -0,0 +1,266 @@
+import asyncio
+import csv
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, Literal, Optional, Sequence, TextIO
+from uuid import uuid4
+
+from pydantic import validate_email
+from pydantic_core import PydanticCustomError
+from tools_openverse.common.logger_ import setup_logger
+
+from src.config import service_settings
+from src.entities.user.value_objects.validators import user_validator
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.user.importer import StagedUser, UserImportStaging
+from src.infra.security.password import SCHEME, hash_password, parse_password_hash
+
+logger = setup_logger("service")
+
+ImportFormat = Literal["csv", "ndjson"]
+# (номер строки, запись) и (номер строки, логин, email, причина)
+ParsedRecord = tuple[int, dict[str, Any]]
+Reject = tuple[int, str, str, str]
+
+REQUIRED_FIELDS = ("login", "name", "email", "password")
+TRUE_VALUES = {"true", "1", "yes"}
+FALSE_VALUES = {"false", "0", "no"}
+
+
+@dataclass
+class ImportReport:
+    processed: int = 0
+    imported: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+    conflicts: int = 0
+    rejects_path: str = ""
+    seconds: float = 0.0
+
+    @property
+    def rejected(self) -> int:
+        return self.invalid + self.duplicates + self.conflicts
+
+
+def read_records(
+    source: TextIO, import_format: ImportFormat
+) -> Iterator[tuple[int, Optional[dict[str, Any]], str]]:
+    """(номер строки, запись или None, ошибка разбора) по одной записи, без чтения файла целиком."""
+    if import_format == "csv":
+        reader = csv.DictReader(source)
+        for record in reader:
+            yield reader.line_num, record, ""
+        return
+
+    for line_number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, None, f"Некорректный JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Строка должна быть JSON-объектом"
+            continue
+        yield line_number, record, ""
+
+
+def _parse_bool(value: Any) -> Optional[bool]:
+    if value is None or value == "":
+        return True
+    if isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    if normalized in TRUE_VALUES:
+        return True
+    if normalized in FALSE_VALUES:
+        return False
+    return None
+
+
+def validate_batch(
+    records: Sequence[ParsedRecord], created_at: datetime, hash_params: tuple[int, int, int]
+) -> tuple[list[StagedUser], list[Reject]]:
+    """Проверка пачки записей правилами `User` в процессе пула.
+
+    Пароли в открытом виде хешируются здесь же (scrypt — основная нагрузка на CPU),
+    уже готовые хеши `scrypt$...` сохраняются как есть.
+    """
+    staged: list[StagedUser] = []
+    rejected: list[Reject] = []
+    for line, record in records:
+        login = record.get("login")
+        email = record.get("email")
+        reject_login = login if isinstance(login, str) else ""
+        reject_email = email if isinstance(email, str) else ""
+
+        missing = [
+            field
+            for field in REQUIRED_FIELDS
+            if not isinstance(record.get(field), str) or not record[field]
+        ]
+        if missing:
+            reason = f"Не заполнены поля: {', '.join(missing)}"
+            rejected.append((line, reject_login, reject_email, reason))
+            continue
+
+        password = record["password"]
+        pre_hashed = password.startswith(f"{SCHEME}$")
+        checked = {key: record[key] for key in ("login", "name")} if pre_hashed else record
+        reasons = [str(error.detail) for error in user_validator.check(checked)]
+        if pre_hashed and parse_password_hash(password) is None:
+            reasons.append("Некорректный хеш пароля")
+        normalized_email = ""
+        try:
+            normalized_email = validate_email(record["email"])[1]
+        except PydanticCustomError as exc:
+            reasons.append(f"Некорректный email: {exc}")
+        is_active = _parse_bool(record.get("is_active"))
+        if is_active is None:
+            reasons.append("Некорректное значение is_active")
+        if reasons:
+            rejected.append((line, reject_login, reject_email, "; ".join(reasons)))
+            continue
+
+        if not pre_hashed:
+            password = hash_password(password, *hash_params)
+        # Поля уже проверены как непустые строки выше
+        staged.append(
+            (
+                uuid4(),
+                record["login"],
+                record["name"],
+                normalized_email,
+                password,
+                bool(is_active),
+                created_at,
+                line,
+            )
+        )
+    return staged, rejected
+
+
+def _batches(
+    records: Iterator[tuple[int, Optional[dict[str, Any]], str]], batch_size: int
+) -> Iterator[tuple[list[ParsedRecord], list[Reject]]]:
+    parsed: list[ParsedRecord] = []
+    errors: list[Reject] = []
+    for line, record, error in records:
+        if record is None:
+            errors.append((line, "", "", error))
+        else:
+            parsed.append((line, record))
+        if len(parsed) + len(errors) >= batch_size:
+            yield parsed, errors
+            parsed, errors = [], []
+    if parsed or errors:
+        yield parsed, errors
+
+
+async def import_users(
+    path: str,
+    import_format: ImportFormat,
+    rejects_path: str,
+    batch_size: int = service_settings.USERS_IMPORT_BATCH_SIZE,
+    workers: int = service_settings.USERS_IMPORT_WORKERS,
+) -> ImportReport:
+    """Потоковый импорт пользователей из CSV/NDJSON.
+
+    Файл читается пачками по `batch_size` записей, пачки проверяются в пуле из `workers`
+    процессов (в работе одновременно не больше `2 * workers` пачек). Повторы логина и
+    email внутри файла отсекаются по первому вхождению, валидные строки загружаются во
+    временную таблицу (COPY на PostgreSQL) и в конце переносятся в `users` одним
+    INSERT ... SELECT в той же транзакции. Отклоненные записи с причиной пишутся в
+    `rejects_path` (CSV: line, login, email, reason).
+    """
+    report = ImportReport(rejects_path=rejects_path)
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    hash_params = (
+        service_settings.PASSWORD_SCRYPT_N,
+        service_settings.PASSWORD_SCRYPT_R,
+        service_settings.PASSWORD_SCRYPT_P,
+    )
+    created_at = datetime.now()
+    seen_logins: set[str] = set()
+    seen_emails: set[str] = set()
+    logger.info("Импорт пользователей из %s (%s), процессов: %s", path, import_format, workers)
+
+    with (
+        open(path, newline="", encoding="utf-8") as source,
+        open(rejects_path, "w", newline="", encoding="utf-8") as rejects_file,
+        ProcessPoolExecutor(max_workers=workers) as pool,
+    ):
+        rejects = csv.writer(rejects_file)
+        rejects.writerow(("line", "login", "email", "reason"))
+        batches = _batches(read_records(source, import_format), batch_size)
+        in_flight: deque[tuple[list[Reject], asyncio.Future[Any]]] = deque()
+        exhausted = False
+
+        async with session_scope() as session:
+            staging = UserImportStaging(session)
+            await staging.create()
+
+            while not exhausted or in_flight:
+                if not exhausted and len(in_flight) < 2 * workers:
+                    batch = await asyncio.to_thread(next, batches, None)
+                    if batch is None:
+                        exhausted = True
+                        continue
+                    parsed, parse_errors = batch
+                    report.processed += len(parsed) + len(parse_errors)
+                    future = loop.run_in_executor(
+                        pool, validate_batch, parsed, created_at, hash_params
+                    )
+                    in_flight.append((parse_errors, future))
+                    continue
+
+                parse_errors, future = in_flight.popleft()
+                staged, invalid = await future
+                unique: list[StagedUser] = []
+                duplicates: list[Reject] = []
+                for row in staged:
+                    _, login, _, email, *_, line = row
+                    if login in seen_logins:
+                        duplicates.append((line, login, email, "Логин повторяется в файле"))
+                    elif email in seen_emails:
+                        duplicates.append((line, login, email, "Email повторяется в файле"))
+                    else:
+                        seen_logins.add(login)
+                        seen_emails.add(email)
+                        unique.append(row)
+                await staging.load(unique)
+
+                report.invalid += len(parse_errors) + len(invalid)
+                report.duplicates += len(duplicates)
+                rejects.writerows(sorted(parse_errors + invalid + duplicates))
+                logger.info(
+                    "Импорт: прочитано %s, в staging %s, отклонено %s, %.0f строк/с",
+                    report.processed,
+                    len(seen_logins),
+                    report.invalid + report.duplicates,
+                    report.processed / (time.perf_counter() - started),
+                )
+
+            report.imported = await staging.merge()
+            async for line, login, email in staging.conflicts(batch_size):
+                rejects.writerow((line, login, email, "Логин или email уже существует"))
+                report.conflicts += 1
+
+    report.seconds = round(time.perf_counter() - started, 3)
+    logger.info(
+        "Импорт завершен за %s с: добавлено %s, отклонено %s (невалидных %s, "
+        "повторов в файле %s, уже существующих %s)",
+        report.seconds,
+        report.imported,
+        report.rejected,
+        report.invalid,
+        report.duplicates,
+        report.conflicts,
+    )
+    return report
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from tools_openverse.common.logger_ import setup_logger
+
+from src.infra.events.publisher import ChangePublisher
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.outbox.outbox import OutboxRepository
+
+logger = setup_logger("service")
+
+# Чистка опубликованных событий — не чаще раза в час
+PURGE_INTERVAL = 3600
+
+
+async def relay_outbox_batch(publisher: Optional[ChangePublisher], batch_size: int) -> int:
+    """Нумерует для ленты изменений и публикует одну пачку событий из outbox.
+
+    Релей видит только зафиксированные события, поэтому номер `seq` выдается в
+    порядке COMMIT изменений, а не вставки: длинная транзакция (массовая смена
+    статуса, импорт) получит номера после коротких, зафиксированных раньше нее,
+    и не окажется позади курсора читателя. Выборка, нумерация, публикация и
+    отметка идут в одной транзакции под блокировкой релея. Без `publisher`
+    события только нумеруются. Возвращает число обработанных событий.
+    """
+    async with session_scope() as session:
+        outbox = OutboxRepository(session)
+        await outbox.lock_relay()
+        events = await outbox.claim_unpublished(batch_size)
+        if not events:
+            return 0
+        first_seq = await outbox.last_seq() + 1
+        events = [
+            event.model_copy(update={"seq": first_seq + offset})
+            for offset, event in enumerate(events)
+        ]
+        if publisher is not None:
+            await publisher.publish(events)
+        await outbox.mark_published(events)
+    logger.info("Опубликовано %s событий outbox, последнее %s", len(events), events[-1].id)
+    return len(events)
+
+
+async def purge_outbox(retention_days: int) -> int:
+    async with session_scope() as session:
+        return await OutboxRepository(session).purge(
+            datetime.now() - timedelta(days=retention_days)
+        )
+
+
+async def run_outbox_relay(
+    publisher: Optional[ChangePublisher], interval: float, batch_size: int, retention_days: int
+) -> None:
+    """Фоновая публикация событий из outbox.
+
+    Полные пачки публикуются подряд без паузы, пока очередь не опустеет; дальше
+    опрос раз в `interval` секунд.
+    """
+    last_purge = 0.0
+    while True:
+        published = 0
+        try:
+            published = await relay_outbox_batch(publisher, batch_size)
+            if time.monotonic() - last_purge >= PURGE_INTERVAL:
+                await purge_outbox(retention_days)
+                last_purge = time.monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Ошибка публикации событий outbox: %s", e)
+        if published < batch_size:
+            await asyncio.sleep(interval)
@@ -0,0 +1,31 @@
+import asyncio
+
+from redis.asyncio import Redis
+from tools_openverse.common.logger_ import setup_logger
+
+from src.infra.cache.stats import UserStats
+from src.infra.repository.db.base import session_scope
+from src.infra.repository.db.uow import UnitOfWork
+from src.usecases.user import UserService
+
+logger = setup_logger("service")
+
+
+async def run_stats_reconciliation(redis: Redis, interval: int) -> None:
+    """Периодическая сверка счетчиков пользователей с БД.
+
+    Между экземплярами сервиса сверку за интервал выполняет один: тот, кто взял
+    блокировку в Redis.
+    """
+    user_stats = UserStats(redis)
+    while True:
+        try:
+            if await user_stats.acquire_reconcile_lock(ttl=interval):
+                async with session_scope() as session:
+                    service = UserService(UnitOfWork(session), user_stats=user_stats)
+                    await service.reconcile_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Ошибка сверки счетчиков пользователей: %s", e)
+        await asyncio.sleep(interval)
@@ -1,25 +1,77 @@
-from datetime import datetime
-from typing import Optional
+import asyncio
+from datetime import date, datetime, time
+from typing import AsyncIterator, Optional, Sequence
 from uuid import UUID, uuid4
 
 from fastapi import Depends
 from tools_openverse.common.logger_ import setup_logger
 from tools_openverse.common.models import LoginOAuth2PasswordRequestForm
 
-from src.entities.user.dto import UserCreateDTO, UserResponseDTO, UserUpdateDTO
+from src.config import service_settings
+from src.entities.user.dto import (
+    UserBatchResultDTO,
+    UserBulkCreateItemDTO,
+    UserBulkCreateResultDTO,
+    UserBulkStatusDTO,
+    UserBulkStatusResultDTO,
+    UserChangesDTO,
+    UserCreateDTO,
+    UserExportFormat,
+    UserPageDTO,
+    UserResponseDTO,
+    UserSearchResultDTO,
+    UserStatsDTO,
+    UserUpdateDTO,
+)
 from src.entities.user.entity import User
-from src.infra.repository.user.exc import UserNotFoundHTTPException
-from src.infra.repository.user.user import UserRepository, get_user_repository
+from src.entities.user.value_objects.validators import user_validator
+from src.infra.cache.singleflight import SingleFlight
+from src.infra.cache.stats import UserStats, get_user_stats
+from src.infra.cache.user import UserCache, get_user_cache
+from src.infra.metrics import registry
+from src.infra.repository.user.exc import (
+    BaseUserHTTPException,
+    InvalidCredentialsHTTPException,
+    UserNotFoundHTTPException,
+)
+from src.infra.repository.db.base import get_unit_of_work, session_scope
+from src.infra.repository.db.uow import UnitOfWork
+from src.infra.repository.user.user import UserRepository
+from src.infra.security.password import PasswordHasher, password_hasher
 
 logger = setup_logger("service")
 
+# Общий на процесс: одновременные запросы одного и того же пользователя
+# выполняют один запрос к БД
+user_lookup_flight: SingleFlight[Optional[UserResponseDTO]] = SingleFlight()
+registry.gauge(
+    "users_lookup_coalescing",
+    "Single-flight user lookups: requests, coalesced, in_flight",
+    ("counter",),
+    collect=lambda: {(name,): value for name, value in user_lookup_flight.stats().items()},
+)
+
 
 class UserService:
+    """Сценарии работы с пользователями.
+
+    Каждое обращение к БД обернуто в `async with self.uow`: транзакция фиксируется
+    (или откатывается) сразу после него, и соединение не держится на время
+    хеширования паролей, обращений к Redis и сериализации ответа.
+    """
+
     def __init__(
         self,
-        user_repository: UserRepository,
+        uow: UnitOfWork,
+        user_cache: Optional[UserCache] = None,
+        hasher: PasswordHasher = password_hasher,
+        user_stats: Optional[UserStats] = None,
     ) -> None:
-        self.user_repository = user_repository
+        self.uow = uow
+        self.user_repository = UserRepository(uow.session)
+        self.user_cache = user_cache
+        self.hasher = hasher
+        self.user_stats = user_stats
 
     async def create_user(self, user_dto: UserCreateDTO) -> Optional[UserResponseDTO]:
         logger.info("Создание пользователя с логином: %s", user_dto.login)
@@ -32,26 +84,128 @@ class UserService:
             created_at=datetime.now(),
             is_active=True,
         )
-        logger.info("Пользователь с данными: %s", user)
+        logger.info("Пользователь с данными: %s", user.model_dump(exclude={"password"}))
+        user = user.model_copy(update={"password": await self.hasher.hash(user.password)})
         try:
-            is_exists = await self.user_repository.get_exists_user_db(user)
-            if not is_exists:
+            async with self.uow:
                 result = await self.user_repository.create(user)
-                logger.info("Пользователь успешно создан: %s", result.login)
-                return result
-            return None
+            await self._count(total=1, active=1, signups=1)
+            logger.info("Пользователь успешно создан: %s", result.login)
+            return result
         except Exception as e:
             logger.error("Ошибка при создании пользователя %s: %s", user_dto.login, e)
             raise
 
+    async def bulk_create_users(
+        self, user_dtos: Sequence[UserCreateDTO]
+    ) -> UserBulkCreateResultDTO:
+        logger.info("Пакетное создание %s пользователей", len(user_dtos))
+        items: dict[int, UserBulkCreateItemDTO] = {}
+        pending: dict[str, int] = {}
+        users: list[User] = []
+        seen_logins: set[str] = set()
+        seen_emails: set[str] = set()
+        created_at = datetime.now()
+        # Правила полей — одной пакетной проверкой: записи с нарушениями не доходят
+        # до User и не пишут в лог предупреждение на каждую строку
+        violations = user_validator.check_many(user_dto.model_dump() for user_dto in user_dtos)
+
+        for index, (user_dto, errors) in enumerate(zip(user_dtos, violations)):
+            if errors:
+                items[index] = UserBulkCreateItemDTO(
+                    index=index,
+                    login=user_dto.login,
+                    status="invalid",
+                    detail="; ".join(str(error.detail) for error in errors),
+                )
+                continue
+            # Правила уже проверены check_many, email — при разборе UserCreateDTO:
+            # валидатор модели User второй раз не запускается
+            user = User.model_construct(
+                id=uuid4(),
+                login=user_dto.login,
+                name=user_dto.name,
+                email=user_dto.email,
+                password=user_dto.password,
+                created_at=created_at,
+                is_active=True,
+            )
+
+            if user.login in seen_logins or user.email in seen_emails:
+                items[index] = UserBulkCreateItemDTO(
+                    index=index,
+                    login=user.login,
+                    status="duplicate",
+                    detail="Логин или email повторяется в пакете",
+                )
+                continue
+
+            seen_logins.add(user.login)
+            seen_emails.add(user.email)
+            pending[str(user.id)] = index
+            users.append(user)
+
+        password_hashes = await asyncio.gather(
+            *(self.hasher.hash(user.password) for user in users)
+        )
+        users = [
+            user.model_copy(update={"password": password_hash})
+            for user, password_hash in zip(users, password_hashes)
+        ]
+        try:
+            async with self.uow:
+                created = await self.user_repository.bulk_create(users)
+        except Exception as e:
+            logger.error("Ошибка при пакетном создании пользователей: %s", e)
+            raise
+        await self._count(total=len(created), active=len(created), signups=len(created))
+
+        for created_user in created:
+            index = pending.pop(str(created_user.id))
+            items[index] = UserBulkCreateItemDTO(
+                index=index, login=created_user.login, status="created", user=created_user
+            )
+        for index in pending.values():
+            items[index] = UserBulkCreateItemDTO(
+                index=index,
+                login=user_dtos[index].login,
+                status="duplicate",
+                detail="Логин или email уже существует",
+            )
+
+        result_items = [items[index] for index in range(len(user_dtos))]
+        result = UserBulkCreateResultDTO(
+            created=len(created),
+            duplicates=sum(item.status == "duplicate" for item in result_items),
+            invalid=sum(item.status == "invalid" for item in result_items),
+            items=result_items,
+        )
+        logger.info(
+            "Пакетное создание завершено: создано %s, дубликатов %s, невалидных %s",
+            result.created,
+            result.duplicates,
+            result.invalid,
+        )
+        return result
+
     async def get_user_by_id_or_login(
         self, user_id: Optional[str | UUID] = None, user_login: Optional[str] = None
     ) -> Optional[UserResponseDTO]:
         logger.info("Получение пользователя по ID: %s или логину: %s", user_id, user_login)
+        if self.user_cache:
+            cached = await self.user_cache.get(user_id=user_id, user_login=user_login)
+            if cached:
+                logger.info("Пользователь найден в кэше: %s", cached.login)
+                return cached
         try:
-            result = await self.user_repository.find_user_by_id_or_login(
-                user_id=user_id, user_login=user_login
-            )
+            if service_settings.USER_LOOKUP_COALESCING:
+                key = ("id", str(user_id)) if user_id else ("login", user_login)
+                result = await user_lookup_flight.do(
+                    key,
+                    lambda: self._load_user(user_id=user_id, user_login=user_login, shared=True),
+                )
+            else:
+                result = await self._load_user(user_id=user_id, user_login=user_login)
             if result:
                 logger.info("Пользователь найден: %s", result.login)
                 return result
@@ -63,10 +217,107 @@ class UserService:
             logger.error("Ошибка при получении пользователя: %s", e)
             raise e
 
+    async def get_user_version(
+        self, user_id: Optional[str | UUID] = None, user_login: Optional[str] = None
+    ) -> Optional[tuple[UUID | str, datetime]]:
+        """(id, updated_at) пользователя для условного GET: из кэша или узким запросом."""
+        if self.user_cache:
+            cached = await self.user_cache.get(user_id=user_id, user_login=user_login)
+            if cached:
+                return cached.id, cached.updated_at
+        async with self.uow:
+            return await self.user_repository.find_version(
+                user_id=user_id, user_login=user_login
+            )
+
+    async def _load_user(
+        self,
+        user_id: Optional[str | UUID] = None,
+        user_login: Optional[str] = None,
+        shared: bool = False,
+    ) -> Optional[UserResponseDTO]:
+        if shared:
+            # Общий вызов может пережить запрос, который его начал (и закрытую сессию
+            # этого запроса), поэтому работает в своей сессии
+            async with session_scope() as session:
+                result = await UserRepository(session).find_user_by_id_or_login(
+                    user_id=user_id, user_login=user_login
+                )
+        else:
+            async with self.uow:
+                result = await self.user_repository.find_user_by_id_or_login(
+                    user_id=user_id, user_login=user_login
+                )
+        if result and self.user_cache:
+            await self.user_cache.set(result)
+        return result
+
+    async def get_users_batch(
+        self, user_ids: Sequence[UUID], user_logins: Sequence[str]
+    ) -> UserBatchResultDTO:
+        user_ids = list(dict.fromkeys(user_ids))
+        user_logins = list(dict.fromkeys(user_logins))
+        logger.info(
+            "Пакетное получение пользователей: %s ID, %s логинов", len(user_ids), len(user_logins)
+        )
+        if not user_ids and not user_logins:
+            raise BaseUserHTTPException(message="Должен быть хотя бы один ID или Логин.")
+        if len(user_ids) + len(user_logins) > service_settings.USERS_BATCH_GET_MAX:
+            raise BaseUserHTTPException(
+                message=f"Не более {service_settings.USERS_BATCH_GET_MAX} ID и логинов за запрос."
+            )
+
+        by_id: dict[UUID, UserResponseDTO] = {}
+        by_login: dict[str, UserResponseDTO] = {}
+        if self.user_cache:
+            by_id, by_login = await self.user_cache.get_many(user_ids, user_logins)
+
+        ids_left = [user_id for user_id in user_ids if user_id not in by_id]
+        logins_left = [user_login for user_login in user_logins if user_login not in by_login]
+        if ids_left or logins_left:
+            try:
+                async with self.uow:
+                    found = await self.user_repository.find_many(ids_left, logins_left)
+            except Exception as e:
+                logger.error("Ошибка при пакетном получении пользователей: %s", e)
+                raise
+            if self.user_cache:
+                await self.user_cache.set_many(found)
+            for user in found:
+                by_id[UUID(str(user.id))] = user
+                by_login[user.login] = user
+
+        users: dict[str, UserResponseDTO] = {}
+        missing: list[str] = []
+        for user_id in user_ids:
+            if user_id in by_id:
+                users[str(user_id)] = by_id[user_id]
+            else:
+                missing.append(str(user_id))
+        for user_login in user_logins:
+            if user_login in by_login:
+                users.setdefault(str(by_login[user_login].id), by_login[user_login])
+            else:
+                missing.append(user_login)
+
+        logger.info("Найдено пользователей: %s, не найдено: %s", len(users), len(missing))
+        return UserBatchResultDTO(users=list(users.values()), missing=missing)
+
     async def update_user(self, user_dto: UserUpdateDTO) -> UserResponseDTO:
         logger.info("Обновление данных пользователя: %s", user_dto.login)
+        if user_dto.password:
+            user_dto = user_dto.model_copy(
+                update={"password": await self.hasher.hash(user_dto.password)}
+            )
         try:
-            result = await self.user_repository.update(user_dto)
+            was_active = None
+            async with self.uow:
+                if user_dto.is_active is not None and self.user_stats:
+                    was_active = await self._is_active(user_login=user_dto.login)
+                result = await self.user_repository.update(user_dto)
+            await self._count_status_change(was_active, result)
+            if self.user_cache:
+                await self.user_cache.set(result)
             logger.info("Данные пользователя %s успешно обновлены", user_dto.login)
             return result
         except UserNotFoundHTTPException as e:
@@ -78,12 +329,60 @@ class UserService:
             logger.error("Ошибка при обновлении данных пользователя %s: %s", user_dto.login, e)
             raise
 
+    async def patch_user(self, user_id: UUID, user_dto: UserUpdateDTO) -> UserResponseDTO:
+        changes = {
+            field: value
+            for field, value in user_dto.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        logger.info("Частичное обновление пользователя %s, поля: %s", user_id, sorted(changes))
+        user_validator.validate(changes)
+        if "password" in changes:
+            changes["password"] = await self.hasher.hash(changes["password"])
+
+        previous = None
+        if self.user_cache and "login" in changes:
+            previous = await self.user_cache.get(user_id=user_id)
+
+        try:
+            was_active = None
+            async with self.uow:
+                if "is_active" in changes and self.user_stats:
+                    was_active = await self._is_active(user_id=user_id)
+                result = await self.user_repository.patch(user_id, changes)
+            await self._count_status_change(was_active, result)
+        except UserNotFoundHTTPException as e:
+            logger.error("Пользователь с ID %s не найден для обновления: %s", user_id, e)
+            raise
+        except Exception as e:
+            logger.error("Ошибка при частичном обновлении пользователя %s: %s", user_id, e)
+            raise
+
+        if self.user_cache:
+            await self.user_cache.set(result)
+            if previous and previous.login != result.login:
+                await self.user_cache.invalidate(user_login=previous.login)
+        logger.info("Пользователь %s успешно обновлен", user_id)
+        return result
+
     async def delete_user(
         self, user_id: Optional[UUID] = None, user_login: Optional[str] = None
     ) -> None:
         logger.info("Удаление пользователя с ID: %s или логином: %s", user_id, user_login)
         try:
-            await self.user_repository.delete(user_id=user_id, user_login=user_login)
+            async with self.uow:
+                deleted_user = await self.user_repository.delete(
+                    user_id=user_id, user_login=user_login
+                )
+            await self._count(
+                total=-1,
+                active=-int(deleted_user.is_active),
+                signups=-int(deleted_user.created_at.date() == date.today()),
+            )
+            if self.user_cache:
+                await self.user_cache.invalidate(
+                    user_id=deleted_user.id, user_login=deleted_user.login
+                )
             logger.info("Пользователь с ID: %s или логином: %s успешно удален", user_id, user_login)
         except UserNotFoundHTTPException as e:
             logger.error(
@@ -97,18 +396,14 @@ class UserService:
     async def deactivate_user(self, user_id: UUID) -> UserResponseDTO | None:
         logger.info("Деактивация пользователя с ID: %s", user_id)
         try:
-            user = await self.get_user_by_id_or_login(user_id=user_id)
-            if user:
-                updated_user_dto = UserUpdateDTO(
-                    login=user.login,
-                    name=user.name,
-                    email=user.email,
-                    is_active=False,
-                )
-                result = await self.update_user(updated_user_dto)
-                logger.info("Пользователь с ID: %s успешно деактивирован", user_id)
-                return result
-            return None
+            async with self.uow:
+                result, changed = await self.user_repository.set_active(user_id, is_active=False)
+            if changed:
+                await self._count(active=-1)
+            if self.user_cache:
+                await self.user_cache.set(result)
+            logger.info("Пользователь с ID: %s успешно деактивирован", user_id)
+            return result
         except Exception as e:
             logger.error("Ошибка при деактивации пользователя с ID: %s: %s", user_id, e)
             raise
@@ -116,48 +411,195 @@ class UserService:
     async def activate_user(self, user_id: UUID) -> UserResponseDTO | None:
         logger.info("Активация пользователя с ID: %s", user_id)
         try:
-            user = await self.get_user_by_id_or_login(user_id=user_id)
-            if user:
-                updated_user_dto = UserUpdateDTO(
-                    login=user.login,
-                    name=user.name,
-                    email=user.email,
-                    is_active=True,
-                )
-                result = await self.update_user(updated_user_dto)
-                logger.info("Пользователь с ID: %s успешно активирован", user_id)
-                return result
-            return None
+            async with self.uow:
+                result, changed = await self.user_repository.set_active(user_id, is_active=True)
+            if changed:
+                await self._count(active=1)
+            if self.user_cache:
+                await self.user_cache.set(result)
+            logger.info("Пользователь с ID: %s успешно активирован", user_id)
+            return result
         except Exception as e:
             logger.error("Ошибка при активации пользователя с ID: %s: %s", user_id, e)
             raise
 
-    async def get_all_users(self) -> list[UserResponseDTO]:
-        logger.info("Получение всех пользователей")
+    async def set_users_status(self, status_dto: UserBulkStatusDTO) -> UserBulkStatusResultDTO:
+        logger.info(
+            "Массовая смена статуса: is_active=%s, %s ID, фильтр: %s",
+            status_dto.is_active,
+            len(status_dto.ids),
+            status_dto.filter,
+        )
+        if not status_dto.ids and status_dto.filter is None:
+            raise BaseUserHTTPException(message="Должен быть список ID или фильтр.")
+        if status_dto.filter is not None and status_dto.filter.is_empty():
+            raise BaseUserHTTPException(message="Фильтр должен содержать хотя бы одно условие.")
+
+        is_active = status_dto.is_active
+        chunk_size = service_settings.USERS_BULK_STATUS_CHUNK
+        user_ids = list(dict.fromkeys(status_dto.ids))
+        changed: list[tuple[UUID, str]] = []
+        try:
+            # Каждая пачка — своя транзакция: блокировки строк не копятся до конца операции
+            for start in range(0, len(user_ids), chunk_size):
+                async with self.uow:
+                    changed += await self.user_repository.set_active_by_ids(
+                        is_active, user_ids[start : start + chunk_size]
+                    )
+            while status_dto.filter is not None:
+                async with self.uow:
+                    updated = await self.user_repository.set_active_by_filter(
+                        is_active, status_dto.filter, limit=chunk_size
+                    )
+                changed += updated
+                if len(updated) < chunk_size:
+                    break
+        except Exception as e:
+            logger.error("Ошибка при массовой смене статуса: %s", e)
+            raise
+
+        if self.user_cache:
+            await self.user_cache.invalidate_many(changed)
+        await self._count(active=len(changed) if status_dto.is_active else -len(changed))
+        logger.info("Статус изменен у %s пользователей", len(changed))
+        return UserBulkStatusResultDTO(updated=len(changed))
+
+    async def get_all_users(self, limit: int, cursor: Optional[str] = None) -> UserPageDTO:
+        logger.info("Получение страницы пользователей, limit: %s", limit)
         try:
-            result = await self.user_repository.get_all_users()
-            response_dtos = [UserResponseDTO.model_validate(user) for user in result]
-            logger.info("Все пользователи получены: %s", [user.login for user in response_dtos])
-            return response_dtos
+            async with self.uow:
+                result = await self.user_repository.get_users_page(limit=limit, cursor=cursor)
+            logger.info("Получено пользователей: %s", len(result.items))
+            return result
         except Exception as e:
             logger.error("Ошибка при получении всех пользователей: %s", e)
             raise
 
+    async def get_page_versions(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> tuple[list[tuple[UUID, datetime]], bool]:
+        async with self.uow:
+            return await self.user_repository.get_page_versions(limit=limit, cursor=cursor)
+
+    async def search_users(self, query: str, limit: int, offset: int = 0) -> UserSearchResultDTO:
+        logger.info("Поиск пользователей, limit: %s, offset: %s", limit, offset)
+        # Длину проверяет и маршрут, но до обрезки пробелов
+        query = query.strip()
+        if len(query) < service_settings.USERS_SEARCH_MIN_LENGTH:
+            raise BaseUserHTTPException(
+                message=(
+                    "Строка поиска без пробелов по краям должна быть не короче "
+                    f"{service_settings.USERS_SEARCH_MIN_LENGTH} символов."
+                )
+            )
+        try:
+            async with self.uow:
+                result = await self.user_repository.search(query, limit=limit, offset=offset)
+            logger.info("Найдено пользователей: %s", len(result.items))
+            return result
+        except Exception as e:
+            logger.error("Ошибка при поиске пользователей: %s", e)
+            raise
+
+    async def get_changes(self, since: int, limit: int) -> UserChangesDTO:
+        logger.info("Получение изменений пользователей после события %s", since)
+        try:
+            async with self.uow:
+                items = await self.user_repository.get_changes(since, limit=limit)
+            logger.info("Получено изменений: %s", len(items))
+            next_since = items[-1].seq if items and items[-1].seq is not None else since
+            return UserChangesDTO(items=items, next_since=next_since)
+        except Exception as e:
+            logger.error("Ошибка при получении изменений пользователей: %s", e)
+            raise
+
+    async def get_stats(self) -> UserStatsDTO:
+        logger.info("Получение счетчиков пользователей")
+        if self.user_stats:
+            stats = await self.user_stats.read()
+            if stats is not None:
+                return stats
+            logger.info("Счетчиков пользователей нет, пересчет по БД")
+            return await self.reconcile_stats()
+
+        async with self.uow:
+            total, active, signups = await self.user_repository.count_stats(_today_start())
+        return UserStatsDTO(total=total, active=active, signups_today=signups)
+
+    async def reconcile_stats(self) -> UserStatsDTO:
+        """Сверка инкрементальных счетчиков с COUNT(*) по таблице."""
+        today = date.today()
+        async with self.uow:
+            total, active, signups = await self.user_repository.count_stats(_today_start())
+        if self.user_stats:
+            await self.user_stats.reset(total, active, signups, today=today)
+        logger.info("Счетчики пользователей сверены: всего %s, активных %s", total, active)
+        return UserStatsDTO(
+            total=total, active=active, signups_today=signups, reconciled_at=datetime.now()
+        )
+
+    async def _count(self, total: int = 0, active: int = 0, signups: int = 0) -> None:
+        if self.user_stats:
+            await self.user_stats.add(total=total, active=active, signups=signups)
+
+    async def _is_active(
+        self, user_id: Optional[UUID] = None, user_login: Optional[str] = None
+    ) -> Optional[bool]:
+        user = await self.user_repository.find_user_by_id_or_login(
+            user_id=user_id, user_login=user_login
+        )
+        return user.is_active if user else None
+
+    async def _count_status_change(
+        self, was_active: Optional[bool], result: UserResponseDTO
+    ) -> None:
+        if was_active is not None and was_active != result.is_active:
+            await self._count(active=1 if result.is_active else -1)
+
+    def stream_all_users(self) -> AsyncIterator[UserResponseDTO]:
+        logger.info("Потоковая выгрузка всех пользователей")
+        return self.user_repository.stream_users(
+            batch_size=service_settings.USERS_STREAM_BATCH_SIZE
+        )
+
+    def export_users(self, export_format: UserExportFormat) -> AsyncIterator[bytes]:
+        logger.info("Экспорт всех пользователей в формате %s", export_format)
+        return self.user_repository.export_users(
+            export_format, batch_size=service_settings.USERS_EXPORT_BATCH_SIZE
+        )
+
     async def log_in(self, form_data: LoginOAuth2PasswordRequestForm) -> Optional[UserResponseDTO]:
         logger.info("Попытка войти в аккаунт")
         try:
-            user = await self.user_repository.log_in(form_data)
-            logger.info("Вход в аккаунт успешен")
-            if user:
-                return user
-            else:
-                return None
+            async with self.uow:
+                user, password_hash = await self.user_repository.find_user_credentials(
+                    form_data.login
+                )
         except UserNotFoundHTTPException as e:
             logger.error("Пользователь не найден: %s", e)
             raise
 
+        if not await self.hasher.verify(form_data.password, password_hash):
+            logger.error("Неверный пароль для пользователя %s", form_data.login)
+            raise InvalidCredentialsHTTPException(message="Incorrect login or password")
+
+        if self.hasher.needs_rehash(password_hash):
+            logger.info("Перехеширование пароля пользователя %s", user.login)
+            password_hash = await self.hasher.hash(form_data.password)
+            async with self.uow:
+                await self.user_repository.update_password_hash(user.id, password_hash)
+
+        logger.info("Вход в аккаунт успешен")
+        return user
+
+
+def _today_start() -> datetime:
+    return datetime.combine(date.today(), time.min)
+
 
 async def get_user_service(
-    user_repository: UserRepository = Depends(get_user_repository),
+    uow: UnitOfWork = Depends(get_unit_of_work),
+    user_cache: Optional[UserCache] = Depends(get_user_cache),
+    user_stats: Optional[UserStats] = Depends(get_user_stats),
 ) -> UserService:
-    return UserService(user_repository)
+    return UserService(uow, user_cache, user_stats=user_stats)